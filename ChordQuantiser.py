@@ -0,0 +1,115 @@
+import itertools
+import numpy as np
+from .QuantisationGrid import _nearest_indices
+
+
+def _grid_points(pitchGrid):
+    """The points of any pitch grid as a sorted float64 MIDI array."""
+    if hasattr(pitchGrid, "midis"):        # ExactPitchGrid
+        return np.asarray(pitchGrid.midis, dtype=np.float64)
+    if hasattr(pitchGrid, "array"):        # ArrayGrid, ModularPitchGrid, ...
+        return np.asarray(pitchGrid.array, dtype=np.float64)
+    return np.asarray(pitchGrid.sorted(), dtype=np.float64)
+
+
+def flatten_chords(chords):
+    """
+    Ragged list of chords → (values, offsets): all notes in one float64
+    array, chord i being values[offsets[i]:offsets[i + 1]].
+    """
+    chords = [[c] if np.ndim(c) == 0 else c for c in chords]
+    lengths = np.fromiter((len(c) for c in chords), dtype=np.int64, count=len(chords))
+    values = np.fromiter(itertools.chain.from_iterable(chords), dtype=np.float64,
+                         count=int(lengths.sum()))
+    return values, np.concatenate(([0], np.cumsum(lengths)))
+
+
+def split_chords(values, offsets):
+    """(values, offsets) → list of one array per chord."""
+    return np.split(values, offsets[1:-1])
+
+
+class ChordQuantiser:
+    def __init__(self, pitchGrid, instrument=None, sounding: bool = True):
+        """
+        Quantise whole batches of chords to a pitch grid under the rules
+        of an Instrument, in array form.
+
+        The playable points are computed once: the grid points inside
+        the instrument's range (sounding or written), whole semitones
+        only if the instrument has no microtones, minus its missing
+        notes. Each note is then
+          1. moved by octaves into the range if it lies outside
+             (Instrument.force_in_range_many),
+          2. snapped to the nearest playable point (ties → lower),
+        and every chord is sorted with duplicate notes collapsed. An
+        instrument without chordsPossible keeps the top note only.
+
+        Build a new ChordQuantiser when the grid or instrument changes.
+        """
+        self.pitchGrid = pitchGrid
+        self.instrument = instrument
+        self.sounding = sounding
+
+        points = _grid_points(pitchGrid)
+        if instrument is None:
+            self.low = points[0] if len(points) else -np.inf
+            self.high = points[-1] if len(points) else np.inf
+            self.monophonic = False
+        else:
+            self.low, self.high = instrument._get_range(sounding=sounding)
+            self.monophonic = not instrument.chordsPossible
+            points = points[(points >= self.low) & (points <= self.high)]
+            tempered = instrument._undetuned(points, sounding)
+            keep = np.ones(len(points), dtype=bool)
+            if not instrument.microTones:
+                keep &= tempered == np.round(tempered)
+            if instrument.missing_notes_sounding:
+                missing = np.fromiter(instrument.missing_notes_sounding, dtype=np.float64)
+                keep &= ~np.isin(np.round(tempered), missing)
+            points = points[keep]
+        if not len(points):
+            raise ValueError("ChordQuantiser: no playable points on the pitch grid.")
+        self.points = points
+
+    # ------------------------------------------------------------------
+    # quantisation
+    # ------------------------------------------------------------------
+    def quantise_flat(self, values, offsets):
+        """
+        Quantise chords given as (values, offsets), see flatten_chords.
+        Returns a new (values, offsets) pair.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        n = len(offsets) - 1
+        if not len(values):
+            return values, np.zeros(n + 1, dtype=np.int64)
+        chord_ids = np.repeat(np.arange(n), np.diff(offsets))
+
+        # 1. octave transposition into range (microtones and missing
+        #    notes are left to the playable points)
+        if self.instrument is not None:
+            values = self.instrument.force_in_range_many(
+                values, sounding=self.sounding,
+                allow_microtones=True, allow_missing_notes=True)
+
+        # 2. nearest playable point
+        values = self.points[_nearest_indices(self.points, values)]
+
+        # 3. sort within chords, collapse duplicates (or keep top note)
+        order = np.lexsort((values, chord_ids))
+        values = values[order]
+        chord_ids = chord_ids[order]
+        if self.monophonic:
+            keep = np.append(chord_ids[1:] != chord_ids[:-1], True)
+        else:
+            keep = np.ones(len(values), dtype=bool)
+            keep[1:] = (chord_ids[1:] != chord_ids[:-1]) | (values[1:] != values[:-1])
+        values = values[keep]
+        counts = np.bincount(chord_ids[keep], minlength=n)
+        return values, np.concatenate(([0], np.cumsum(counts)))
+
+    def quantise_chords(self, chords):
+        """Quantise a ragged list of chords; returns one array per chord."""
+        return split_chords(*self.quantise_flat(*flatten_chords(chords)))
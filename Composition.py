@@ -3,8 +3,10 @@
 import math
 import numpy as np
 from .DynamicGrid import DynamicGrid
-from .TimeGrid import TimeGrid
-from .PitchGrid import PitchGrid
+from .TimeGrid import TimeGrid, LazyTimeGrid
+from .RhythmQuantiser import RhythmQuantiser
+from .ChordQuantiser import ChordQuantiser
+from .Tuning import Tuning
 from musicscore.chord import Chord
 from .Instrument import Instrument
 from .Player import Player
@@ -19,7 +21,8 @@ class Composition:
         refFreq=443.0, refMidi=69, stepsPerOctave=12, midiMin=0, midiMax=130,
         dynamicStepdB=-3, headroomdB=-1, possibleDynamicsString=None,
 
-        playerList = None
+        playerList = None,
+        polytempo = False
     ):
         if playerList is None:
             print("Warning: No Players in List!")
@@ -58,51 +61,175 @@ class Composition:
         )
 
         self.timeGrid = TimeGrid(
-            self.durationSec,
-            self.bpm,
-            self.possibleBeatSubdivision
+            durationSec=self.durationSec,
+            bpm=self.bpm,
+            possibleSubdivision=self.possibleBeatSubdivision
         )
+        # integer ticks per beat shared by grid and events
+        self.ppq = self.timeGrid.ppq
 
-        self.pitchGrid = PitchGrid(
-            stepsPerOctave=self.stepsPerOctave,
+        # chooses one subdivision per beat when quantising event lists
+        self.rhythmQuantiser = RhythmQuantiser(self.possibleBeatSubdivision)
+
+        # frequency ↔ MIDI at refFreq/refMidi; the pitch grid holds the
+        # stepsPerOctave equal steps between midiMin and midiMax
+        self.tuning = Tuning(
             refFreq=self.refFreq,
             refMidi=self.refMidi,
-            midiMin=self.midiMin,
-            midiMax=self.midiMax
+            stepsPerOctave=self.stepsPerOctave
         )
+        self.pitchGrid = self.tuning.pitch_grid(self.midiMin, self.midiMax)
 
         self.totalEventList = []
 
-    def quantizeEventToBeats(self, ev=None):
+        # polytemporal mode: every player is quantised on its own clock
+        # (Player.timeGrid / tempoMap / bpm), all clocks share the master
+        # seconds axis. Player grids are cached per player index.
+        self.polytempo = polytempo
+        self._playerClocks = {}
+        # rhythm quantisers for player clocks with other subdivisions
+        self._rhythmQuantisers = {}
+
+    def playerTimeGrid(self, playerIndex=0):
+        """
+        Return the TimeGrid of a player's own clock.
+
+        That is the player's timeGrid if set, otherwise a LazyTimeGrid
+        over the composition's duration and subdivisions at the player's
+        tempoMap / bpm. The grid is built once and reused until the
+        player's tempo settings or the composition's durationSec /
+        possibleBeatSubdivision change.
+        """
+        player = self.playerList[playerIndex]
+        if player.timeGrid is not None:
+            return player.timeGrid
+        if player.tempoMap is None and player.bpm == self.bpm:
+            return self.timeGrid
+
+        # the tempo map is compared by identity (Player normalises it to
+        # an immutable TempoMap), the rest by value
+        key = (player.bpm, self.durationSec, tuple(self.possibleBeatSubdivision))
+        cached = self._playerClocks.get(playerIndex)
+        if cached is None or cached[0] != key or cached[1] is not player.tempoMap:
+            grid = LazyTimeGrid(
+                durationSec=self.durationSec,
+                bpm=player.bpm,
+                possibleSubdivision=self.possibleBeatSubdivision,
+                tempoMap=player.tempoMap
+            )
+            cached = (key, player.tempoMap, grid)
+            self._playerClocks[playerIndex] = cached
+        return cached[2]
+
+    def playerRhythmQuantiser(self, playerIndex=0):
+        """
+        Return the RhythmQuantiser for a player's clock: self.rhythmQuantiser
+        if the player's TimeGrid uses the composition's subdivisions,
+        otherwise one for the grid's own subdivisions (built once per
+        set of subdivisions).
+        """
+        subdivisions = sorted({int(s) for s in self.playerTimeGrid(playerIndex).possibleSubdivision})
+        if subdivisions == self.rhythmQuantiser.possibleSubdivision:
+            return self.rhythmQuantiser
+        key = tuple(subdivisions)
+        if key not in self._rhythmQuantisers:
+            self._rhythmQuantisers[key] = RhythmQuantiser(subdivisions)
+        return self._rhythmQuantisers[key]
+
+    def playerBeatsToMasterSecs(self, beats, playerIndex=0):
+        """Vectorized: beats on a player's clock → master seconds."""
+        return self.playerTimeGrid(playerIndex).beats_to_secs(beats)
+
+    def masterSecsToPlayerBeats(self, secs, playerIndex=0):
+        """Vectorized: master seconds → beats on a player's clock."""
+        return self.playerTimeGrid(playerIndex).secs_to_beats(secs)
+
+    def playerBeatsToMasterBeats(self, beats, playerIndex=0):
+        """Vectorized: beats on a player's clock → beats of self.timeGrid."""
+        return self.timeGrid.secs_to_beats(
+            self.playerBeatsToMasterSecs(beats, playerIndex))
+
+    def convertPlayerBeats(self, beats, fromPlayerIndex, toPlayerIndex):
+        """Vectorized: beats on one player's clock → beats on another's."""
+        return self.masterSecsToPlayerBeats(
+            self.playerBeatsToMasterSecs(beats, fromPlayerIndex), toPlayerIndex)
+
+    def quantizeFreqs(self, freqs):
+        """
+        Vectorized: frequencies (Hz) → (midis, freqs, errors) quantised to
+        self.pitchGrid, see Tuning.quantise_freqs.
+        """
+        return self.tuning.quantise_freqs(freqs, self.pitchGrid)
+
+    def quantizeEventPitches(self, playerIndex=0):
+        """
+        Quantise the chords of all non-rest events of a player to
+        self.pitchGrid under the player's instrument rules, in one
+        ChordQuantiser call.
+        """
+        player = self.playerList[playerIndex]
+        events = [ev for ev in player.eventList
+                  if [m.value for m in ev.chord.midis] != [0]]
+        if not events:
+            return
+        quantiser = ChordQuantiser(self.pitchGrid, player.instrument)
+        chords = quantiser.quantise_chords(
+            [[m.value for m in ev.chord.midis] for ev in events])
+        for ev, chord in zip(events, chords):
+            ev.chord.midis = chord.tolist()
+
+    def quantizeEventToBeats(self, ev=None, timeGrid=None):
         if ev is None:
             print("No event")
             return
 
-        beatDur = self.timeGrid.beatDurationSec
-        startBeatRaw = ev.startTimeSec / beatDur
-        endBeatRaw   = (ev.startTimeSec + ev.durationSec) / beatDur
-        qStart = self.timeGrid.quantizeBeat(startBeatRaw)
-        qEnd   = self.timeGrid.quantizeBeat(endBeatRaw)
+        tg = self.timeGrid if timeGrid is None else timeGrid
+        startBeatRaw = tg.sec_to_beat(ev.startTimeSec)
+        endBeatRaw   = tg.sec_to_beat(ev.startTimeSec + ev.durationSec)
+        qStart = tg.beat_to_tick(tg.quantize_beat(startBeatRaw))
+        qEnd   = tg.beat_to_tick(tg.quantize_beat(endBeatRaw))
 
-        durBeats = max(qEnd - qStart, 0.0)
-
-        ev.startTimeBeats = qStart
-        ev.endTimeBeats   = qEnd
-        ev.quarterDurationFloat = durBeats 
-
-        ev.startTimeSec = qStart * beatDur
-        ev.durationSec  = durBeats * beatDur
-        ev.endTimeSec   = ev.startTimeSec + ev.durationSec
+        # start/duration become exact ticks; beats and seconds derive from them
+        ev.bpm = tg.bpm
+        ev.setTicks(qStart, max(qEnd - qStart, 0), tg.ppq, tempoMap=tg.tempoMap)
 
         if [m.value for m in ev.chord.midis] != [0]:
-            ev.chord.quarter_duration = durBeats
+            ev.chord.quarter_duration = ev.quarterDurationFloat
             
     def quantizeEventListToBeats(self,playerIndex = 0):
+        """
+        Quantise all events of a player in one pass: start and end points
+        go through self.rhythmQuantiser, so every beat uses a single
+        subdivision, and are clamped to the end of the time grid.
+        """
         player = self.playerList[playerIndex]
         player.sortEventsByTime()
         evList = player.eventList
-        for ev in evList:
-            self.quantizeEventToBeats(ev)
+        if not evList:
+            return
+        if self.polytempo:
+            tg = self.playerTimeGrid(playerIndex)
+            rq = self.playerRhythmQuantiser(playerIndex)
+        else:
+            tg = self.timeGrid
+            rq = self.rhythmQuantiser
+
+        startsSec = np.array([ev.startTimeSec for ev in evList])
+        durationsSec = np.array([ev.durationSec for ev in evList])
+        startBeatsRaw = tg.secs_to_beats(startsSec)
+        endBeatsRaw = tg.secs_to_beats(startsSec + durationsSec)
+
+        ticks, _ = rq.quantise_ticks(np.concatenate([startBeatsRaw, endBeatsRaw]))
+        lastTick = round(tg.quantize_beat(tg.durationBeats) * rq.ppq)
+        ticks = np.clip(ticks, 0, lastTick)
+        startTicks = ticks[:len(evList)]
+        durTicks = np.maximum(ticks[len(evList):] - startTicks, 0)
+
+        for ev, start, dur in zip(evList, startTicks.tolist(), durTicks.tolist()):
+            ev.bpm = tg.bpm
+            ev.setTicks(start, dur, rq.ppq, tempoMap=tg.tempoMap)
+            if [m.value for m in ev.chord.midis] != [0]:
+                ev.chord.quarter_duration = ev.quarterDurationFloat
 
     def removeEmptyEvents(self, playerIndex=0):
         player = self.playerList[playerIndex]
@@ -133,7 +260,10 @@ class Composition:
         kept = []
 
         for ev in evList:
-            startTimeMs = int(ev.startTimeSec * 1000)
+            # nearest millisecond; a quantised event's startTimeSec is
+            # derived from its ticks through the clock it was quantised on,
+            # so quantised and unquantised events share one key space
+            startTimeMs = round(ev.startTimeSec * 1000)
             if startTimeMs in startTimes:
                 # drop this one
                 continue
@@ -152,6 +282,8 @@ class Composition:
     def consolidateDurations(self, playerIndex=0, allowPolyphony=False):
         """cut notes to length or add a pause"""
         player = self.playerList[playerIndex]
+        # beats are counted on the player's own clock in polytempo mode
+        clock = self.playerTimeGrid(playerIndex) if self.polytempo else self.timeGrid
         self.consolidateMinNoteDurationByPlayer(playerIndex)
         eventList = player.eventList
         if len(eventList) == 0:
@@ -159,30 +291,53 @@ class Composition:
         if allowPolyphony:
             raise ValueError("consolidateDurations: Possibility of Overlapping not yet implemented!")
         player.updateTimesSec()
-        for sT, eT, ev in zip(
+        for sT, eT, ev, nextEv in zip(
             player.startTimesSec[1:],
             player.endTimesSec[:-1],
-            player.eventList
+            player.eventList,
+            player.eventList[1:]
         ):
             if ev.durationSec < player.minNoteDurationSec:
                 player.eventList.remove(ev)
                 return
             else:
                 differenceSec = sT - eT
+                # quantised neighbours: cut or fill on exact ticks, so the
+                # float fields stay derived from them
+                onTicks = (ev.startTicks is not None
+                           and nextEv.startTicks is not None
+                           and ev.ppq == nextEv.ppq)
                 if differenceSec <= player.minRestDurationSec:
                     # cut the event to match the gap
-                    ev.durationSec += differenceSec
-                    ev.endTimeSec = eT + ev.durationSec
-                    ev.quarterDurationFloat = round(ev.durationSec * self.bpm / 60, 3)
-                    ev.endTimeBeats = round(ev.endTimeSec * self.bpm / 60, 3)
+                    if onTicks:
+                        ev.setTicks(ev.startTicks,
+                                    nextEv.startTicks - ev.startTicks,
+                                    ev.ppq, tempoMap=ev.tempoMap)
+                    else:
+                        ev.durationSec += differenceSec
+                        ev.endTimeSec = ev.startTimeSec + ev.durationSec
+                        ev.quarterDurationFloat = round(
+                            clock.sec_to_beat(ev.endTimeSec) - clock.sec_to_beat(ev.startTimeSec), 3)
+                        ev.endTimeBeats = round(clock.sec_to_beat(ev.endTimeSec), 3)
                     # only update quarter_duration for NON-rests
                     if [m.value for m in ev.chord.midis] != [0]:
                         ev.chord.quarter_duration = ev.quarterDurationFloat
                 else:
                     # add a rest
-                    player.eventList.append(
-                        Event(eT, differenceSec, -100, 0, bpm=self.bpm)
-                    )
+                    rest = Event(eT, differenceSec, -100, 0, bpm=clock.bpm)
+                    if onTicks:
+                        rest.bpm = ev.bpm
+                        rest.setTicks(ev.endTicks,
+                                      nextEv.startTicks - ev.endTicks,
+                                      ev.ppq, tempoMap=ev.tempoMap)
+                        rest.chord.quarter_duration = rest.quarterDurationFloat
+                    elif clock.tempoMap is not None:
+                        rest.startTimeBeats = round(clock.sec_to_beat(eT), 5)
+                        rest.endTimeBeats = round(clock.sec_to_beat(sT), 5)
+                        rest.quarterDurationFloat = round(
+                            clock.sec_to_beat(sT) - clock.sec_to_beat(eT), 5)
+                        rest.chord.quarter_duration = rest.quarterDurationFloat
+                    player.eventList.append(rest)
 
         player.updateTimesSec()
 
@@ -7,7 +7,8 @@ class Event:
         durationSec: float = 1.0,
         dynamicdB: float = 0.0,
         pitchesMidi=60,
-        bpm=120
+        bpm=120,
+        ppq=None
     ):
         self.startTimeSec = startTimeSec
         self.durationSec = durationSec
@@ -20,10 +21,54 @@ class Event:
         self.quarterDurationFloat = round(durationSec * bpm / 60, 5)
         self.endTimeBeats = round(self.endTimeSec * bpm / 60, 5)
 
+        # exact integer time (ticks per beat = ppq, see TimeGrid.ppq);
+        # None until the event is placed on a tick grid
+        self.ppq = None
+        self.startTicks = None
+        self.durationTicks = None
+        self.tempoMap = None
+        if ppq is not None:
+            self.setTicks(round(startTimeSec * bpm / 60 * ppq),
+                          round(durationSec * bpm / 60 * ppq), ppq)
+
         # the actual musicscore chord
         self.chord = Chord(midis=pitchesMidi,
                            quarter_duration=self.quarterDurationFloat)
 
+    @property
+    def endTicks(self):
+        if self.startTicks is None:
+            return None
+        return self.startTicks + self.durationTicks
+
+    def setTicks(self, startTicks: int, durationTicks: int, ppq: int,
+                 tempoMap=None):
+        """
+        Place the event at exact integer ticks and derive the float
+        beat and second fields from them (through tempoMap if given,
+        else at the event's bpm). The tempo map is kept so that later
+        tick changes derive the seconds on the same clock.
+        """
+        self.ppq = int(ppq)
+        self.tempoMap = tempoMap
+        self.startTicks = int(startTicks)
+        self.durationTicks = int(durationTicks)
+
+        self.startTimeBeats = self.startTicks / self.ppq
+        self.quarterDurationFloat = self.durationTicks / self.ppq
+        self.endTimeBeats = self.endTicks / self.ppq
+
+        if tempoMap is not None:
+            self.startTimeSec = tempoMap.beat_to_sec(self.startTimeBeats)
+            self.endTimeSec = tempoMap.beat_to_sec(self.endTimeBeats)
+            self.durationSec = self.endTimeSec - self.startTimeSec
+            return
+
+        beatDur = 60 / self.bpm
+        self.startTimeSec = self.startTimeBeats * beatDur
+        self.durationSec = self.quarterDurationFloat * beatDur
+        self.endTimeSec = self.endTimeBeats * beatDur
+
     def add_tie(self, tie_type: str):
         self.chord.add_tie(tie_type)
 
@@ -10,7 +10,42 @@ sem@16161d.net
 last updated: 08.12.2025
 """
 
+import math
+
+import numpy as np
+
+# attributes that determine the playability table
+_PLAYABILITY_ATTRIBUTES = frozenset((
+    "rangeMidi", "microTones", "transposition_semitones", "tuningOffset",
+    "missing_notes_written", "missing_notes_sounding", "pitchResolution",
+    "lowest_sounding_midi", "highest_sounding_midi"))
+
+# list attributes that variants copy instead of sharing
+_CLEF_ATTRIBUTES = frozenset(("possibleClefs", "initClefs"))
+
+# attributes the derived pitch fields (written / sounding range,
+# sounding missing notes) are computed from, see Instrument._derive()
+_PITCH_ATTRIBUTES = frozenset(
+    ("rangeMidi", "transposition_semitones", "tuningOffset", "missing_notes_written"))
+
+# Instrument constructor parameters accepted by Instrument.variant()
+_VARIANT_PARAMETERS = frozenset((
+    "name", "rangeMidi", "numSystems", "initClefs", "possibleClefs",
+    "chordsPossible", "microTones", "writtenDynamicRange", "physicalDynamicRangedB",
+    "transposition_semitones", "missing_notes", "midi_program", "pitchResolution"))
+
 class Instrument:
+    __slots__ = (
+        "name", "numSystems", "possibleClefs", "initClefs",
+        "rangeMidi", "chordsPossible", "microTones", "transposition_semitones", "tuningOffset",
+        "lowest_written_midi", "highest_written_midi",
+        "lowest_sounding_midi", "highest_sounding_midi",
+        "missing_notes_written", "missing_notes_sounding",
+        "writtenDynamicRange", "actualDynamicRange",
+        "midi_program", "pitchResolution",
+        # playability table, variant base / overrides, user attributes
+        "_playable", "_base", "_overrides", "extras",
+    )
 ####################################################################################################
     def __init__(
         self,
@@ -27,7 +62,14 @@ class Instrument:
         transposition_semitones: float = 0.0,
         missing_notes: set[float] | None = None,
         midi_program: int = 1,
+        pitchResolution: int = 4,
+        tuningCents: float = 0.0,
     ):
+        self._playable = None
+        self._base = None
+        self._overrides = None
+        # any other attribute set on the instrument is kept here
+        self.extras = None
         self.name = name
         self.numSystems = numSystems
 
@@ -43,10 +85,10 @@ class Instrument:
         # allow for different tunings of instruments
         # (e.g. historical pitch or "B instrument but tuned down X cents")
         self.transposition_semitones = float(transposition_semitones)
-
-        self.lowest_written_midi, self.highest_written_midi = self.rangeMidi
-        self.lowest_sounding_midi = self.lowest_written_midi + self.transposition_semitones
-        self.highest_sounding_midi = self.highest_written_midi + self.transposition_semitones
+        # detune in semitones on top of the transposition: sounding
+        # pitches are shifted by it, but notes keep their tempered
+        # identity (missing notes, microtones), see _undetuned()
+        self.tuningOffset = float(tuningCents) / 100.0
 
         # missing notes (stored as *sounding* MIDI)
         # --------------------------------------------------------------------
@@ -56,14 +98,11 @@ class Instrument:
         else:
             missing_notes = set(missing_notes)
 
-        # these are the *written* midi notes as given by the user
+        # these are the *written* midi notes as given by the user; setting
+        # them (the last pitch attribute) derives the written / sounding
+        # range and the sounding missing notes, see _derive()
         self.missing_notes_written = {int(m) for m in missing_notes}
 
-        # convert to sounding midi by applying transposition
-        self.missing_notes_sounding = {
-            m + self.transposition_semitones for m in self.missing_notes_written
-        }
-
         # --- dynamic behaviour ----------------------------------------------
         self.writtenDynamicRange = tuple(writtenDynamicRange)
         # physicalDynamicRangedB: (min_dB, max_dB)
@@ -71,6 +110,214 @@ class Instrument:
 
         self.midi_program = int(midi_program)
 
+        # steps per semitone of the playability table (2 = quarter tones,
+        # 4 = eighth tones, ...), see is_playable()
+        self.pitchResolution = int(pitchResolution)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_") or name == "extras":
+            object.__setattr__(self, name, value)
+            return
+        if name not in _PUBLIC_SLOTS:
+            if getattr(self, "extras", None) is None:
+                object.__setattr__(self, "extras", {})
+            self.extras[name] = value
+            return
+        # any parameter change invalidates the playability table
+        object.__setattr__(self, "_playable", None)
+        overrides = getattr(self, "_overrides", None)
+        if overrides is not None:
+            overrides[name] = value     # a variant never writes to its base
+        else:
+            object.__setattr__(self, name, value)
+        # pitch attributes update the fields derived from them (once all
+        # of them exist, i.e. not halfway through __init__)
+        if name in _PITCH_ATTRIBUTES and all(hasattr(self, a) for a in _PITCH_ATTRIBUTES):
+            self._derive()
+
+    def _derive(self):
+        """
+        Recompute the written / sounding range and the sounding missing
+        notes from rangeMidi, transposition_semitones, tuningOffset and
+        missing_notes_written. Fields whose value (and type) does not
+        change are left alone, so shared objects stay shared.
+        """
+        low, high = self.rangeMidi
+        shift = self.transposition_semitones + self.tuningOffset
+        written = self.missing_notes_written
+        sounding = {m + self.transposition_semitones for m in written}
+        if isinstance(written, frozenset):
+            sounding = frozenset(sounding)
+        derived = {
+            "lowest_written_midi": low,
+            "highest_written_midi": high,
+            "lowest_sounding_midi": low + shift,
+            "highest_sounding_midi": high + shift,
+            "missing_notes_sounding": sounding,
+        }
+        for name, value in derived.items():
+            current = getattr(self, name, None)
+            if current != value or type(current) is not type(value):
+                setattr(self, name, value)
+
+    # ----------------------------------------------------------------------
+    # copy-on-write variants
+    #   a variant keeps its base instrument and a dict of the attributes
+    #   it overrides; its own slots stay empty and every other attribute
+    #   is read from the base (see __getattr__)
+    # ----------------------------------------------------------------------
+    def __getattr__(self, name):
+        # only reached for empty slots and unknown names
+        if name.startswith("_") or name == "extras":
+            raise AttributeError(name)
+        extras = self.extras
+        if extras and name in extras:
+            return extras[name]
+        overrides = self._overrides
+        if overrides is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}")
+        if name in overrides:
+            return overrides[name]
+        value = getattr(self._base, name)
+        if name in _CLEF_ATTRIBUTES:
+            # clefs are lists edited in place: copy them on first use
+            value = overrides[name] = list(value)
+        return value
+
+    def variant(self, *, tuningCents: float = 0.0, **overrides) -> "Instrument":
+        """
+        A new Instrument sharing this one's data, with some constructor
+        parameters overridden, e.g.
+
+            get_standard_instrument("b-flat-clarinet").variant(
+                missing_notes={53}, tuningCents=-15)
+
+        tuningCents detunes the variant further (see tuningOffset): its
+        sounding range moves, its missing notes stay the same notes.
+        The variant stores only the overridden values (and the sounding
+        pitches derived from them) and reads everything else, including
+        the playability table when possible, from this instrument (or
+        from its base, if this is a variant itself). Shared values are
+        the same objects, so replace them by assignment instead of
+        mutating them, and change a base only before deriving variants
+        from it. Clefs are copied when a variant first reads them, so
+        each variant can edit its own.
+        """
+        unknown = overrides.keys() - _VARIANT_PARAMETERS
+        if unknown:
+            raise TypeError(f"variant: unknown parameters {sorted(unknown)}")
+        new = object.__new__(type(self))
+        if self._overrides is None:
+            base, own, extras = self, {}, None
+        else:   # variant of a variant: same base, copied overrides
+            base = self._base
+            own = {name: list(value) if name in _CLEF_ATTRIBUTES else value
+                   for name, value in self._overrides.items()}
+            extras = dict(self.extras) if self.extras else None
+        for name, value in (("_playable", None), ("_base", base),
+                            ("_overrides", own), ("extras", extras)):
+            object.__setattr__(new, name, value)
+
+        if "name" in overrides:
+            new.name = overrides["name"]
+        if "numSystems" in overrides:
+            new.numSystems = overrides["numSystems"]
+        if "chordsPossible" in overrides:
+            new.chordsPossible = overrides["chordsPossible"]
+        if "microTones" in overrides:
+            new.microTones = overrides["microTones"]
+        if "midi_program" in overrides:
+            new.midi_program = int(overrides["midi_program"])
+        if "pitchResolution" in overrides:
+            new.pitchResolution = int(overrides["pitchResolution"])
+        if "writtenDynamicRange" in overrides:
+            new.writtenDynamicRange = tuple(overrides["writtenDynamicRange"])
+        if "physicalDynamicRangedB" in overrides:
+            new.actualDynamicRange = tuple(float(x) for x in overrides["physicalDynamicRangedB"])
+        if "possibleClefs" in overrides:
+            new.possibleClefs = list(overrides["possibleClefs"] or ['treble', 'bass'])
+        if "initClefs" in overrides:
+            new.initClefs = list(overrides["initClefs"] or ['treble'])
+
+        # the derived sounding pitches follow (see __setattr__)
+        if "rangeMidi" in overrides:
+            new.rangeMidi = tuple(overrides["rangeMidi"])
+        if "transposition_semitones" in overrides:
+            new.transposition_semitones = float(overrides["transposition_semitones"])
+        if "missing_notes" in overrides:
+            new.missing_notes_written = frozenset(int(m) for m in overrides["missing_notes"] or ())
+        if tuningCents:
+            new.tuningOffset = new.tuningOffset + tuningCents / 100.0
+        return new
+
+    def _undetuned(self, midis, sounding: bool = True):
+        """
+        Sounding pitches minus tuningOffset (rounded to 1e-9 semitones),
+        i.e. on the tempered scale that missing notes and the microtone
+        check refer to. Written pitches are returned unchanged.
+        """
+        if not sounding or not self.tuningOffset:
+            return midis
+        return np.round(midis - self.tuningOffset, 9)
+
+    # ----------------------------------------------------------------------
+    # playability table
+    #   (start, table): table[i] tells whether the undetuned sounding
+    #   pitch (start + i) / pitchResolution is playable; built on first use
+    # ----------------------------------------------------------------------
+    def _playable_table(self):
+        if self._playable is None:
+            if (self._overrides is not None
+                    and not self._overrides.keys() & _PLAYABILITY_ATTRIBUTES):
+                return self._base._playable_table()     # shared with the base
+            res = self.pitchResolution
+            if res <= 0:
+                raise ValueError("pitchResolution must be a positive integer")
+            start = int(np.ceil(self._undetuned(self.lowest_sounding_midi) * res))
+            end = int(np.floor(self._undetuned(self.highest_sounding_midi) * res))
+            steps = np.arange(start, max(end + 1, start))
+            table = np.ones(len(steps), dtype=bool)
+            if not self.microTones:
+                table &= steps % res == 0
+            if self.missing_notes_sounding:
+                missing = np.fromiter(self.missing_notes_sounding, dtype=np.float64)
+                table &= ~np.isin(np.round(steps / res), missing)
+            table.flags.writeable = False     # shared by variants
+            self._playable = (start, table)
+        return self._playable
+
+    def invalidate_playability(self):
+        """Drop the playability table, e.g. after mutating missing_notes_sounding in place."""
+        self._playable = None
+
+    def is_playable(self, midi) -> bool:
+        """
+        Whether a sounding pitch is playable: inside the sounding range,
+        not microtonal unless microTones, not a missing note. The pitch
+        is rounded to 1/pitchResolution semitone and looked up in a
+        table built once per parameter set.
+        """
+        midi = float(midi)
+        # the range is checked exactly, only the lattice lookup rounds
+        if not self.lowest_sounding_midi <= midi <= self.highest_sounding_midi:
+            return False
+        start, table = self._playable_table()
+        i = round(float(self._undetuned(midi)) * self.pitchResolution) - start
+        return 0 <= i < len(table) and bool(table[i])
+
+    def playable_many(self, midis):
+        """Vectorized is_playable: a boolean mask for an array of sounding pitches."""
+        start, table = self._playable_table()
+        midis = np.asarray(midis, dtype=np.float64)
+        inRange = (midis >= self.lowest_sounding_midi) & (midis <= self.highest_sounding_midi)
+        steps = np.rint(self._undetuned(np.where(inRange, midis, 0.0)) * self.pitchResolution)
+        i = steps.astype(np.int64) - start
+        inside = inRange & (i >= 0) & (i < len(table))
+        mask = np.zeros(i.shape, dtype=bool)
+        mask[inside] = table[i[inside]]
+        return mask
+
     # ----------------------------------------------------------------------
     # range logic (MIDI-based)
     # ----------------------------------------------------------------------
@@ -99,7 +346,10 @@ class Instrument:
             raise ValueError("in_range: midi cannot be None")
 
         midi = float(midi)
-        is_micro = not midi.is_integer()
+        if not math.isfinite(midi):
+            raise ValueError(f"in_range: midi must be finite, got {midi!r}")
+        tempered = float(self._undetuned(midi, sounding))
+        is_micro = not tempered.is_integer()
 
         # microtone handling
         if is_micro and not (self.microTones or allow_microtones):
@@ -108,7 +358,7 @@ class Instrument:
         low, high = self._get_range(sounding=sounding)
 
         # missing notes handling (compare against *sounding* midi)
-        midi_rounded = int(round(midi))
+        midi_rounded = int(round(tempered))
         if (not allow_missing_notes) and midi_rounded in self.missing_notes_sounding:
             return False, None
 
@@ -149,9 +399,10 @@ class Instrument:
         too_low = (direction == 0) or (direction is None)
         step = 12.0 if too_low else -12.0
 
-        candidate = midi
-        for _ in range(16):  # safety guard
-            candidate += step
+        # midi + k octaves computed in one step (not by repeated
+        # addition), exactly as force_in_range_many does
+        for k in range(1, 17):  # safety guard
+            candidate = midi + step * k
             ok, _ = self.in_range(
                 candidate,
                 sounding=sounding,
@@ -163,4 +414,98 @@ class Instrument:
 
         # If nothing worked, just clamp to nearest bound.
         low, high = self._get_range(sounding=sounding)
-        return max(low, min(high, candidate))
\ No newline at end of file
+        return max(low, min(high, candidate))
+
+    # ----------------------------------------------------------------------
+    # vectorized range logic
+    # ----------------------------------------------------------------------
+    def in_range_many(
+        self,
+        midis,
+        *,
+        sounding: bool = False,
+        allow_microtones: bool = False,
+        allow_missing_notes: bool = False,
+    ):
+        """
+        Vectorized in_range for an array of MIDI pitches.
+
+        Returns (in_range, direction):
+          - in_range: boolean mask
+          - direction: int8 codes, 0 = too low, 1 = too high,
+            -1 = in range or rejected only because of microtones or
+            missing notes (None in in_range)
+        Like in_range, raises ValueError for nan or infinite pitches.
+        """
+        midis = np.asarray(midis, dtype=np.float64)
+        if not np.isfinite(midis).all():
+            raise ValueError("in_range_many: midis must be finite")
+
+        tempered = self._undetuned(midis, sounding)
+
+        special = np.zeros(midis.shape, dtype=bool)
+        if not (self.microTones or allow_microtones):
+            special |= tempered != np.floor(tempered)
+        if not allow_missing_notes and self.missing_notes_sounding:
+            missing = np.fromiter(self.missing_notes_sounding, dtype=np.float64)
+            special |= np.isin(np.round(tempered), missing)
+
+        low, high = self._get_range(sounding=sounding)
+        too_low = ~special & (midis < low)
+        too_high = ~special & (midis > high)
+
+        direction = np.full(midis.shape, -1, dtype=np.int8)
+        direction[too_low] = 0
+        direction[too_high] = 1
+        return ~(special | too_low | too_high), direction
+
+    def force_in_range_many(
+        self,
+        midis,
+        *,
+        sounding: bool = False,
+        allow_microtones: bool = False,
+        allow_missing_notes: bool = False,
+    ):
+        """
+        Vectorized force_in_range, with the same results.
+
+        The octave shift that first reaches the range is computed in
+        closed form (ceil((low - midi) / 12) octaves up, or down from
+        above); only pitches that land on a missing note take further
+        octave steps. Pitches that cannot be fixed within 16 octaves
+        are clamped to the range, as in force_in_range. Non-finite
+        pitches raise ValueError, as in in_range.
+        """
+        midis = np.asarray(midis, dtype=np.float64)
+        flags = dict(sounding=sounding, allow_microtones=allow_microtones,
+                     allow_missing_notes=allow_missing_notes)
+        ok, direction = self.in_range_many(midis, **flags)
+        low, high = self._get_range(sounding=sounding)
+
+        result = midis.copy()
+        pending = np.flatnonzero(~ok)
+        m = midis[pending]
+        step = np.where(direction[pending] == 1, -12.0, 12.0)
+        k = np.ones(len(pending))
+        k = np.where(direction[pending] == 0, np.ceil((low - m) / 12.0), k)
+        k = np.where(direction[pending] == 1, np.ceil((m - high) / 12.0), k)
+
+        while len(pending):
+            candidate = m + step * k
+            found, _ = self.in_range_many(candidate, **flags)
+            found &= k <= 16
+            result[pending[found]] = candidate[found]
+            # past the range in the step direction (or out of steps):
+            # never reachable any more
+            past = np.where(step > 0, candidate > high, candidate < low)
+            hopeless = ~found & ((k >= 16) | past)
+            result[pending[hopeless]] = np.clip(m[hopeless] + step[hopeless] * 16, low, high)
+            keep = ~(found | hopeless)
+            pending, m, step, k = pending[keep], m[keep], step[keep], k[keep] + 1
+        return result
+
+
+# instrument attributes stored in slots (anything else goes to extras)
+_PUBLIC_SLOTS = frozenset(
+    name for name in Instrument.__slots__ if not name.startswith("_") and name != "extras")
@@ -0,0 +1,184 @@
+import numbers
+import numpy as np
+from .ChordQuantiser import flatten_chords
+
+
+# ---------------------------------------------------------------------------
+# interval tree
+# ---------------------------------------------------------------------------
+
+class _IntervalTree:
+    def __init__(self, lows, highs):
+        """
+        Centered interval tree over closed intervals [lows[i], highs[i]].
+
+        A node is (center, left, right, byLow, byHigh): the intervals
+        containing center, as (low, i) sorted by low and (high, i) sorted
+        by descending high, and the subtrees of the intervals entirely
+        below / above it. stab(x) is O(log n + number of hits).
+        """
+        self._root = self._build(list(zip(lows, highs, range(len(lows)))))
+
+    @classmethod
+    def _build(cls, intervals):
+        if not intervals:
+            return None
+        ends = sorted(e for low, high, _ in intervals for e in (low, high))
+        center = ends[len(ends) // 2]
+        below = [iv for iv in intervals if iv[1] < center]
+        above = [iv for iv in intervals if iv[0] > center]
+        here = [iv for iv in intervals if iv[0] <= center <= iv[1]]
+        return (
+            center, cls._build(below), cls._build(above),
+            sorted((low, i) for low, _, i in here),
+            sorted(((high, i) for _, high, i in here), reverse=True),
+        )
+
+    def stab(self, x):
+        """Indices of all intervals containing x."""
+        hits = []
+        node = self._root
+        while node is not None:
+            center, below, above, byLow, byHigh = node
+            if x < center:
+                for low, i in byLow:
+                    if low > x:
+                        break
+                    hits.append(i)
+                node = below
+            else:
+                for high, i in byHigh:
+                    if high < x:
+                        break
+                    hits.append(i)
+                node = above if x > center else None
+        return hits
+
+
+# ---------------------------------------------------------------------------
+# palette index
+# ---------------------------------------------------------------------------
+
+class InstrumentIndex:
+    def __init__(self, instruments=None):
+        """
+        Query index over an instrument palette: which instruments can
+        play a pitch set or range.
+
+        - instruments: mapping {key: Instrument} (default
+          STANDARD_INSTRUMENTS, all of which get built) or an iterable
+          of Instruments, keyed by their name
+
+        Sounding ranges go into an interval tree; chordsPossible,
+        microTones and numSystems into arrays for the attribute filters.
+        Build a new index when the palette or an instrument changes.
+        """
+        if instruments is None:
+            from .Instruments import STANDARD_INSTRUMENTS
+            instruments = STANDARD_INSTRUMENTS
+        items = (list(instruments.items()) if hasattr(instruments, "items")
+                 else [(ins.name, ins) for ins in instruments])
+        self.keys = [key for key, _ in items]
+        self.instruments = [ins for _, ins in items]
+
+        self.lows = np.array([ins.lowest_sounding_midi for ins in self.instruments], dtype=np.float64)
+        self.highs = np.array([ins.highest_sounding_midi for ins in self.instruments], dtype=np.float64)
+        self.chordsPossible = np.array([ins.chordsPossible for ins in self.instruments], dtype=bool)
+        self.microTones = np.array([ins.microTones for ins in self.instruments], dtype=bool)
+        self.numSystems = np.array([ins.numSystems for ins in self.instruments], dtype=np.int64)
+        self._tree = _IntervalTree(self.lows.tolist(), self.highs.tolist())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _filter_mask(self, chordsPossible=None, microTones=None, numSystems=None):
+        """Boolean mask of the instruments matching the attribute filters (None = any)."""
+        mask = np.ones(len(self), dtype=bool)
+        if chordsPossible is not None:
+            mask &= self.chordsPossible == bool(chordsPossible)
+        if microTones is not None:
+            mask &= self.microTones == bool(microTones)
+        if numSystems is not None:
+            mask &= self.numSystems == int(numSystems)
+        return mask
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def _in_range(self, low, high, mask):
+        hits = [i for i in self._tree.stab(float(low)) if self.highs[i] >= high and mask[i]]
+        return sorted(hits)
+
+    def in_range(self, low, high=None, **filters):
+        """
+        Keys of the instruments whose sounding range contains
+        [low, high] (high defaults to low) and which match the
+        attribute filters chordsPossible, microTones, numSystems
+        (None = any), in palette order.
+        """
+        high = low if high is None else high
+        return [self.keys[i] for i in self._in_range(low, high, self._filter_mask(**filters))]
+
+    def can_play(self, passage, *, exact: bool = True, **filters):
+        """
+        Keys of the instruments that can play a passage, given as sounding
+        MIDI pitches or a list of chords. Instruments must cover its
+        range, support chords if any chord has several notes and
+        microtones if any pitch is microtonal; with exact, every pitch
+        must also be playable (Instrument.playable_many, which also
+        excludes missing notes).
+        """
+        values, offsets = _flatten(passage)
+        mask = self._filter_mask(**filters)
+        if not len(values):
+            return [self.keys[i] for i in np.flatnonzero(mask)]
+        if (np.diff(offsets) > 1).any():
+            mask &= self.chordsPossible
+        if (values != np.round(values)).any():
+            mask &= self.microTones
+        return [self.keys[i] for i in self._in_range(values.min(), values.max(), mask)
+                if not exact or self.instruments[i].playable_many(values).all()]
+
+    def can_play_many(self, passages, *, exact: bool = True, **filters):
+        """
+        Batch can_play: one list of keys per passage. Ranges and
+        requirements of all passages are matched against all
+        instruments in one (passages x instruments) array operation;
+        exact checks then run once per instrument, over the pitches of
+        all passages it is still a candidate for.
+        """
+        flat = [_flatten(p) for p in passages]
+        lengths = np.array([len(v) for v, _ in flat], dtype=np.int64)
+        values = np.concatenate([v for v, _ in flat] + [np.empty(0)])
+        owner = np.repeat(np.arange(len(flat)), lengths)
+        filled = lengths > 0
+        starts = (np.cumsum(lengths) - lengths)[filled]
+
+        # empty passages: (inf, -inf) fits every range
+        low = np.full(len(flat), np.inf)
+        high = np.full(len(flat), -np.inf)
+        needs_micro = np.zeros(len(flat), dtype=bool)
+        if len(values):
+            low[filled] = np.minimum.reduceat(values, starts)
+            high[filled] = np.maximum.reduceat(values, starts)
+            needs_micro[filled] = np.logical_or.reduceat(values != np.round(values), starts)
+        needs_chords = np.array([(np.diff(o) > 1).any() for _, o in flat], dtype=bool)
+
+        ok = (self.lows <= low[:, None]) & (self.highs >= high[:, None])
+        ok &= self._filter_mask(**filters)
+        ok &= ~needs_chords[:, None] | self.chordsPossible
+        ok &= ~needs_micro[:, None] | self.microTones
+
+        if exact:
+            for j in np.flatnonzero(ok.any(axis=0)):
+                pick = ok[owner, j]
+                playable = self.instruments[j].playable_many(values[pick])
+                ok[owner[pick][~playable], j] = False
+        return [[self.keys[j] for j in np.flatnonzero(row)] for row in ok]
+
+
+def _flatten(passage):
+    """A passage (pitch, pitches or chords) → (values, offsets) as flatten_chords."""
+    if isinstance(passage, numbers.Real):
+        passage = [passage]
+    return flatten_chords(passage)
@@ -13,6 +13,10 @@ last updated: 08.12.2025
 
 from __future__ import annotations
 
+import itertools
+import threading
+from collections.abc import Mapping
+
 from .Instrument import Instrument  # adjust to your actual module name
 from .Pitch import note2midi as nm
 
@@ -29,231 +33,233 @@ def _missing(*names: str):
 
 # ---------------------------------------------------------------------------
 # Standard Instrument Palette
+#   one spec per instrument: Instrument keyword arguments with the range
+#   and missing notes as note names; see _LazyPalette for materialisation
 # ---------------------------------------------------------------------------
 
-STANDARD_INSTRUMENTS: dict = {
+_PALETTE_SPECS: dict = {
     # -----------------------------------------------------------------------
     # Flutes & recorders
     # -----------------------------------------------------------------------
-    "piccolo": Instrument(
+    "piccolo": dict(
         name="piccolo",
-        rangeMidi=(nm("d4"), nm("c7")),
+        rangeMidi=("d4", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=73,
     ),
-    "flute": Instrument(
+    "flute": dict(
         name="flute",
-        rangeMidi=(nm("c4"), nm("d7")),
+        rangeMidi=("c4", "d7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing("cqs4", "dqf4"),
+        missing_notes=("cqs4", "dqf4"),
         midi_program=74,
     ),
-    "alto-flute": Instrument(
+    "alto-flute": dict(
         name="alto flute",
-        rangeMidi=(nm("c4"), nm("c7")),
+        rangeMidi=("c4", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-5,
-        missing_notes=_missing("cqs4", "dqf4"),
+        missing_notes=("cqs4", "dqf4"),
         midi_program=74,
     ),
-    "bass-flute": Instrument(
+    "bass-flute": dict(
         name="bass flute",
-        rangeMidi=(nm("c4"), nm("c7")),
+        rangeMidi=("c4", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],  # clefs-in-c had bass too
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),  # clefs-in-c had bass too
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-12,
-        missing_notes=_missing("cqs4", "dqf4"),
+        missing_notes=("cqs4", "dqf4"),
         midi_program=74,
     ),
-    "sopranino-recorder": Instrument(
+    "sopranino-recorder": dict(
         name="sopranino recorder",
-        rangeMidi=(nm("f4"), nm("g6")),
+        rangeMidi=("f4", "g6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=75,
     ),
-    "soprano-recorder": Instrument(
+    "soprano-recorder": dict(
         name="soprano recorder",
-        rangeMidi=(nm("c4"), nm("d6")),
+        rangeMidi=("c4", "d6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=75,
     ),
-    "alto-recorder": Instrument(
+    "alto-recorder": dict(
         name="alto recorder",
-        rangeMidi=(nm("f4"), nm("g6")),
+        rangeMidi=("f4", "g6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=75,
     ),
-    "tenor-recorder": Instrument(
+    "tenor-recorder": dict(
         name="tenor recorder",
-        rangeMidi=(nm("c4"), nm("d6")),
+        rangeMidi=("c4", "d6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=75,
     ),
-    "consort-tenor-recorder": Instrument(
+    "consort-tenor-recorder": dict(
         name="consort tenor recorder",
-        rangeMidi=(nm("c4"), nm("a5")),
+        rangeMidi=("c4", "a5"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing("cs4", "ds4"),
+        missing_notes=("cs4", "ds4"),
         midi_program=75,
     ),
-    "bass-recorder": Instrument(
+    "bass-recorder": dict(
         name="bass recorder",
-        rangeMidi=(nm("f2"), nm("f4")),
+        rangeMidi=("f2", "f4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass"],
+        initClefs=("bass",),
+        possibleClefs=("bass",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=75,
     ),
 
     # -----------------------------------------------------------------------
     # Oboe family
     # -----------------------------------------------------------------------
-    "oboe": Instrument(
+    "oboe": dict(
         name="oboe",
-        rangeMidi=(nm("bf3"), nm("a6")),
+        rangeMidi=("bf3", "a6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing("bqf3", "bqs3", "cqs4", "dqf4"),
+        missing_notes=("bqf3", "bqs3", "cqs4", "dqf4"),
         midi_program=69,
     ),
-    "cor-anglais": Instrument(
+    "cor-anglais": dict(
         name="cor anglais",
-        rangeMidi=(nm("bf3"), nm("a6")),
+        rangeMidi=("bf3", "a6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-7,
-        missing_notes=_missing("bqf3", "bqs3", "cqs4", "dqf4"),
+        missing_notes=("bqf3", "bqs3", "cqs4", "dqf4"),
         midi_program=70,
     ),
-    "oboe-d-amore": Instrument(
+    "oboe-d-amore": dict(
         name="oboe d'amore",
-        rangeMidi=(nm("bf3"), nm("a6")),
+        rangeMidi=("bf3", "a6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-3,
-        missing_notes=_missing("bqf3", "bqs3", "cqs4", "dqf4"),
+        missing_notes=("bqf3", "bqs3", "cqs4", "dqf4"),
         midi_program=70,
     ),
 
     # -----------------------------------------------------------------------
     # Clarinets
     # -----------------------------------------------------------------------
-    "e-flat-clarinet": Instrument(
+    "e-flat-clarinet": dict(
         name="E-flat clarinet",
-        rangeMidi=(nm("e3"), nm("a6")),
+        rangeMidi=("e3", "a6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=3,
-        missing_notes=_missing(
+        missing_notes=(
             "aqs4", "bqf4", "bqs4", "cqs5", "dqf5",
             "gqf3", "fqs3", "fqf3"
         ),
         midi_program=72,
     ),
-    "b-flat-clarinet": Instrument(
+    "b-flat-clarinet": dict(
         name="B-flat clarinet",
-        rangeMidi=(nm("e3"), nm("a6")),
+        rangeMidi=("e3", "a6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-2,
-        missing_notes=_missing(
+        missing_notes=(
             "aqs4", "bqf4", "bqs4", "cqs5", "dqf5",
             "gqf3", "fqs3", "fqf3"
         ),
         midi_program=72,
     ),
-    "a-clarinet": Instrument(
+    "a-clarinet": dict(
         name="A clarinet",
-        rangeMidi=(nm("e3"), nm("a6")),
+        rangeMidi=("e3", "a6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-3,
-        missing_notes=_missing(
+        missing_notes=(
             "aqs4", "bqf4", "bqs4", "cqs5", "dqf5",
             "gqf3", "fqs3", "fqf3"
         ),
         midi_program=72,
     ),
-    "bass-clarinet": Instrument(
+    "bass-clarinet": dict(
         name="bass clarinet",
-        rangeMidi=(nm("c3"), nm("g6")),
+        rangeMidi=("c3", "g6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],  # clefs-in-c included bass
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),  # clefs-in-c included bass
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-14,
-        missing_notes=_missing(
+        missing_notes=(
             "aqs4", "bqf4", "bqs4", "cqs5", "dqf5",
             "gqf3", "fqs3", "fqf3", "eqf3",
             "dqs3", "dqf3", "cqs3",
@@ -264,94 +270,94 @@ STANDARD_INSTRUMENTS: dict = {
     # -----------------------------------------------------------------------
     # Saxophones
     # -----------------------------------------------------------------------
-    "sopranino-sax": Instrument(
+    "sopranino-sax": dict(
         name="sopranino saxophone",
-        rangeMidi=(nm("bf3"), nm("fs6")),
+        rangeMidi=("bf3", "fs6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=3,
-        missing_notes=_missing("gqs4", "gqs5"),
+        missing_notes=("gqs4", "gqs5"),
         midi_program=65,
     ),
-    "soprano-sax": Instrument(
+    "soprano-sax": dict(
         name="soprano saxophone",
-        rangeMidi=(nm("bf3"), nm("fs6")),
+        rangeMidi=("bf3", "fs6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-2,
-        missing_notes=_missing("gqs4", "gqs5"),
+        missing_notes=("gqs4", "gqs5"),
         midi_program=65,
     ),
-    "alto-sax": Instrument(
+    "alto-sax": dict(
         name="alto saxophone",
-        rangeMidi=(nm("bf3"), nm("fs6")),
+        rangeMidi=("bf3", "fs6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-9,
-        missing_notes=_missing("gqs4", "gqs5"),
+        missing_notes=("gqs4", "gqs5"),
         midi_program=66,
     ),
-    "tenor-sax": Instrument(
+    "tenor-sax": dict(
         name="tenor saxophone",
-        rangeMidi=(nm("bf3"), nm("fs6")),
+        rangeMidi=("bf3", "fs6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],  # clefs-in-c had bass
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),  # clefs-in-c had bass
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-14,
-        missing_notes=_missing("gqs4", "gqs5"),
+        missing_notes=("gqs4", "gqs5"),
         midi_program=67,
     ),
-    "baritone-sax": Instrument(
+    "baritone-sax": dict(
         name="baritone saxophone",
-        rangeMidi=(nm("bf3"), nm("fs6")),
+        rangeMidi=("bf3", "fs6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],  # clefs-in-c had bass
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),  # clefs-in-c had bass
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-21,
-        missing_notes=_missing("gqs4", "gqs5"),
+        missing_notes=("gqs4", "gqs5"),
         midi_program=68,
     ),
 
     # -----------------------------------------------------------------------
     # Bassoon family
     # -----------------------------------------------------------------------
-    "bassoon": Instrument(
+    "bassoon": dict(
         name="bassoon",
-        rangeMidi=(nm("bf1"), nm("c5")),
+        rangeMidi=("bf1", "c5"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "tenor"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "tenor"),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(
+        missing_notes=(
             "bqf1", "bqs1", "cqs2", "dqf2", "dqs2", "eqf2"
         ),
         midi_program=71,
     ),
-    "contra-bassoon": Instrument(
+    "contra-bassoon": dict(
         name="contrabassoon",
-        rangeMidi=(nm("bf1"), nm("a4")),
+        rangeMidi=("bf1", "a4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "tenor"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "tenor"),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-12,
-        missing_notes=_missing(
+        missing_notes=(
             "bqf1", "bqs1", "cqs2", "dqf2", "dqs2", "eqf2"
         ),
         midi_program=71,
@@ -360,505 +366,576 @@ STANDARD_INSTRUMENTS: dict = {
     # -----------------------------------------------------------------------
     # Horns, trumpets, trombones, tuba
     # -----------------------------------------------------------------------
-    "french-horn": Instrument(
+    "french-horn": dict(
         name="french horn",
-        rangeMidi=(nm("f2"), nm("c6")),
+        rangeMidi=("f2", "c6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-7,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=61,
     ),
-    "french-horn-high": Instrument(
+    "french-horn-high": dict(
         name="french horn (high)",
-        rangeMidi=(nm("g3"), nm("c6")),
+        rangeMidi=("g3", "c6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-7,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=61,
     ),
-    "french-horn-low": Instrument(
+    "french-horn-low": dict(
         name="french horn (low)",
-        rangeMidi=(nm("f2"), nm("g5")),
+        rangeMidi=("f2", "g5"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-7,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=61,
     ),
-    "c-trumpet": Instrument(
+    "c-trumpet": dict(
         name="trumpet in C",
-        rangeMidi=(nm("fs3"), nm("c6")),
+        rangeMidi=("fs3", "c6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=57,
     ),
-    "b-flat-trumpet": Instrument(
+    "b-flat-trumpet": dict(
         name="B-flat trumpet",
-        rangeMidi=(nm("fs3"), nm("d6")),
+        rangeMidi=("fs3", "d6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-2,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=57,
     ),
-    "tenor-trombone": Instrument(
+    "tenor-trombone": dict(
         name="tenor trombone",
-        rangeMidi=(nm("e2"), nm("bf4")),
+        rangeMidi=("e2", "bf4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "tenor"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "tenor"),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=58,
     ),
-    "bass-trombone": Instrument(
+    "bass-trombone": dict(
         name="bass trombone",
-        rangeMidi=(nm("e1"), nm("g4")),
+        rangeMidi=("e1", "g4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "tenor"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "tenor"),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=58,
     ),
-    "tuba": Instrument(
+    "tuba": dict(
         name="tuba",
-        rangeMidi=(nm("d1"), nm("g4")),
+        rangeMidi=("d1", "g4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass"],
+        initClefs=("bass",),
+        possibleClefs=("bass",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=59,
     ),
 
     # -----------------------------------------------------------------------
     # Mallet percussion & keyboards
     # -----------------------------------------------------------------------
-    "marimba": Instrument(
+    "marimba": dict(
         name="marimba",
-        rangeMidi=(nm("c3"), nm("c7")),
+        rangeMidi=("c3", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],  # in SC: (treble) but often bass too
+        initClefs=("treble",),
+        possibleClefs=("treble",),  # in SC: (treble) but often bass too
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=13,
     ),
-    "vibraphone": Instrument(
+    "vibraphone": dict(
         name="vibraphone",
-        rangeMidi=(nm("f3"), nm("f6")),
+        rangeMidi=("f3", "f6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=12,
     ),
-    "accordion": Instrument(
+    "accordion": dict(
         name="accordion",
-        rangeMidi=(nm("e1"), nm("bf7")),
+        rangeMidi=("e1", "bf7"),
         numSystems=2,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass", "double-treble", "double-bass"],
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass", "double-treble", "double-bass"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=22,
     ),
-    "glockenspiel": Instrument(
+    "glockenspiel": dict(
         name="glockenspiel",
-        rangeMidi=(nm("f3"), nm("c6")),
+        rangeMidi=("f3", "c6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=24,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=10,
     ),
-    "xylophone": Instrument(
+    "xylophone": dict(
         name="xylophone",
-        rangeMidi=(nm("f3"), nm("c7")),
+        rangeMidi=("f3", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=14,
     ),
-    "celesta": Instrument(
+    "celesta": dict(
         name="celesta",
-        rangeMidi=(nm("c3"), nm("c7")),
+        rangeMidi=("c3", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=9,
     ),
-    "crotales": Instrument(
+    "crotales": dict(
         name="crotales",
-        rangeMidi=(nm("c4"), nm("c6")),
+        rangeMidi=("c4", "c6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=24,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=10,  # glockenspiel program
     ),
 
     # -----------------------------------------------------------------------
     # Piano, harpsichord, harp, organ
     # -----------------------------------------------------------------------
-    "piano": Instrument(
+    "piano": dict(
         name="piano",
-        rangeMidi=(nm("a0"), nm("c8")),
+        rangeMidi=("a0", "c8"),
         numSystems=2,
-        initClefs=["treble", "bass"],
-        possibleClefs=["treble", "bass", "double-treble", "double-bass"],
+        initClefs=("treble", "bass"),
+        possibleClefs=("treble", "bass", "double-treble", "double-bass"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=1,
     ),
-    "piano-lh": Instrument(
+    "piano-lh": dict(
         name="piano-lh",
-        rangeMidi=(nm("a0"), nm("c8")),
+        rangeMidi=("a0", "c8"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["treble", "bass", "double-treble", "double-bass"],
+        initClefs=("bass",),
+        possibleClefs=("treble", "bass", "double-treble", "double-bass"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=1,
     ),
-    "harpsichord": Instrument(
+    "harpsichord": dict(
         name="harpsichord",
-        rangeMidi=(nm("f1"), nm("f6")),
+        rangeMidi=("f1", "f6"),
         numSystems=2,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=7,
     ),
-    "harp": Instrument(
+    "harp": dict(
         name="harp",
-        rangeMidi=(nm("b0"), nm("gs7")),
+        rangeMidi=("b0", "gs7"),
         numSystems=2,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=47,
     ),
-    "organ": Instrument(
+    "organ": dict(
         name="organ",
-        rangeMidi=(nm("c2"), nm("c7")),
+        rangeMidi=("c2", "c7"),
         numSystems=2,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass"],
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=20,
     ),
-    "organ-pedals": Instrument(
+    "organ-pedals": dict(
         name="organ pedals",
-        rangeMidi=(nm("c2"), nm("g4")),
+        rangeMidi=("c2", "g4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass"],
+        initClefs=("bass",),
+        possibleClefs=("bass",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=20,
     ),
 
     # -----------------------------------------------------------------------
     # Percussion (non-pitched)
     # -----------------------------------------------------------------------
-    "percussion": Instrument(
+    "percussion": dict(
         name="percussion",
-        rangeMidi=(nm("d4"), nm("g5")),
+        rangeMidi=("d4", "g5"),
         numSystems=1,
-        initClefs=["percussion"],
-        possibleClefs=["percussion"],
+        initClefs=("percussion",),
+        possibleClefs=("percussion",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=1,
     ),
-    "tambourine": Instrument(
+    "tambourine": dict(
         name="tambourine",
-        rangeMidi=(nm("b4"), nm("b4")),
+        rangeMidi=("b4", "b4"),
         numSystems=1,
-        initClefs=["percussion"],
-        possibleClefs=["percussion"],
+        initClefs=("percussion",),
+        possibleClefs=("percussion",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=1,
     ),
 
     # -----------------------------------------------------------------------
     # Guitar, mandolin
     # -----------------------------------------------------------------------
-    "guitar": Instrument(
+    "guitar": dict(
         name="guitar",
-        rangeMidi=(nm("e3"), nm("b6")),
+        rangeMidi=("e3", "b6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=-12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=25,
     ),
-    "mandolin": Instrument(
+    "mandolin": dict(
         name="mandolin",
-        rangeMidi=(nm("g3"), nm("c7")),
+        rangeMidi=("g3", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=26,  # steel-string guitar in GM
     ),
 
     # -----------------------------------------------------------------------
     # Voices
     # -----------------------------------------------------------------------
-    "soprano": Instrument(
+    "soprano": dict(
         name="soprano",
-        rangeMidi=(nm("c4"), nm("c6")),
+        rangeMidi=("c4", "c6"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
-    "mezzo": Instrument(
+    "mezzo": dict(
         name="mezzo-soprano",
-        rangeMidi=(nm("a3"), nm("a5")),
+        rangeMidi=("a3", "a5"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
-    "alto-voice": Instrument(  # avoid clash with viola's "alto" clef
+    "alto-voice": dict(  # avoid clash with viola's "alto" clef
         name="alto",
-        rangeMidi=(nm("f3"), nm("f5")),
+        rangeMidi=("f3", "f5"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
-    "countertenor": Instrument(
+    "countertenor": dict(
         name="countertenor",
-        rangeMidi=(nm("e3"), nm("e5")),
+        rangeMidi=("e3", "e5"),
         numSystems=1,
-        initClefs=["treble-8vb"],
-        possibleClefs=["treble-8vb"],
+        initClefs=("treble-8vb",),
+        possibleClefs=("treble-8vb",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
-    "tenor-voice": Instrument(
+    "tenor-voice": dict(
         name="tenor",
-        rangeMidi=(nm("c3"), nm("c5")),
+        rangeMidi=("c3", "c5"),
         numSystems=1,
-        initClefs=["treble-8vb"],
-        possibleClefs=["treble-8vb"],
+        initClefs=("treble-8vb",),
+        possibleClefs=("treble-8vb",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
-    "baritone-voice": Instrument(
+    "baritone-voice": dict(
         name="baritone",
-        rangeMidi=(nm("a2"), nm("a4")),
+        rangeMidi=("a2", "a4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass"],
+        initClefs=("bass",),
+        possibleClefs=("bass",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
-    "bass-voice": Instrument(
+    "bass-voice": dict(
         name="bass",
-        rangeMidi=(nm("e2"), nm("e4")),
+        rangeMidi=("e2", "e4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass"],
+        initClefs=("bass",),
+        possibleClefs=("bass",),
         chordsPossible=False,
         microTones=False,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=54,
     ),
 
     # -----------------------------------------------------------------------
     # Strings
     # -----------------------------------------------------------------------
-    "violin": Instrument(
+    "violin": dict(
         name="violin",
-        rangeMidi=(nm("g3"), nm("c7")),
+        rangeMidi=("g3", "c7"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble"],
+        initClefs=("treble",),
+        possibleClefs=("treble",),
         chordsPossible=True,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=41,
     ),
-    "viola": Instrument(
+    "viola": dict(
         name="viola",
-        rangeMidi=(nm("c3"), nm("f6")),
+        rangeMidi=("c3", "f6"),
         numSystems=1,
-        initClefs=["alto"],
-        possibleClefs=["alto", "treble"],
+        initClefs=("alto",),
+        possibleClefs=("alto", "treble"),
         chordsPossible=True,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=42,
     ),
-    "viola-d-amore": Instrument(
+    "viola-d-amore": dict(
         name="viola d'amore",
-        rangeMidi=(nm("a2"), nm("f7")),
+        rangeMidi=("a2", "f7"),
         numSystems=1,
-        initClefs=["alto"],
-        possibleClefs=["alto", "treble"],
+        initClefs=("alto",),
+        possibleClefs=("alto", "treble"),
         chordsPossible=True,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=41,
     ),
-    "cello": Instrument(
+    "cello": dict(
         name="cello",
-        rangeMidi=(nm("c2"), nm("a5")),
+        rangeMidi=("c2", "a5"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "tenor", "treble"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "tenor", "treble"),
         chordsPossible=True,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=43,
     ),
-    "double-bass": Instrument(
+    "double-bass": dict(
         name="double bass",
-        rangeMidi=(nm("e2"), nm("g5")),
+        rangeMidi=("e2", "g5"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "tenor", "treble"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "tenor", "treble"),
         chordsPossible=False,
         microTones=True,
         transposition_semitones=-12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=44,
     ),
-    "bass-guitar": Instrument(
+    "bass-guitar": dict(
         name="bass guitar",
-        rangeMidi=(nm("e2"), nm("g4")),
+        rangeMidi=("e2", "g4"),
         numSystems=1,
-        initClefs=["bass"],
-        possibleClefs=["bass", "treble"],
+        initClefs=("bass",),
+        possibleClefs=("bass", "treble"),
         chordsPossible=True,
         microTones=False,
         transposition_semitones=-12,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=33,
     ),
 
     # -----------------------------------------------------------------------
     # Computer (generic)
     # -----------------------------------------------------------------------
-    "computer": Instrument(
+    "computer": dict(
         name="computer",
-        rangeMidi=(nm("C-1"), nm("bf8")),
+        rangeMidi=("C-1", "bf8"),
         numSystems=1,
-        initClefs=["treble"],
-        possibleClefs=["treble", "bass", "double-treble", "double-bass"],
+        initClefs=("treble",),
+        possibleClefs=("treble", "bass", "double-treble", "double-bass"),
         chordsPossible=True,
         microTones=True,
         transposition_semitones=0,
-        missing_notes=_missing(),
+        missing_notes=(),
         midi_program=100,  # GM FX 4 (atmosphere)
     ),
 }
 
 
+class _LazyPalette(Mapping):
+    """
+    {key: Instrument} mapping over the spec table. An Instrument is
+    built (note names parsed) the first time its key is looked up and
+    then cached, so importing the palette costs nothing and repeated
+    lookups return the same instance.
+
+    palette[key] = instrument registers a ready-made Instrument next to
+    the lazy entries (replacing the spec entry of the same key, if any);
+    the spec table itself is never modified.
+    """
+
+    def __init__(self, specs):
+        self._specs = specs
+        self._instruments = {}
+        # keys registered with __setitem__ that have no spec
+        self._registered = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build(spec) -> Instrument:
+        low, high = spec["rangeMidi"]
+        ins = Instrument(**{
+            **spec,
+            "rangeMidi": (nm(low), nm(high)),
+            "initClefs": list(spec["initClefs"]),
+            "possibleClefs": list(spec["possibleClefs"]),
+            "missing_notes": _missing(*spec["missing_notes"]),
+        })
+        # immutable missing notes, shared by all variants
+        ins.missing_notes_written = frozenset(ins.missing_notes_written)
+        return ins
+
+    def __getitem__(self, key) -> Instrument:
+        ins = self._instruments.get(key)
+        if ins is None:
+            spec = self._specs[key]
+            with self._lock:
+                ins = self._instruments.get(key)
+                if ins is None:
+                    ins = self._instruments[key] = self._build(spec)
+        return ins
+
+    def __setitem__(self, key, ins: Instrument):
+        if not isinstance(ins, Instrument):
+            raise TypeError(f"palette values must be Instruments, got {type(ins).__name__}")
+        with self._lock:
+            self._instruments[key] = ins
+            if key not in self._specs:
+                self._registered[key] = None
+
+    def __iter__(self):
+        return itertools.chain(self._specs, self._registered)
+
+    def __len__(self):
+        return len(self._specs) + len(self._registered)
+
+    def __contains__(self, key):
+        return key in self._specs or key in self._registered
+
+    def is_loaded(self, key) -> bool:
+        """True if the Instrument for key has already been built."""
+        return key in self._instruments
+
+    def __repr__(self):
+        return f"<standard instruments: {len(self._instruments)}/{len(self)} loaded>"
+
+
+STANDARD_INSTRUMENTS = _LazyPalette(_PALETTE_SPECS)
+
+
 # ---------------------------------------------------------------------------
 # Convenience accessor (like get-standard-ins)
 # ---------------------------------------------------------------------------
@@ -867,11 +944,14 @@ def get_standard_instrument(name: str) -> Instrument:
     """
     Return a standard Instrument instance by key.
 
-    Keys are the dictionary keys of STANDARD_INSTRUMENTS, e.g.:
+    Keys are the keys of STANDARD_INSTRUMENTS, e.g.:
       'flute', 'b-flat-clarinet', 'violin', 'piano', 'computer', ...
 
-    Note: this returns the shared instance from the palette. If you want
-    to modify it without affecting the palette, make your own copy.
+    The instrument is built on first access and cached.
+
+    Note: this returns the shared instance from the palette. To modify
+    it, derive a variant instead (ins.variant(transposition_semitones=...,
+    missing_notes=..., tuningCents=...)), which shares the palette data.
     """
     try:
         return STANDARD_INSTRUMENTS[name]
@@ -13,6 +13,9 @@ last updated: 08.12.2025
 
 
 import re
+from fractions import Fraction
+
+import numpy as np
 
 # Basic semitone offsets within an octave (C = 0, …, B = 11)
 _NOTE_OFFSETS = {
@@ -38,12 +41,42 @@ _ACCIDENTAL_OFFSETS = {
     "tf": -1.0 / 6.0,   # twelfth-tone flat
 }
 
+# the same offsets as exact fractions of a semitone
+_ACCIDENTAL_FRACTIONS = {
+    "":   Fraction(0),
+    "s":  Fraction(1),
+    "f":  Fraction(-1),
+    "qs": Fraction(1, 2),
+    "qf": Fraction(-1, 2),
+    "ss": Fraction(1, 3),
+    "sf": Fraction(-1, 3),
+    "ts": Fraction(1, 6),
+    "tf": Fraction(-1, 6),
+}
+
+
+_NOTE_PATTERN = re.compile(r"([a-g])([qsft]{0,2})(-?\d+)")
 
-def note2midi(note: str) -> float:
+# every note name with octave -1..9 → MIDI value, so the common case of
+# note2midi() is a single dict lookup instead of a regex match
+_NOTE_TABLE = {}
+_NOTE_TABLE_EXACT = {}
+for _octave in range(-1, 10):
+    for _letter, _base in _NOTE_OFFSETS.items():
+        for _acc, _offset in _ACCIDENTAL_OFFSETS.items():
+            _name = f"{_letter}{_acc}{_octave}"
+            _NOTE_TABLE[_name] = 12.0 * (_octave + 1) + _base + _offset
+            _NOTE_TABLE_EXACT[_name] = (
+                12 * (_octave + 1) + _base + _ACCIDENTAL_FRACTIONS[_acc])
+del _octave, _letter, _base, _acc, _offset, _name
+
+
+def note2midi(note: str, exact: bool = False):
     """
     Convert a note name like 'c4', 'bf3', 'cqs4', 'C-1' into a MIDI value.
 
     The result is a float, because microtonal accidentals are supported.
+    With exact=True it is a Fraction instead (e.g. css4 -> 181/3).
 
     Accidentals:
         s   = sharp        (fs3  -> F♯3)
@@ -61,12 +94,20 @@ def note2midi(note: str) -> float:
         note2midi("cqs4") -> 60.5
         note2midi("C-1")  -> 0.0
     """
+    table = _NOTE_TABLE_EXACT if exact else _NOTE_TABLE
+    value = table.get(note)
+    if value is not None:
+        return value
     s = note.strip().lower()
+    value = table.get(s)
+    if value is not None:
+        return value
 
+    # outside the table (octave < -1 or > 9, or invalid): parse
     # letter: a–g
     # acc: optional accidental: "", "s", "f", "qs", "qf", "ss", "sf", "ts", "tf"
     # octave: signed integer (e.g. -1, 3, 4)
-    m = re.fullmatch(r"([a-g])([qsft]{0,2})(-?\d+)", s)
+    m = _NOTE_PATTERN.fullmatch(s)
     if not m:
         raise ValueError(f"Cannot parse note name: {note!r}")
 
@@ -79,7 +120,96 @@ def note2midi(note: str) -> float:
     # Microtonal offset (may be 0.0 if no accidental)
     if acc not in _ACCIDENTAL_OFFSETS:
         raise ValueError(f"Unknown accidental '{acc}' in note {note!r}")
+    if exact:
+        return 12 * (octave + 1) + base_semitones + _ACCIDENTAL_FRACTIONS[acc]
     offset = _ACCIDENTAL_OFFSETS[acc]
 
     # MIDI formula: 12 * (octave + 1) + semitone_index
-    return 12.0 * (octave + 1) + base_semitones + offset
\ No newline at end of file
+    return 12.0 * (octave + 1) + base_semitones + offset
+
+
+def notes2midi(notes, exact: bool = False):
+    """
+    Convert an iterable of note names in one call; returns a float64
+    NumPy array (a list of Fractions with exact=True). Numeric values
+    are passed through, as in PitchGrid.from_notes.
+    """
+    table = _NOTE_TABLE_EXACT if exact else _NOTE_TABLE
+
+    def convert(note):
+        if isinstance(note, str):
+            value = table.get(note)
+            return value if value is not None else note2midi(note, exact=exact)
+        return note
+
+    if exact:
+        return [convert(n) for n in notes]
+    return np.fromiter((convert(n) for n in notes), dtype=np.float64)
+
+
+# ---------------------------------------------------------------------------
+# Reverse conversion: MIDI → note name
+#   pitches are rounded to 1/6 semitone (the finest accidental); the
+#   spelling of each of the 72 sixth-tones per octave is precomputed.
+# ---------------------------------------------------------------------------
+
+_UNITS_PER_SEMITONE = 6
+_UNITS_PER_OCTAVE = 12 * _UNITS_PER_SEMITONE
+
+
+def _build_spelling_table():
+    """
+    For every sixth-tone of the octave: (letter + accidental, octave
+    shift). Preference: same octave, then accidental order of
+    _ACCIDENTAL_OFFSETS (natural, sharp, flat, quarter-, sixth-,
+    twelfth-tones), then letter order. Sixth-tones that no single
+    accidental reaches (e.g. c + 2/3) take the nearest spelled one.
+    """
+    best = {}
+    accidentals = list(_ACCIDENTAL_FRACTIONS)
+    letters = list(_NOTE_OFFSETS)
+    for acc, offset in _ACCIDENTAL_FRACTIONS.items():
+        for letter, base in _NOTE_OFFSETS.items():
+            units = int((base + offset) * _UNITS_PER_SEMITONE)
+            shift, residue = divmod(units, _UNITS_PER_OCTAVE)
+            # a note written in octave o + shift sounds in octave o
+            rank = (abs(shift), accidentals.index(acc), letters.index(letter))
+            if residue not in best or rank < best[residue][0]:
+                best[residue] = (rank, letter + acc, -shift)
+
+    prefixes, shifts = [], []
+    for residue in range(_UNITS_PER_OCTAVE):
+        # 0 and the top of the octave are spelled, so the nearest
+        # spelling never lies across the octave; ties → lower pitch
+        nearest = min(best, key=lambda r: (abs(residue - r), r))
+        _, prefix, shift = best[nearest]
+        prefixes.append(prefix)
+        shifts.append(shift)
+    return np.array(prefixes), np.array(shifts, dtype=np.int64)
+
+
+_SPELLING_PREFIXES, _SPELLING_SHIFTS = _build_spelling_table()
+
+
+def midi2note(midi) -> str:
+    """
+    Convert a MIDI value into a note name ('c4', 'bf3', 'cqs4', 'cts4', ...),
+    the inverse of note2midi. The pitch is rounded to 1/6 semitone;
+    sixth-tones without a single-accidental spelling use the nearest one.
+
+    Examples:
+        midi2note(60)       -> 'c4'
+        midi2note(60.5)     -> 'cqs4'
+        midi2note(60 + 1/6) -> 'cts4'
+    """
+    octave, residue = divmod(round(float(midi) * _UNITS_PER_SEMITONE), _UNITS_PER_OCTAVE)
+    octave += int(_SPELLING_SHIFTS[residue]) - 1
+    return f"{_SPELLING_PREFIXES[residue]}{octave}"
+
+
+def midis2notes(midis):
+    """Vectorized midi2note: a NumPy array of note-name strings."""
+    units = np.rint(np.asarray(midis, dtype=np.float64) * _UNITS_PER_SEMITONE).astype(np.int64)
+    octave, residue = np.divmod(units, _UNITS_PER_OCTAVE)
+    octave += _SPELLING_SHIFTS[residue] - 1
+    return np.char.add(_SPELLING_PREFIXES[residue], octave.astype(str))
@@ -1,9 +1,97 @@
+import bisect
+import math
 import numbers
-from .QuantisationGrid import Grid
-from .Pitch import note2midi  # assuming Pitch.py is in the same package/folder
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping, Set
+from fractions import Fraction
 
+import numpy as np
 
-class PitchGrid(Grid):
+from .QuantisationGrid import Grid, _nearest_indices
+from .Pitch import note2midi, notes2midi  # assuming Pitch.py is in the same package/folder
+
+
+def _normalize_root(root):
+    """Root as float MIDI number, from a MIDI number or pitch name string."""
+    if isinstance(root, (int, float)):
+        return float(root)
+    if isinstance(root, str):
+        return float(note2midi(root))
+    raise TypeError("root must be a MIDI number or pitch name string")
+
+
+def _dedupe_sorted(values, tolerance=0.0):
+    """
+    Merge clusters of the sorted array `values`: walking upwards, a
+    value within `tolerance` of the last kept value is dropped, so each
+    cluster is kept as its lowest value and spans at most `tolerance`
+    (tolerance 0 drops exact duplicates only).
+    """
+    if len(values) < 2:
+        return values
+    if tolerance <= 0:
+        return values[np.concatenate(([True], np.diff(values) > 0))]
+    keep = []
+    i, n = 0, len(values)
+    while i < n:
+        keep.append(i)
+        i = int(np.searchsorted(values, values[i] + tolerance, side="right"))
+    return values[keep]
+
+
+class _PitchClassConstructors:
+    """
+    Constructors built on top of cls.from_pitch_classes, shared by the
+    materialised PitchGrid and the octave-modular ModularPitchGrid.
+    """
+
+    @classmethod
+    def fromChurchModes(cls, mode, root, min_midi, max_midi, name=None):
+        """
+        Construct a PitchGrid from a church mode defined in SCALE_MASKS_12TET.
+
+        Parameters
+        ----------
+        mode : str
+            Name of the mode, e.g. 'ionian', 'dorian', 'phrygian', ...
+        root : int | float | str
+            Root as MIDI number or note name string ('c4', 'bf3', ...).
+        min_midi, max_midi : int | float
+            Inclusive MIDI boundaries for the grid.
+        name : str | None
+            Optional name for the PitchGrid. If None, the mode name is used.
+        """
+        mode_key = str(mode).lower()
+        try:
+            pcs = SCALE_MASKS_12TET[mode_key]
+        except KeyError as exc:
+            raise KeyError(f"Unknown church mode: {mode!r}") from exc
+
+        # reuse your from_pitch_classes constructor
+        return cls.from_pitch_classes(
+            pcs=pcs,
+            root=root,
+            min_midi=min_midi,
+            max_midi=max_midi,
+            name=name or mode_key,
+        )
+
+    @classmethod
+    def from_sruti_raga(cls, raga_name, root, min_midi, max_midi, name=None):
+        """
+        Construct a PitchGrid from a 22-Śruti raga mask (e.g. 'abhogi')
+        and a root (MIDI or note name).
+        """
+        pcs = get_sruti_mask(raga_name)
+        return cls.from_pitch_classes(pcs, root=root,
+                                    min_midi=min_midi,
+                                    max_midi=max_midi,
+                                    name=name or raga_name)
+
+
+class PitchGrid(_PitchClassConstructors, Grid):
     def __init__(self, values=None, name=None):
         super().__init__(values)
         if not self.check_types(expected_type=numbers.Number):
@@ -23,12 +111,9 @@ class PitchGrid(Grid):
         if notes is None:
             return cls(values=None, name=name)
 
-        midi_vals = []
-        for n in notes:
-            if isinstance(n, numbers.Number):
-                midi_vals.append(float(n))
-            else:
-                midi_vals.append(note2midi(str(n)))
+        midi_vals = notes2midi(
+            n if isinstance(n, numbers.Number) else str(n) for n in notes
+        ).tolist()
 
         return cls(values = midi_vals, name=name)
 
@@ -46,12 +131,7 @@ class PitchGrid(Grid):
         """
 
         # ---- normalize root ----
-        if isinstance(root, (int, float)):
-            root = float(root)
-        elif isinstance(root, str):
-            root = float(note2midi(root))
-        else:
-            raise TypeError("root must be a MIDI number or pitch name string")
+        root = _normalize_root(root)
 
         # ---- normalize numeric inputs ----
         pcs = [float(x) for x in pcs]
@@ -94,51 +174,469 @@ class PitchGrid(Grid):
 
         # Wrap in PitchGrid
         return cls(g, name=name)
-    
-    
+
+    # ---- spectral constructors ----
+    #   frequencies → MIDI through a Tuning (pass Composition.tuning to
+    #   use the composition's reference pitch), all vectorized
     @classmethod
-    def fromChurchModes(cls, mode, root, min_midi, max_midi, name=None):
+    def from_freqs(cls, freqs, tuning=None, tolerance=0.0,
+                   min_midi=None, max_midi=None, name=None):
         """
-        Construct a PitchGrid from a church mode defined in SCALE_MASKS_12TET.
+        Create a PitchGrid from frequencies in Hz.
+
+        - tuning: Tuning converting frequencies to MIDI (default
+          Tuning(): a4 = 440 Hz = MIDI 69)
+        - tolerance: pitches within this many semitones of their lower
+          neighbour are merged into one point (the lowest of the cluster)
+        - min_midi, max_midi: optional inclusive range boundaries
+        Non-positive frequencies are ignored.
+        """
+        if tuning is None:
+            from .Tuning import Tuning   # Tuning imports this module
+            tuning = Tuning()
+        midis = tuning.freqs_to_midis(np.asarray(freqs, dtype=np.float64).ravel())
+        midis = np.sort(midis[~np.isnan(midis)])
+        if min_midi is not None:
+            midis = midis[midis >= min_midi]
+        if max_midi is not None:
+            midis = midis[midis <= max_midi]
+        return cls(_dedupe_sorted(midis, tolerance).tolist(), name=name)
 
-        Parameters
-        ----------
-        mode : str
-            Name of the mode, e.g. 'ionian', 'dorian', 'phrygian', ...
-        root : int | float | str
-            Root as MIDI number or note name string ('c4', 'bf3', ...).
-        min_midi, max_midi : int | float
-            Inclusive MIDI boundaries for the grid.
-        name : str | None
-            Optional name for the PitchGrid. If None, the mode name is used.
+    @classmethod
+    def from_harmonics(cls, fundamental, count, tuning=None,
+                       tolerance=0.0, min_midi=None, max_midi=None, name=None):
+        """Partials 1..count of the harmonic series on `fundamental` (Hz)."""
+        freqs = fundamental * np.arange(1, int(count) + 1)
+        return cls.from_freqs(freqs, tuning, tolerance, min_midi, max_midi, name)
+
+    @classmethod
+    def from_subharmonics(cls, fundamental, count, tuning=None,
+                          tolerance=0.0, min_midi=None, max_midi=None, name=None):
+        """Undertones fundamental/1 .. fundamental/count (Hz)."""
+        freqs = fundamental / np.arange(1, int(count) + 1)
+        return cls.from_freqs(freqs, tuning, tolerance, min_midi, max_midi, name)
+
+    @classmethod
+    def from_fm(cls, carrier, modulator, sidebands, tuning=None,
+                tolerance=0.0, min_midi=None, max_midi=None, name=None):
         """
-        mode_key = str(mode).lower()
+        FM spectrum: carrier ± k*modulator for k = 0..sidebands (Hz);
+        negative sidebands are reflected around 0 Hz.
+        """
+        k = np.arange(-int(sidebands), int(sidebands) + 1)
+        freqs = np.abs(carrier + k * modulator)
+        return cls.from_freqs(freqs, tuning, tolerance, min_midi, max_midi, name)
+
+
+class FrozenPitchGrid(PitchGrid):
+    """
+    An immutable, hashable PitchGrid.
+
+    Every mutating set method raises TypeError, attributes cannot be
+    rebound after construction and the sorted index is built up front,
+    so instances never change after __init__ and are safe to share
+    (between phrases, generators and threads). Hashes and compares by
+    its points, like a frozenset.
+    """
+
+    def __init__(self, values=None, name=None):
+        super().__init__(values, name=name)
+        self._sorted_index()
+        self._hash = hash(frozenset(self))
+        self._frozen = True
+
+    def __setattr__(self, attr, value):
+        if getattr(self, "_frozen", False):
+            raise TypeError(f"{type(self).__name__} is immutable.")
+        super().__setattr__(attr, value)
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), (list(self), self.name))
+
+    def __copy__(self):
+        # immutable, like frozenset: a copy is the grid itself
+        return self
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable.")
+
+    add = discard = remove = pop = clear = update = _immutable
+    difference_update = intersection_update = symmetric_difference_update = _immutable
+    __ior__ = __iand__ = __isub__ = __ixor__ = _immutable
+    _append_sorted = _immutable
+
+
+# ---------------------------------------------------------------------------
+# ModularPitchGrid — octave-equivalent grid without materialised octaves
+# ---------------------------------------------------------------------------
+
+class ModularPitchGrid(_PitchClassConstructors, Set):
+    """
+    The pitch classes `pcs` above `root`, repeated in every octave and
+    limited to [min_midi, max_midi], stored as the sorted pitch-class set
+    plus the range bounds only.
+
+    Point number g of the (unbounded) grid is octave o = g // n and class
+    i = g % n of the n pitch classes, at MIDI (rootPC + o*12) + pcs[i].
+    Within the twelve octaves from rootPC up these are the values
+    PitchGrid.from_pitch_classes produces; unlike it, the modular grid
+    also continues below rootPC, so a min_midi under rootPC includes the
+    classes of the octave below the root (pitch classes 0, 4, 7 on a
+    with range [0, 20] give 1, 4, 9, 13, 16, not just 9, 13, 16). Quantising
+    is a divmod on the octave plus a binary search within the class set,
+    so its cost does not grow with the range or the octave count;
+    quantise_many does the same for NumPy arrays.
+    """
+
+    def __init__(self, pcs, root, min_midi, max_midi, name=None):
+        root = _normalize_root(root)
+        min_midi = float(min_midi)
+        max_midi = float(max_midi)
+        if min_midi > max_midi:
+            min_midi, max_midi = max_midi, min_midi
+
+        # pitch classes folded into [0, 12): 12.0 is the next octave's 0
+        classes = np.unique(np.mod(np.asarray([float(p) for p in pcs]), 12.0))
+        if not len(classes):
+            raise ValueError("ModularPitchGrid: at least one pitch class is required.")
+
+        self.rootPC = root % 12
+        self.pcs = classes
+        self.minMidi = min_midi
+        self.maxMidi = max_midi
+        self.name = name
+
+        # classes with their neighbours in the adjacent octaves, so the
+        # binary search also finds the nearest class across the octave
+        self._wrapped = np.concatenate(
+            ([classes[-1] - 12.0], classes, [classes[0] + 12.0]))
+        # list versions for the scalar path
+        self._pcList = classes.tolist()
+        self._wrappedList = self._wrapped.tolist()
+
+        # point numbers of the lowest and highest point inside the range
+        low = self._nearest_g_scalar(min_midi)
+        while self._point(low) < min_midi:
+            low += 1
+        while self._point(low - 1) >= min_midi:
+            low -= 1
+        high = self._nearest_g_scalar(max_midi)
+        while self._point(high) > max_midi:
+            high -= 1
+        while self._point(high + 1) <= max_midi:
+            high += 1
+        self._low = low
+        self._high = high
+
+    @classmethod
+    def from_pitch_classes(cls, pcs, root, min_midi, max_midi, name=None):
+        """Same arguments as PitchGrid.from_pitch_classes."""
+        return cls(pcs, root, min_midi, max_midi, name=name)
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return PitchGrid(it)
+
+    # ------------------------------------------------------------------
+    # point numbers
+    # ------------------------------------------------------------------
+    def _point(self, g: int) -> float:
+        """MIDI value of point number g."""
+        octave, i = divmod(g, len(self._pcList))
+        return (self.rootPC + octave * 12.0) + self._pcList[i]
+
+    def _points(self, g):
+        """Vectorized _point for integer arrays."""
+        octave, i = np.divmod(g, len(self.pcs))
+        return (self.rootPC + octave * 12.0) + self.pcs[i]
+
+    def _nearest_g_scalar(self, value) -> int:
+        """_nearest_g for one value, without NumPy overhead."""
+        octave, offset = divmod(float(value) - self.rootPC, 12.0)
+        wrapped = self._wrappedList
+        j = min(max(bisect.bisect_left(wrapped, offset), 1), len(wrapped) - 1)
+        if offset - wrapped[j - 1] <= wrapped[j] - offset:
+            j -= 1
+        return int(octave) * len(self._pcList) + (j - 1)
+
+    def _nearest_g(self, values):
+        """Point number of the nearest point for each value (ties → lower)."""
+        n = len(self.pcs)
+        octave, offset = np.divmod(values - self.rootPC, 12.0)
+        j = _nearest_indices(self._wrapped, np.atleast_1d(offset))
+        g = octave.astype(np.int64) * n + (j - 1)
+        return g.reshape(np.shape(values))
+
+    # ------------------------------------------------------------------
+    # set interface
+    # ------------------------------------------------------------------
+    def __contains__(self, value):
+        if not isinstance(value, numbers.Real) or not self or not math.isfinite(value):
+            return False
+        g = self._nearest_g_scalar(value)
+        return self._low <= g <= self._high and self._point(g) == value
+
+    def __iter__(self):
+        return (self._point(g) for g in range(self._low, self._high + 1))
+
+    def __len__(self):
+        return max(self._high - self._low + 1, 0)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(pcs={self.pcs.tolist()!r}, "
+                f"rootPC={self.rootPC!r}, min_midi={self.minMidi!r}, "
+                f"max_midi={self.maxMidi!r}, name={self.name!r})")
+
+    @property
+    def array(self):
+        """The points as a (freshly materialised) float64 array."""
+        return self._points(np.arange(self._low, self._high + 1))
+
+    def sorted(self):
+        """Return grid values in sorted order."""
+        return list(self)
+
+    def to_pitch_grid(self):
+        """Materialise as a PitchGrid with the same points and name."""
+        return PitchGrid(self, name=self.name)
+
+    def check_types(self, expected_type=None):
+        if not self or expected_type is None:
+            return True
+        return isinstance(self._point(self._low), expected_type)
+
+    def is_comparable(self, value) -> bool:
+        return bool(self) and isinstance(value, numbers.Real)
+
+    # ------------------------------------------------------------------
+    # quantisation
+    # ------------------------------------------------------------------
+    def quantise(self, value):
+        """Return the closest point of the grid to `value`."""
+        if not self:
+            raise ValueError("closest: Grid is empty — cannot find closest element.")
+        if not self.is_comparable(value):
+            raise TypeError(
+                f"closest: Value {value!r} is not comparable with elements of the Grid."
+            )
+        if not math.isfinite(value):
+            raise ValueError(f"closest: Value {value!r} is not a finite pitch.")
+        g = self._nearest_g_scalar(value)
+        return self._point(min(max(g, self._low), self._high))
+
+    def quantise_many(self, values):
+        """
+        Vectorized quantise, see Grid.quantise_many; indices are the
+        positions of the quantised points in self.sorted(). Non-finite
+        values quantise to nan with index -1.
+        """
+        if not self:
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
         try:
-            pcs = SCALE_MASKS_12TET[mode_key]
-        except KeyError as exc:
-            raise KeyError(f"Unknown church mode: {mode!r}") from exc
+            values = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise TypeError(
+                "quantise_many: values are not comparable with elements of the Grid."
+            ) from exc
 
-        # reuse your from_pitch_classes constructor
-        return cls.from_pitch_classes(
-            pcs=pcs,
-            root=root,
-            min_midi=min_midi,
-            max_midi=max_midi,
-            name=name or mode_key,
-        )
+        finite = np.isfinite(values)
+        g = np.clip(self._nearest_g(np.where(finite, values, self.rootPC)), self._low, self._high)
+        quantised = np.where(finite, self._points(g), np.nan)
+        return quantised, np.where(finite, g - self._low, -1), quantised - values
+
+
+# ---------------------------------------------------------------------------
+# ExactPitchGrid — integer pitch units
+#   a pitch of `midi` semitones is midi * unitsPerOctave / 12 units; the
+#   default 3600 units per octave make cents and every accidental of
+#   Pitch (down to 1/6 semitone) whole numbers, N-EDO steps need a
+#   multiple of N (see ExactPitchGrid.from_system).
+# ---------------------------------------------------------------------------
+
+DEFAULT_UNITS_PER_OCTAVE = 3600
+
+
+def midi_to_units(midi, unitsPerOctave: int = DEFAULT_UNITS_PER_OCTAVE) -> int:
+    """
+    Exact integer units of a MIDI value. Ints and Fractions must land on
+    a unit exactly; floats may be off by float noise (1e-6 units).
+    """
+    if isinstance(midi, numbers.Rational):
+        units = Fraction(midi) * unitsPerOctave / 12
+        if units.denominator == 1:
+            return int(units)
+    elif isinstance(midi, numbers.Real):
+        units = float(midi) * unitsPerOctave / 12
+        if abs(units - round(units)) <= 1e-6:
+            return int(round(units))
+    else:
+        raise TypeError(f"midi_to_units: {midi!r} is not a numeric (MIDI) value.")
+    raise ValueError(
+        f"midi_to_units: {midi!r} is not a whole number of 1/{unitsPerOctave} octave.")
+
+
+def units_to_midi(units, unitsPerOctave: int = DEFAULT_UNITS_PER_OCTAVE):
+    """Float MIDI of integer units (int → float, arrays → float64 arrays)."""
+    if isinstance(units, numbers.Integral):
+        return units * 12 / unitsPerOctave
+    return np.asarray(units, dtype=np.int64) * 12 / unitsPerOctave
+
+
+class ExactPitchGrid(_PitchClassConstructors, Grid):
+    """
+    A PitchGrid whose points are exact integer pitch units instead of
+    float semitones.
+
+    Values are given (and returned by the *_midi methods) as MIDI, but
+    stored as ints: near-equal floats such as 60 + 1/3 computed in two
+    different ways become the same point, and membership, unions of
+    grids with the same unitsPerOctave and quantise_units_many are exact
+    integer operations. Iteration, `in` and sorted() work on units.
+    """
+
+    def __init__(self, values=None, name=None, unitsPerOctave=DEFAULT_UNITS_PER_OCTAVE):
+        if unitsPerOctave <= 0 or unitsPerOctave % 12:
+            raise ValueError("ExactPitchGrid: unitsPerOctave must be a positive multiple of 12.")
+        self.unitsPerOctave = int(unitsPerOctave)
+        self.name = name
+        self._unitsIndex = None
+        if values is not None:
+            values = list(values)   # may be a one-shot iterator
+            if not all(isinstance(v, numbers.Real) for v in values):
+                raise TypeError("ExactPitchGrid expects numeric (MIDI) values only.")
+            values = [midi_to_units(v, self.unitsPerOctave) for v in values]
+        super().__init__(values)
 
     @classmethod
-    def from_sruti_raga(cls, raga_name, root, min_midi, max_midi, name=None):
+    def from_units(cls, units, name=None, unitsPerOctave=DEFAULT_UNITS_PER_OCTAVE):
+        """Create the grid directly from integer units."""
+        grid = cls(name=name, unitsPerOctave=unitsPerOctave)
+        grid.update(int(u) for u in units)
+        return grid
+
+    # ---- conversions ----
+    def to_units(self, midi) -> int:
+        return midi_to_units(midi, self.unitsPerOctave)
+
+    def to_midi(self, units):
+        return units_to_midi(units, self.unitsPerOctave)
+
+    def _units_array(self):
+        """Sorted points as an int64 array, cached with the sorted index."""
+        index = self._sorted_index()
+        if self._unitsIndex is None or self._unitsIndex[0] is not index:
+            self._unitsIndex = (index, np.asarray(index[0], dtype=np.int64))
+        return self._unitsIndex[1]
+
+    @property
+    def midis(self):
+        """The points in ascending order as float64 MIDI."""
+        return self.to_midi(self._units_array())
+
+    def contains_midi(self, midi) -> bool:
+        try:
+            return self.to_units(midi) in self
+        except (TypeError, ValueError):
+            return False
+
+    def to_pitch_grid(self):
+        """Float PitchGrid with the same points and name."""
+        return PitchGrid(self.midis.tolist(), name=self.name)
+
+    # ---- quantisation ----
+    def quantise_units_many(self, units):
         """
-        Construct a PitchGrid from a 22-Śruti raga mask (e.g. 'abhogi')
-        and a root (MIDI or note name).
+        Vectorized integer quantisation: (quantised, indices, errors) as
+        int64 arrays, see Grid.quantise_many.
         """
-        pcs = get_sruti_mask(raga_name)
-        return cls.from_pitch_classes(pcs, root=root,
-                                    min_midi=min_midi,
-                                    max_midi=max_midi,
-                                    name=name or raga_name)
-    
+        array = self._units_array()
+        if not len(array):
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
+        units = np.asarray(units, dtype=np.int64)
+        indices = _nearest_indices(array, units)
+        quantised = array[indices]
+        return quantised, indices, quantised - units
+
+    def quantise_midi(self, midi) -> float:
+        """Nearest point to a float MIDI value, as float MIDI."""
+        return self.to_midi(self.quantise(float(midi) * self.unitsPerOctave / 12))
+
+    def quantise_midi_many(self, midis):
+        """Vectorized quantise_midi; returns (quantised, indices, errors) in MIDI."""
+        array = self._units_array()
+        if not len(array):
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
+        midis = np.asarray(midis, dtype=np.float64)
+        indices = _nearest_indices(array, midis * self.unitsPerOctave / 12)
+        quantised = self.to_midi(array[indices])
+        return quantised, indices, quantised - midis
+
+    # ---- constructors ----
+    @classmethod
+    def from_notes(cls, notes, name=None, unitsPerOctave=DEFAULT_UNITS_PER_OCTAVE):
+        """Like PitchGrid.from_notes, note names are parsed exactly."""
+        if notes is None:
+            return cls(name=name, unitsPerOctave=unitsPerOctave)
+        values = [n if isinstance(n, numbers.Number) else note2midi(str(n), exact=True)
+                  for n in notes]
+        return cls(values, name=name, unitsPerOctave=unitsPerOctave)
+
+    @classmethod
+    def from_pitch_classes(cls, pcs, root, min_midi, max_midi, name=None,
+                           unitsPerOctave=DEFAULT_UNITS_PER_OCTAVE):
+        """
+        Like PitchGrid.from_pitch_classes, computed in integer units.
+        pcs may be Fractions (e.g. EDO_SYSTEMS_EXACT) to stay exact.
+        """
+        if isinstance(root, str):
+            root = note2midi(root, exact=True)
+        elif not isinstance(root, (int, float, Fraction)):
+            raise TypeError("root must be a MIDI number or pitch name string")
+        octave = int(unitsPerOctave)
+        root_pc = midi_to_units(root, octave) % octave
+        pcs = [midi_to_units(p, octave) for p in pcs]
+
+        low, high = sorted((Fraction(min_midi), Fraction(max_midi)))
+        low = math.ceil(low * octave / 12)
+        high = math.floor(high * octave / 12)
+
+        units = (root_pc + o * octave + p for o in range(12) for p in pcs)
+        return cls.from_units((u for u in units if low <= u <= high),
+                              name=name, unitsPerOctave=octave)
+
+    @classmethod
+    def from_range(cls, low_midi=0, high_midi=127, step=1, name=None,
+                   unitsPerOctave=DEFAULT_UNITS_PER_OCTAVE):
+        """Every `step` semitones from low_midi up to high_midi (inclusive)."""
+        if step <= 0:
+            raise ValueError("step must be > 0")
+        low, high = sorted((low_midi, high_midi))
+        low = midi_to_units(low, unitsPerOctave)
+        high = math.floor(Fraction(high) * unitsPerOctave / 12)
+        step = midi_to_units(step, unitsPerOctave)
+        return cls.from_units(range(low, high + 1, step), name=name,
+                              unitsPerOctave=unitsPerOctave)
+
+    @classmethod
+    def from_system(cls, system, root, min_midi, max_midi, name=None):
+        """
+        Grid of a named pitch-class system (see get_system_pitch_classes).
+        'edoN' systems use their exact steps and lcm(3600, N) units per
+        octave.
+        """
+        key = str(system).lower()
+        n = _edo_size(key)
+        if n is not None:
+            pcs = _edo_pitch_classes(n, exact=True)
+            units = math.lcm(DEFAULT_UNITS_PER_OCTAVE, n)
+        else:
+            pcs = get_system_pitch_classes(key)
+            units = DEFAULT_UNITS_PER_OCTAVE
+        return cls.from_pitch_classes(pcs, root, min_midi, max_midi,
+                                      name=name or key, unitsPerOctave=units)
 
 
 # ---------------------------------------------------------------------------
@@ -146,22 +644,53 @@ class PitchGrid(Grid):
 #   - all values are in *semitones* relative to a given root
 # ---------------------------------------------------------------------------
 
-def _edo_pitch_classes(n: int):
-    """Return N pitch classes for an N-EDO system in semitones from 0–12."""
+def _edo_pitch_classes(n: int, exact: bool = False):
+    """
+    Return N pitch classes for an N-EDO system in semitones from 0–12
+    (as exact Fractions with exact=True).
+    """
     if n <= 0:
         raise ValueError("EDO must be > 0")
+    if exact:
+        return [Fraction(12 * i, n) for i in range(n)]
     step = 12.0 / float(n)
     return [i * step for i in range(n)]
 
 
-EDO_SYSTEMS = {
-    "edo11": _edo_pitch_classes(11),
-    "edo12": _edo_pitch_classes(12),
-    "edo22": _edo_pitch_classes(22),
-    "edo24": _edo_pitch_classes(24),
-    "edo53": _edo_pitch_classes(53),
-    "edo72": _edo_pitch_classes(72),
-}
+def _edo_size(system: str):
+    """N for an 'edoN' system name, else None."""
+    match = re.fullmatch(r"edo(\d+)", system)
+    return int(match.group(1)) if match and int(match.group(1)) > 0 else None
+
+
+class _LazyEDOTable(Mapping):
+    """
+    Read-only {'edoN': pitch classes} for a fixed set of N; each entry
+    is computed on first access and cached.
+    """
+
+    def __init__(self, sizes, exact=False):
+        self._names = [f"edo{n}" for n in sizes]
+        self._exact = exact
+        self._lists = {}
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        if name not in self._lists:
+            self._lists[name] = _edo_pitch_classes(_edo_size(name), exact=self._exact)
+        return self._lists[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+_STANDARD_EDOS = (11, 12, 22, 24, 53, 72)
+EDO_SYSTEMS = _LazyEDOTable(_STANDARD_EDOS)
+EDO_SYSTEMS_EXACT = _LazyEDOTable(_STANDARD_EDOS, exact=True)
 ####################################################################################################
 PARTCH_43 = [
     0.0, 0.22, 0.53, 0.84, 1.12, 1.51, 1.65, 1.82, 2.04, 2.31, 
@@ -208,27 +737,14 @@ def get_sruti_mask(raga_name: str):
 
 def get_system_pitch_classes(system: str):
     """
-    Return a list of pitch classes (in semitones 0–12) for a named system.
-
-    Supported now:
-    - 'edo12', 'edo22', 'edo24', 'edo53', 'edo72'
-    - 'partch43' (if PARTCH_43_PITCH_CLASSES is filled)
-    - any key in HISTORICAL_TUNINGS
+    Return a list of pitch classes (in semitones 0–12) for a named system
+    of TUNING_SYSTEMS:
+    - 'edoN' for any N > 0 ('edo12', 'edo31', 'edo72', ...)
+    - 'partch43'
+    - any key in HISTORICAL_EUROPEAN_TUNINGS
+    - any system added with TUNING_SYSTEMS.register()
     """
-    system = system.lower()
-
-    if system in EDO_SYSTEMS:
-        return EDO_SYSTEMS[system]
-
-    if system == "partch43":
-        if not PARTCH_43:
-            raise NotImplementedError("PARTCH 43 pitch classes not filled yet.")
-        return PARTCH_43
-
-    if system in HISTORICAL_EUROPEAN_TUNINGS:
-        return HISTORICAL_EUROPEAN_TUNINGS[system]
-
-    raise KeyError(f"Unknown pitch-class system: {system!r}")
+    return list(TUNING_SYSTEMS.pitch_classes(system))
 
 
 # ---------------------------------------------------------------------------
@@ -247,3 +763,190 @@ SCALE_MASKS_12TET = {
     "locrian":   [0, 1, 3, 5, 6, 8, 10],
 }
 
+
+# ---------------------------------------------------------------------------
+# Shared grid cache
+#   get_pitch_grid() returns one FrozenPitchGrid per
+#   (system/mode, root, min_midi, max_midi, step), least recently used
+#   grids are evicted beyond maxsize.
+# ---------------------------------------------------------------------------
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions maxsize currsize")
+
+
+class PitchGridCache:
+    """Thread-safe bounded LRU cache of built grids with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError("PitchGridCache: maxsize must be > 0")
+        self.maxsize = int(maxsize)
+        self._grids = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, build):
+        """Return the grid cached under key, calling build() on a miss."""
+        with self._lock:
+            grid = self._grids.get(key)
+            if grid is not None:
+                self._grids.move_to_end(key)
+                self.hits += 1
+                return grid
+            self.misses += 1
+            grid = self._grids[key] = build()
+            if len(self._grids) > self.maxsize:
+                self._grids.popitem(last=False)
+                self.evictions += 1
+            return grid
+
+    def evict_system(self, system: str):
+        """Drop all grids built for a system (keys starting with it)."""
+        with self._lock:
+            for key in [k for k in self._grids if k[0] == system]:
+                del self._grids[key]
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._grids))
+
+    def clear(self):
+        """Drop all grids and reset the counters."""
+        with self._lock:
+            self._grids.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._grids)
+
+
+PITCH_GRID_CACHE = PitchGridCache()
+
+
+def get_pitch_grid(system: str, root="c4", min_midi=0, max_midi=127, step=1.0):
+    """
+    Return a shared FrozenPitchGrid from PITCH_GRID_CACHE.
+
+    system is one of
+      - 'range'                   → from_range(min_midi, max_midi, step)
+      - a church mode             → fromChurchModes (SCALE_MASKS_12TET)
+      - a 22-Śruti raga           → from_sruti_raga (SCALE_MASKS_22SRUTI)
+      - a pitch-class system      → from_pitch_classes(get_system_pitch_classes)
+    root is ignored for 'range', step for everything else.
+    """
+    system = str(system).lower()
+    min_midi, max_midi = sorted((float(min_midi), float(max_midi)))
+    if system == "range":
+        if step <= 0:
+            raise ValueError("step must be > 0")
+        key = (system, None, min_midi, max_midi, float(step))
+        build = lambda: FrozenPitchGrid.from_range(min_midi, max_midi, step, name=system)
+        return PITCH_GRID_CACHE.get(key, build)
+
+    root = _normalize_root(root)
+    key = (system, root, min_midi, max_midi, None)
+    if system in SCALE_MASKS_12TET:
+        build = lambda: FrozenPitchGrid.fromChurchModes(system, root, min_midi, max_midi)
+    elif system in SCALE_MASKS_22SRUTI:
+        build = lambda: FrozenPitchGrid.from_sruti_raga(system, root, min_midi, max_midi)
+    else:
+        pcs = get_system_pitch_classes(system)
+        build = lambda: FrozenPitchGrid.from_pitch_classes(
+            pcs, root, min_midi, max_midi, name=system)
+    return PITCH_GRID_CACHE.get(key, build)
+
+
+# ---------------------------------------------------------------------------
+# Tuning-system registry
+#   name → pitch classes, resolved lazily and cached as tuples and as
+#   sorted read-only arrays; 'edoN' works for any N without registering.
+# ---------------------------------------------------------------------------
+
+class TuningSystemRegistry:
+    def __init__(self):
+        self._sources = {}
+        self._resolved = {}
+        self._arrays = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, pitchClasses, replace: bool = False):
+        """
+        Register a system: pitchClasses is an iterable of pitch classes
+        (semitones 0–12 above the root) or a zero-argument callable
+        returning one, which is only called on first use.
+        Re-registering a name requires replace=True and drops its
+        cached grids.
+        """
+        name = str(name).lower()
+        with self._lock:
+            if name in self._sources and not replace:
+                raise ValueError(f"Pitch-class system {name!r} is already registered.")
+            self._sources[name] = pitchClasses if callable(pitchClasses) else tuple(pitchClasses)
+            self._resolved.pop(name, None)
+            self._arrays.pop(name, None)
+        PITCH_GRID_CACHE.evict_system(name)
+
+    def unregister(self, name: str):
+        """Remove a registered system and its cached grids."""
+        name = str(name).lower()
+        with self._lock:
+            del self._sources[name]
+            self._resolved.pop(name, None)
+            self._arrays.pop(name, None)
+        PITCH_GRID_CACHE.evict_system(name)
+
+    def names(self):
+        """Registered names ('edoN' resolves for every N on top of these)."""
+        return sorted(self._sources)
+
+    def __contains__(self, name):
+        name = str(name).lower()
+        return name in self._sources or _edo_size(name) is not None
+
+    def pitch_classes(self, name: str) -> tuple:
+        """The pitch classes of a system, in registration order."""
+        name = str(name).lower()
+        pcs = self._resolved.get(name)
+        if pcs is not None:
+            return pcs
+        with self._lock:
+            if name in self._sources:
+                source = self._sources[name]
+                pcs = tuple(source() if callable(source) else source)
+            elif _edo_size(name) is not None:
+                pcs = tuple(_edo_pitch_classes(_edo_size(name)))
+            else:
+                raise KeyError(f"Unknown pitch-class system: {name!r}")
+            if not pcs or not all(isinstance(p, numbers.Real) for p in pcs):
+                raise ValueError(f"Pitch-class system {name!r} needs numeric pitch classes.")
+            self._resolved[name] = pcs
+        return pcs
+
+    def array(self, name: str):
+        """The pitch classes as a sorted, unique, read-only float64 array."""
+        name = str(name).lower()
+        array = self._arrays.get(name)
+        if array is None:
+            array = np.unique(np.asarray(self.pitch_classes(name), dtype=np.float64))
+            array.flags.writeable = False
+            self._arrays[name] = array
+        return array
+
+    def grid(self, name: str, root="c4", min_midi=0, max_midi=127):
+        """Shared FrozenPitchGrid of a system (see get_pitch_grid)."""
+        return get_pitch_grid(name, root, min_midi, max_midi)
+
+    def modular_grid(self, name: str, root="c4", min_midi=0, max_midi=127):
+        """ModularPitchGrid of a system, built from its cached array."""
+        return ModularPitchGrid(self.array(name), root, min_midi, max_midi,
+                                name=str(name).lower())
+
+
+TUNING_SYSTEMS = TuningSystemRegistry()
+for _n in _STANDARD_EDOS:
+    TUNING_SYSTEMS.register(f"edo{_n}", lambda _name=f"edo{_n}": EDO_SYSTEMS[_name])
+TUNING_SYSTEMS.register("partch43", PARTCH_43)
+for _name, _pcs in HISTORICAL_EUROPEAN_TUNINGS.items():
+    TUNING_SYSTEMS.register(_name, _pcs)
+del _n, _name, _pcs
@@ -1,5 +1,6 @@
 from .Instrument import Instrument
 from .Event import Event
+from .TempoMap import TempoMap
 ################################################################################
 ################################################################################
 class Player:
@@ -9,11 +10,17 @@ class Player:
             minNoteDurationSec = 1/12,
             maxNoteDurationSec = 20,
             minRestDurationSec = 1/12,
-            bpm = 120
+            bpm = 120,
+            tempoMap = None,
+            timeGrid = None
     ):
         self.name = name
         self.instrument = instrument
         self.bpm = bpm
+        """own clock for polytemporal compositions: a TempoMap (or its list
+        of changes) and/or a ready-made TimeGrid; None = use bpm"""
+        self.tempoMap = tempoMap
+        self.timeGrid = timeGrid
         """initialize the event list with 1 min of silence"""
         self.eventList = [Event(0,60,-100,0,bpm = bpm)]
         self.startTimesSec = []
@@ -23,11 +30,24 @@ class Player:
         self.maxNoteDurationSec = maxNoteDurationSec
         self.minRestDurationSec= minRestDurationSec
 
+    @property
+    def tempoMap(self):
+        return self._tempoMap
+
+    @tempoMap.setter
+    def tempoMap(self, tempoMap):
+        """a list of changes becomes a TempoMap, so later edits of the
+        list cannot change the clock behind cached player grids"""
+        if tempoMap is not None and not isinstance(tempoMap, TempoMap):
+            tempoMap = TempoMap(tempoMap)
+        self._tempoMap = tempoMap
+
     def addEvent(self,startTimeSec = 0, durationSec = 1.5,
-                 dynamicdB = -14, pitchesMidi = 60,bpm = 60):
+                 dynamicdB = -14, pitchesMidi = 60,bpm = 60, ppq = None):
         self.eventList.append(
             Event(startTimeSec=startTimeSec, durationSec=durationSec,
-                  dynamicdB=dynamicdB, pitchesMidi=pitchesMidi, bpm = bpm)
+                  dynamicdB=dynamicdB, pitchesMidi=pitchesMidi, bpm = bpm,
+                  ppq = ppq)
         )
 
     def sortEventsByTime(self):
@@ -1,18 +1,182 @@
 import random
 import math
 import numbers
+from collections.abc import Set
+
+import numpy as np
+
+
+def _nearest_indices(array, values):
+    """
+    Indices of the nearest element of the sorted 1-D `array` for every
+    entry in `values` (ties resolve to the lower element), with the
+    shape of `values` (0-d for a scalar).
+    """
+    values = np.asarray(values)
+    if len(array) == 1:
+        return np.zeros(values.shape, dtype=np.intp)
+    flat = np.atleast_1d(values)
+    idx = np.searchsorted(array, flat)
+    np.clip(idx, 1, len(array) - 1, out=idx)
+    lower = array[idx - 1]
+    upper = array[idx]
+    idx -= (flat - lower <= upper - flat)
+    return idx.reshape(values.shape)
+
+
+def _is_float64(value):
+    """True if `value` is a real number that float64 holds exactly."""
+    if isinstance(value, float):
+        return True
+    if not isinstance(value, numbers.Real):
+        return False
+    try:
+        return float(value) == value
+    except OverflowError:
+        return False
+
+
+def _append_to_buffer(buffer, size, values):
+    """
+    Write `values` behind the first `size` entries of the float64 `buffer`,
+    growing it geometrically (amortised doubling) when it is full.
+    Returns the (possibly reallocated) buffer.
+    """
+    needed = size + len(values)
+    if buffer is None or needed > len(buffer):
+        capacity = max(needed, 2 * (len(buffer) if buffer is not None else 0), 16)
+        grown = np.empty(capacity, dtype=np.float64)
+        if buffer is not None:
+            grown[:size] = buffer[:size]
+        buffer = grown
+    buffer[size:needed] = values
+    return buffer
 
 
 class Grid(set):
     """A grid is just a specialized set with optional helper methods."""
     
     def __init__(self, values=None):
+        # sorted lookup index, built lazily by _sorted_index()
+        self._index = None
         # values can be None, iterable, or another set
         super().__init__(values if values is not None else [])
     
     def sorted(self):
         """Return grid values in sorted order."""
-        return sorted(self)
+        return list(self._sorted_index()[0])
+
+    # ------------------------------------------------------------------
+    # sorted index
+    #   (values, array): the grid values in sorted order and, when every
+    #   value is exact in float64, the same values as a float64 array
+    #   (else None: large ints, Fractions, ... take the exact scan).
+    #   Every mutating set method drops the index, it is rebuilt on
+    #   the next lookup.
+    # ------------------------------------------------------------------
+    def _sorted_index(self):
+        if self._index is None:
+            values = sorted(self)
+            array = None
+            if all(_is_float64(v) for v in values):
+                array = np.asarray(values, dtype=np.float64)
+            self._index = (values, array)
+            # the array is a view on this (over-allocated) buffer once
+            # _append_sorted() has grown it
+            self._index_buffer = array
+        return self._index
+
+    def _append_sorted(self, values):
+        """
+        Add `values` (strictly ascending, all above the current maximum)
+        and keep the sorted index instead of dropping it. Costs amortised
+        O(len(values)); falls back to update() if the order assumption
+        does not hold.
+        """
+        values = [v for v in values if v not in self]
+        if not values:
+            return
+        if self._index is None:
+            super().update(values)
+            return
+
+        sorted_values, array = self._index
+        if sorted_values and not values[0] > sorted_values[-1] \
+                or any(not a < b for a, b in zip(values, values[1:])):
+            self.update(values)
+            return
+        if array is not None and not all(_is_float64(v) for v in values):
+            self.update(values)
+            return
+
+        super().update(values)
+        sorted_values.extend(values)
+        if array is not None:
+            size = len(array)
+            self._index_buffer = _append_to_buffer(self._index_buffer, size, values)
+            array = self._index_buffer[:len(sorted_values)]
+        self._index = (sorted_values, array)
+
+    def __copy__(self):
+        # _append_sorted() extends the sorted index and its buffer in
+        # place, so a copy must not share them
+        new = self.__class__.__new__(self.__class__)
+        set.update(new, self)
+        # set in the dict directly: subclasses may guard __setattr__
+        new.__dict__.update(self.__dict__, _index=None, _index_buffer=None)
+        return new
+
+    def add(self, value):
+        self._index = None
+        super().add(value)
+
+    def discard(self, value):
+        self._index = None
+        super().discard(value)
+
+    def remove(self, value):
+        self._index = None
+        super().remove(value)
+
+    def pop(self):
+        self._index = None
+        return super().pop()
+
+    def clear(self):
+        self._index = None
+        super().clear()
+
+    def update(self, *others):
+        self._index = None
+        super().update(*others)
+
+    def difference_update(self, *others):
+        self._index = None
+        super().difference_update(*others)
+
+    def intersection_update(self, *others):
+        self._index = None
+        super().intersection_update(*others)
+
+    def symmetric_difference_update(self, other):
+        self._index = None
+        super().symmetric_difference_update(other)
+
+    def __ior__(self, other):
+        self._index = None
+        return super().__ior__(other)
+
+    def __iand__(self, other):
+        self._index = None
+        return super().__iand__(other)
+
+    def __isub__(self, other):
+        self._index = None
+        return super().__isub__(other)
+
+    def __ixor__(self, other):
+        self._index = None
+        return super().__ixor__(other)
     
     def check_types(self, expected_type=None):
         """
@@ -66,6 +230,11 @@ class Grid(set):
         Steps:
           1. Check comparability
           2. Return the element with minimal absolute difference
+
+        Numeric grids answer this with a binary search on the sorted
+        index plus a comparison of the two neighbours (ties resolve to
+        the lower grid point). Other comparable grids, and values that
+        float64 cannot hold exactly, fall back to a linear scan.
         """
         if not self:
             raise ValueError("closest: Grid is empty — cannot find closest element.")
@@ -75,8 +244,50 @@ class Grid(set):
                 f"closest: Value {value!r} is not comparable with elements of the Grid."
             )
 
-        # compute minimum by distance
-        return min(self, key=lambda x: abs(x - value))
+        values, array = self._sorted_index()
+        if array is None or not _is_float64(value):
+            # compute minimum by distance
+            return min(self, key=lambda x: abs(x - value))
+
+        i = int(np.searchsorted(array, value))
+        if i == 0:
+            return values[0]
+        if i == len(values):
+            return values[-1]
+        if value - array[i - 1] <= array[i] - value:
+            return values[i - 1]
+        return values[i]
+
+    def quantise_many(self, values):
+        """
+        Quantise an array of values against the Grid in one vectorized pass.
+
+        Returns a tuple (quantised, indices, errors) of NumPy arrays with
+        the shape of `values`:
+          - quantised: the closest grid value for each input (float64)
+          - indices:   position of that value in self.sorted()
+          - errors:    signed quantisation error, quantised - value
+
+        Only numeric grids whose values float64 holds exactly are
+        supported.
+        """
+        if not self:
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
+
+        _, array = self._sorted_index()
+        if array is None:
+            raise TypeError("quantise_many: only Grids of float64-exact numbers can be quantised in batch.")
+
+        try:
+            values = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise TypeError(
+                "quantise_many: values are not comparable with elements of the Grid."
+            ) from exc
+
+        indices = _nearest_indices(array, values)
+        quantised = array[indices]
+        return quantised, indices, quantised - values
     
     
     
@@ -192,4 +403,323 @@ class Grid(set):
         for _ in range(size - 2):
             values.append(values[-1] + values[-2])
 
-        return cls(values)
\ No newline at end of file
+        return cls(values)
+
+
+####################################################################################################
+####################################################################################################
+# ArrayGrid  — compact storage mode
+
+class ArrayGrid(Set):
+    """
+    A numeric grid stored as one sorted, de-duplicated float64 array.
+
+    Read-only counterpart of Grid for large grids: membership, iteration
+    (in ascending order), sorted(), quantise/quantise_many and the
+    fill/series/geom/interpolation/rand/fib constructors behave like
+    on Grid, but every point costs 8 bytes instead of a boxed float and
+    a hash-table slot, and the regular constructors are single NumPy
+    calls. Points are always floats, also for integer input. Set
+    operators (|, &, -, ==, <=, ...) work against Grids and plain sets.
+    """
+
+    def __init__(self, values=None):
+        if values is None:
+            array = np.empty(0, dtype=np.float64)
+        elif isinstance(values, ArrayGrid):
+            array = values._array
+        else:
+            if not isinstance(values, np.ndarray):
+                values = np.fromiter(values, dtype=np.float64)
+            array = np.unique(np.asarray(values, dtype=np.float64).ravel())
+        array.flags.writeable = False
+        self._array = array
+        # over-allocated storage behind _array, see _append_sorted()
+        self._buffer = None
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # results of set operators are plain ArrayGrids, not subclasses
+        return ArrayGrid(it)
+
+    def _set_array(self, array):
+        array.flags.writeable = False
+        self._array = array
+        self._buffer = None
+
+    def __copy__(self):
+        # _append_sorted() writes behind _array into _buffer, so a copy
+        # must not share the buffer (the read-only _array itself is fine)
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__, _buffer=None)
+        return new
+
+    def _append_sorted(self, values):
+        """
+        Append `values` (ascending, all above the current maximum) in
+        amortised O(len(values)): the points live in a buffer that grows
+        geometrically. Falls back to update() if the order assumption
+        does not hold.
+        """
+        values = np.unique(np.asarray(values, dtype=np.float64))
+        if not len(values):
+            return
+        size = len(self._array)
+        if size and not values[0] > self._array[-1]:
+            self.update(values)
+            return
+
+        if self._buffer is None:
+            self._buffer = self._array
+        self._buffer = _append_to_buffer(self._buffer, size, values)
+        array = self._buffer[:size + len(values)]
+        array.flags.writeable = False
+        self._array = array
+
+    # ------------------------------------------------------------------
+    # set-like API
+    # ------------------------------------------------------------------
+    def __contains__(self, value):
+        if not isinstance(value, numbers.Real):
+            return False
+        i = int(np.searchsorted(self._array, value))
+        return i < len(self._array) and self._array[i] == value
+
+    def __iter__(self):
+        return iter(self._array.tolist())
+
+    def __len__(self):
+        return len(self._array)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._array.tolist()!r})"
+
+    @property
+    def array(self):
+        """The grid points as a read-only, sorted float64 array."""
+        return self._array
+
+    def sorted(self):
+        """Return grid values in sorted order."""
+        return self._array.tolist()
+
+    def add(self, value):
+        """Add one point (rebuilds the array — prefer update() for many)."""
+        self.update([value])
+
+    def update(self, *others):
+        """Merge the points of all given iterables into the grid."""
+        array = self._array
+        for other in others:
+            array = np.union1d(array, ArrayGrid(other)._array)
+        self._set_array(array)
+
+    def check_types(self, expected_type=None):
+        """All points are floats, see Grid.check_types."""
+        if not self or expected_type is None:
+            return True
+        return isinstance(0.0, expected_type)
+
+    def is_comparable(self, value) -> bool:
+        """Only real numbers are comparable with the points of an ArrayGrid."""
+        return bool(self) and isinstance(value, numbers.Real)
+
+    # ------------------------------------------------------------------
+    # quantisation
+    # ------------------------------------------------------------------
+    def quantise(self, value):
+        """Return the closest grid point to `value` (ties resolve to the lower point)."""
+        if not self:
+            raise ValueError("closest: Grid is empty — cannot find closest element.")
+        if not self.is_comparable(value):
+            raise TypeError(
+                f"closest: Value {value!r} is not comparable with elements of the Grid."
+            )
+        i = _nearest_indices(self._array, np.array([value], dtype=np.float64))[0]
+        return float(self._array[i])
+
+    def quantise_many(self, values):
+        """Vectorized quantise, see Grid.quantise_many."""
+        if not self:
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
+        try:
+            values = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise TypeError(
+                "quantise_many: values are not comparable with elements of the Grid."
+            ) from exc
+
+        indices = _nearest_indices(self._array, values)
+        quantised = self._array[indices]
+        return quantised, indices, quantised - values
+
+    # ------------------------------------------------------------------
+    # constructors  (same signatures as on Grid)
+    # ------------------------------------------------------------------
+    @classmethod
+    def fill(cls, size: int, func_or_value):
+        if size < 0:
+            raise ValueError("size must be >= 0")
+        if callable(func_or_value):
+            return cls(np.fromiter(map(func_or_value, range(size)), dtype=np.float64, count=size))
+        return cls(np.full(size, func_or_value, dtype=np.float64))
+
+    @classmethod
+    def series(cls, start, step, size: int):
+        if size < 0:
+            raise ValueError("length must be >= 0")
+        return cls(start + np.arange(size) * step)
+
+    @classmethod
+    def geom(cls, start, ratio, size: int):
+        if size < 0:
+            raise ValueError("size must be >= 0")
+        return cls(start * np.power(float(ratio), np.arange(size)))
+
+    @classmethod
+    def interpolation(cls, start, end, size: int):
+        if size <= 0:
+            raise ValueError("length must be > 0")
+        if size == 1:
+            return cls([start])
+        step = (end - start) / (size - 1)
+        return cls(start + np.arange(size) * step)
+
+    @classmethod
+    def rand(cls, size: int, low=0.0, high=1.0, *, integer: bool = False):
+        """
+        `size` random values in [low, high], see Grid.rand. integer=True
+        draws whole numbers with randint, but like every ArrayGrid point
+        they are stored and returned as floats (3.0, not 3).
+        """
+        if size < 0:
+            raise ValueError("size must be >= 0")
+        if integer:
+            # inclusive on both ends, like random.randint
+            return cls(np.random.randint(int(low), int(high) + 1, size=size))
+        return cls(np.random.uniform(low, high, size=size))
+
+    @classmethod
+    def fib(cls, size: int, a=0, b=1):
+        return cls(Grid.fib(size, a, b))
+
+
+####################################################################################################
+# SeriesGrid  — lazy arithmetic series
+
+class SeriesGrid(Set):
+    """
+    The arithmetic series start, start+step, ... (`size` points) without
+    materialising it.
+
+    Points are computed as (start + i*step) / divisor. With the default
+    divisor=1 these are exactly the values of Grid.series(start, step,
+    size), so membership agrees with the materialised grid; integer
+    start/step with an integer divisor give correctly rounded rational
+    points (e.g. ticks / ppq). Membership, quantise and quantise_many
+    are O(1) per value regardless of size; iteration produces the points
+    on demand. `step` must be positive.
+    """
+
+    def __init__(self, start, step, size: int, divisor=1):
+        if size < 0:
+            raise ValueError("length must be >= 0")
+        if step <= 0:
+            raise ValueError("SeriesGrid: step must be > 0")
+        if divisor <= 0:
+            raise ValueError("SeriesGrid: divisor must be > 0")
+        self.start = start
+        self.step = step
+        self.size = int(size)
+        self.divisor = divisor
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return ArrayGrid(it)
+
+    @classmethod
+    def series(cls, start, step, size: int):
+        return cls(start, step, size)
+
+    def _point(self, k):
+        return (self.start + k * self.step) / self.divisor
+
+    def __contains__(self, value):
+        if not isinstance(value, numbers.Real) or not self.size or not math.isfinite(value):
+            return False
+        k = round((value * self.divisor - self.start) / self.step)
+        return 0 <= k < self.size and self._point(k) == value
+
+    def __iter__(self):
+        return (self._point(i) for i in range(self.size))
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(start={self.start!r}, step={self.step!r}, "
+                f"size={self.size!r}, divisor={self.divisor!r})")
+
+    @property
+    def array(self):
+        """The points as a (freshly materialised) float64 array."""
+        return self._point(np.arange(self.size))
+
+    def sorted(self):
+        """Return grid values in sorted order."""
+        return list(self)
+
+    def check_types(self, expected_type=None):
+        if not self or expected_type is None:
+            return True
+        return isinstance(self._point(1), expected_type)
+
+    def is_comparable(self, value) -> bool:
+        return bool(self.size) and isinstance(value, numbers.Real)
+
+    def _nearest_k(self, values):
+        """Index of the nearest point for each value (ties → lower point)."""
+        k0 = np.floor((values * self.divisor - self.start) / self.step)
+        k0 = np.clip(k0, 0, self.size - 1).astype(np.intp)
+        k1 = np.minimum(k0 + 1, self.size - 1)
+        p0 = self._point(k0)
+        p1 = self._point(k1)
+        return np.where(values - p0 <= p1 - values, k0, k1)
+
+    def quantise(self, value):
+        """Return the closest point of the series to `value`."""
+        if not self.size:
+            raise ValueError("closest: Grid is empty — cannot find closest element.")
+        if not self.is_comparable(value):
+            raise TypeError(
+                f"closest: Value {value!r} is not comparable with elements of the Grid."
+            )
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"closest: Value {value!r} is not finite.")
+        # scalar twin of _nearest_k, without the numpy call overhead
+        k0 = min(max(math.floor((value * self.divisor - self.start) / self.step), 0),
+                 self.size - 1)
+        k1 = min(k0 + 1, self.size - 1)
+        p0 = self._point(k0)
+        p1 = self._point(k1)
+        return p0 if value - p0 <= p1 - value else p1
+
+    def quantise_many(self, values):
+        """
+        Vectorized quantise, see Grid.quantise_many. Non-finite values
+        quantise to nan with index -1 (quantise raises ValueError).
+        """
+        if not self.size:
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
+        try:
+            values = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise TypeError(
+                "quantise_many: values are not comparable with elements of the Grid."
+            ) from exc
+
+        finite = np.isfinite(values)
+        indices = self._nearest_k(np.where(finite, values, self.start / self.divisor))
+        quantised = np.where(finite, np.asarray(self._point(indices), dtype=np.float64), np.nan)
+        return quantised, np.where(finite, indices, -1), quantised - values
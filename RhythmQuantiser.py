@@ -0,0 +1,150 @@
+import math
+import numpy as np
+
+
+def _default_complexity(subdiv: int) -> float:
+    """
+    Notational complexity of a beat subdivision: 0 for whole beats,
+    log2(s) for binary subdivisions (2, 4, 8, ...), s for tuplets.
+    """
+    if subdiv == 1:
+        return 0.0
+    if subdiv & (subdiv - 1) == 0:
+        return math.log2(subdiv)
+    return float(subdiv)
+
+
+class RhythmQuantiser:
+    def __init__(
+        self,
+        possibleSubdivision=None,
+        complexityWeight: float = 0.02,
+        changePenalty: float = 0.0,
+        complexity=None,
+    ):
+        """
+        Quantise time points so that every beat uses ONE subdivision.
+
+        Snapping each point to the union of all subdivisions mixes e.g. a
+        quintuplet and a septuplet inside one beat. Instead, for every
+        beat that contains points, one subdivision s from
+        possibleSubdivision is chosen by minimising
+
+            sum |quantised - raw| over the beat's points (in beats)
+            + complexityWeight * complexity[s]
+            + changePenalty   if s differs from the previous beat's choice
+                              (only between adjacent occupied beats)
+
+        The per-beat costs of all beats are built as one (beats x
+        subdivisions) matrix with vectorized NumPy calls; the change
+        penalty is resolved by dynamic programming over the occupied
+        beats. The cost is linear in the number of points.
+
+        complexity maps subdivision → cost (default: 0 for 1, log2(s) for
+        binary subdivisions, s for tuplets).
+        """
+        if possibleSubdivision is None:
+            possibleSubdivision = [1]
+        self.possibleSubdivision = sorted({int(s) for s in possibleSubdivision})
+        if not self.possibleSubdivision or self.possibleSubdivision[0] <= 0:
+            raise ValueError("RhythmQuantiser: subdivisions must be positive integers")
+
+        self.complexityWeight = float(complexityWeight)
+        self.changePenalty = float(changePenalty)
+        complexity = complexity or {}
+        self.complexity = {
+            s: float(complexity.get(s, _default_complexity(s)))
+            for s in self.possibleSubdivision
+        }
+
+        # integer tick timebase, as TimeGrid.ppq
+        self.ppq = math.lcm(*self.possibleSubdivision)
+
+    # ------------------------------------------------------------------
+    # cost model
+    # ------------------------------------------------------------------
+    def _snap(self, frac, subdiv):
+        """Nearest multiple of 1/subdiv (index k, 0..subdiv), ties → lower."""
+        return np.ceil(frac * subdiv - 0.5)
+
+    def cost_matrix(self, beats):
+        """
+        Return (occupiedBeats, costs, inverse) for raw beat positions:
+          - occupiedBeats: sorted int64 beat numbers that contain points
+          - costs: (len(occupiedBeats), len(possibleSubdivision)) array of
+            error + complexity cost of each subdivision per beat
+          - inverse: index into occupiedBeats for every point
+        """
+        beats = np.asarray(beats, dtype=np.float64).ravel()
+        beat_numbers = np.floor(beats)
+        occupied, inverse = np.unique(beat_numbers.astype(np.int64), return_inverse=True)
+        frac = beats - beat_numbers
+
+        costs = np.empty((len(occupied), len(self.possibleSubdivision)))
+        for j, subdiv in enumerate(self.possibleSubdivision):
+            error = np.abs(self._snap(frac, subdiv) / subdiv - frac)
+            costs[:, j] = np.bincount(inverse, weights=error, minlength=len(occupied))
+            costs[:, j] += self.complexityWeight * self.complexity[subdiv]
+        return occupied, costs, inverse
+
+    def choose_subdivisions(self, beats):
+        """
+        Return (occupiedBeats, subdivisions): the chosen subdivision for
+        every beat that contains at least one of the given points.
+        """
+        occupied, costs, _ = self.cost_matrix(beats)
+        return occupied, np.asarray(self.possibleSubdivision)[self._solve(occupied, costs)]
+
+    def _solve(self, occupied, costs):
+        """Column index per occupied beat minimising the total cost."""
+        n, k = costs.shape
+        if n == 0:
+            return np.empty(0, dtype=np.intp)
+        if self.changePenalty == 0.0:
+            return np.argmin(costs, axis=1)
+
+        # dynamic programming over occupied beats; changing subdivision
+        # only costs something between adjacent beats
+        change = self.changePenalty * (1.0 - np.eye(k))
+        adjacent = np.diff(occupied) == 1
+        back = np.zeros((n, k), dtype=np.intp)
+        total = costs[0].copy()
+        for i in range(1, n):
+            if adjacent[i - 1]:
+                options = total[:, None] + change  # previous choice x current choice
+                back[i] = np.argmin(options, axis=0)
+                total = options[back[i], np.arange(k)] + costs[i]
+            else:
+                back[i] = np.argmin(total)
+                total = total[back[i]] + costs[i]
+
+        choice = np.empty(n, dtype=np.intp)
+        choice[-1] = np.argmin(total)
+        for i in range(n - 1, 0, -1):
+            choice[i - 1] = back[i, choice[i]]
+        return choice
+
+    # ------------------------------------------------------------------
+    # quantisation
+    # ------------------------------------------------------------------
+    def quantise_ticks(self, beats):
+        """
+        Quantise raw beat positions; returns (ticks, subdivisions):
+        the quantised points as int64 ticks (self.ppq per beat) and the
+        subdivision used for each point, both with the shape of `beats`.
+        """
+        beats = np.asarray(beats, dtype=np.float64)
+        occupied, costs, inverse = self.cost_matrix(beats)
+        chosen = np.asarray(self.possibleSubdivision)[self._solve(occupied, costs)]
+
+        flat = beats.ravel()
+        beat_numbers = np.floor(flat)
+        subdivs = chosen[inverse]
+        k = self._snap(flat - beat_numbers, subdivs).astype(np.int64)
+        ticks = beat_numbers.astype(np.int64) * self.ppq + k * (self.ppq // subdivs)
+        return ticks.reshape(beats.shape), subdivs.reshape(beats.shape)
+
+    def quantise_beats(self, beats):
+        """Quantise raw beat positions; returns float beats."""
+        ticks, _ = self.quantise_ticks(beats)
+        return ticks / self.ppq
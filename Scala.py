@@ -0,0 +1,337 @@
+"""
+Scala tuning files (https://www.huygens-fokker.org/scala/scl_format.html)
+
+  .scl : a scale as cents or ratio lines, the last line being the period
+  .kbm : a keyboard mapping of MIDI keys to scale degrees
+
+ScalaArchive keeps a persistent index (name, size, period) of a
+directory of .scl files, so listing and searching never re-reads them;
+individual scales are parsed on first use and cached.
+"""
+
+import json
+import math
+import os
+import warnings
+from collections import Counter
+from fractions import Fraction
+
+import numpy as np
+
+from .PitchGrid import PitchGrid, TUNING_SYSTEMS
+
+
+# ---------------------------------------------------------------------------
+# parsing
+# ---------------------------------------------------------------------------
+
+def _data_lines(text):
+    """Lines of a Scala file without comments ('!')."""
+    return [line for line in text.splitlines() if not line.lstrip().startswith("!")]
+
+
+def _interval_cents(token: str) -> float:
+    """One .scl pitch line: '701.955' (cents, has a dot) or '3/2' / '2' (ratio)."""
+    value = token.split()[0] if token.split() else ""
+    try:
+        if "." in value:
+            return float(value)
+        ratio = Fraction(value)
+    except (ValueError, ZeroDivisionError) as exc:
+        raise ValueError(f"Scala: invalid pitch line {token!r}") from exc
+    if ratio <= 0:
+        raise ValueError(f"Scala: ratio must be positive, got {token!r}")
+    return 1200.0 * math.log2(ratio)
+
+
+class ScalaScale:
+    def __init__(self, name: str, description: str, cents):
+        """
+        A parsed .scl scale.
+
+        - cents: the pitch lines in cents above the tonic (not including
+          the implicit 0), the last one being the period
+        - pitchClasses: tonic + all degrees below the period, in semitones
+        - period: the repeating interval in semitones (12.0 for octaves)
+        """
+        if not len(cents):
+            raise ValueError(f"Scala: scale {name!r} has no pitches")
+        self.name = name
+        self.description = description
+        self.cents = tuple(float(c) for c in cents)
+        self.period = self.cents[-1] / 100.0
+        self.pitchClasses = tuple([0.0] + [c / 100.0 for c in self.cents[:-1]])
+
+    def __len__(self):
+        return len(self.cents)
+
+    def __repr__(self):
+        return f"ScalaScale({self.name!r}, size={len(self)}, period={self.period!r})"
+
+    @property
+    def is_octave_periodic(self) -> bool:
+        return abs(self.period - 12.0) < 1e-6
+
+    def degree_semitones(self, degrees):
+        """Semitones above the tonic of (vectorized) scale degrees, any octave."""
+        table = np.asarray(self.pitchClasses)
+        octave, index = np.divmod(np.asarray(degrees, dtype=np.int64), len(self))
+        return octave * self.period + table[index]
+
+    def grid(self, root, min_midi, max_midi, name=None):
+        """
+        PitchGrid of the scale on root (MIDI), repeated by its period
+        (which need not be an octave) within [min_midi, max_midi].
+        """
+        low, high = sorted((float(min_midi), float(max_midi)))
+        n = len(self)
+        first = math.floor((low - root) / self.period) * n
+        last = math.ceil((high - root) / self.period) * n + n
+        pitches = root + self.degree_semitones(np.arange(first, last + 1))
+        pitches = pitches[(pitches >= low) & (pitches <= high)]
+        return PitchGrid(pitches.tolist(), name=name or self.name)
+
+    def mapped_grid(self, mapping, name=None):
+        """PitchGrid of the MIDI pitches a KeyboardMapping assigns to its keys."""
+        return PitchGrid(mapping.key_pitches(self)[1].tolist(), name=name or self.name)
+
+
+def parse_scl(text: str, name: str = "scale") -> ScalaScale:
+    """Parse the contents of a .scl file."""
+    lines = _data_lines(text)
+    if len(lines) < 2:
+        raise ValueError(f"Scala: {name!r} is missing the description or note count")
+    description = lines[0].strip()
+    try:
+        count = int(lines[1].split()[0])
+    except (ValueError, IndexError) as exc:
+        raise ValueError(f"Scala: invalid note count in {name!r}") from exc
+    pitches = [line for line in lines[2:] if line.strip()]
+    if len(pitches) < count:
+        raise ValueError(f"Scala: {name!r} lists {len(pitches)} of {count} pitches")
+    return ScalaScale(name, description, [_interval_cents(p) for p in pitches[:count]])
+
+
+def load_scl(path) -> ScalaScale:
+    """Parse a .scl file; the scale is named after the file."""
+    with open(path, encoding="latin-1") as f:
+        return parse_scl(f.read(), name=os.path.splitext(os.path.basename(path))[0].lower())
+
+
+class KeyboardMapping:
+    def __init__(self, size, firstKey, lastKey, middleKey, referenceKey,
+                 referenceFreq, octaveDegree, mapping):
+        """
+        A parsed .kbm keyboard mapping: keys firstKey..lastKey are mapped
+        relative to middleKey (scale degree 0) through `mapping` (one
+        degree or None = unmapped per key of the pattern; empty = linear),
+        the pattern repeating every `size` keys, shifted by octaveDegree
+        scale degrees. referenceKey sounds at referenceFreq Hz.
+        """
+        self.size = size
+        self.firstKey = firstKey
+        self.lastKey = lastKey
+        self.middleKey = middleKey
+        self.referenceKey = referenceKey
+        self.referenceFreq = referenceFreq
+        self.octaveDegree = octaveDegree
+        self.mapping = list(mapping)
+
+    def key_degrees(self, keys):
+        """(degrees, mapped): scale degree of every key and a mask of mapped keys."""
+        keys = np.asarray(keys, dtype=np.int64)
+        offset = keys - self.middleKey
+        if self.size == 0:
+            return offset, np.ones(keys.shape, dtype=bool)
+        repeat, index = np.divmod(offset, self.size)
+        table = np.array([-1 if d is None else d for d in self.mapping]
+                         + [-1] * (self.size - len(self.mapping)), dtype=np.int64)
+        degrees = table[index]
+        return repeat * self.octaveDegree + degrees, degrees >= 0
+
+    def key_pitches(self, scale: ScalaScale, refFreq=440.0, refMidi=69):
+        """
+        (keys, midis): the mapped keys and their pitches as MIDI values
+        (refMidi at refFreq Hz), tuned so that referenceKey sounds at
+        referenceFreq.
+        """
+        keys = np.arange(self.firstKey, self.lastKey + 1)
+        degrees, mapped = self.key_degrees(keys)
+        semitones = scale.degree_semitones(degrees)
+        ref_degrees, ref_mapped = self.key_degrees([self.referenceKey])
+        ref_semitones = scale.degree_semitones(ref_degrees)[0] if ref_mapped[0] else 0.0
+        ref_midi = refMidi + 12.0 * math.log2(self.referenceFreq / refFreq)
+        return keys[mapped], ref_midi + semitones[mapped] - ref_semitones
+
+
+def parse_kbm(text: str) -> KeyboardMapping:
+    """Parse the contents of a .kbm file."""
+    lines = [line.split()[0] for line in _data_lines(text) if line.split()]
+    if len(lines) < 7:
+        raise ValueError("Scala: keyboard mapping needs 7 header lines")
+    try:
+        size, first, last, middle, reference = (int(v) for v in lines[:5])
+        freq = float(lines[5])
+        octave = int(lines[6])
+        mapping = [None if v.lower() == "x" else int(v) for v in lines[7:7 + size]]
+    except ValueError as exc:
+        raise ValueError("Scala: invalid keyboard mapping") from exc
+    return KeyboardMapping(size, first, last, middle, reference, freq, octave, mapping)
+
+
+def load_kbm(path) -> KeyboardMapping:
+    with open(path, encoding="latin-1") as f:
+        return parse_kbm(f.read())
+
+
+# ---------------------------------------------------------------------------
+# archive with persistent index
+# ---------------------------------------------------------------------------
+
+class ScalaArchive:
+    INDEX_FILE = ".scala_index.json"
+    INDEX_VERSION = 2
+
+    def __init__(self, directory, indexPath=None):
+        """
+        A directory tree of .scl files with a persistent JSON index.
+
+        The index stores name, description, size and period of every
+        file (plus mtime and byte size to detect changes). It is read
+        from indexPath (default: .scala_index.json in the directory) or
+        built once if missing; refresh() re-parses only new or changed
+        files. scale(name) parses a file on first use and caches it.
+
+        Scales are named after their file (lowercase, without .scl);
+        files sharing a name in different subdirectories are named by
+        their relative path instead, e.g. 'a/foo' and 'b/foo'. If the
+        index cannot be written (read-only directory) it is only kept
+        in memory.
+        """
+        self.directory = os.path.abspath(directory)
+        self.indexPath = indexPath or os.path.join(self.directory, self.INDEX_FILE)
+        self._scales = {}
+        self.index = self._read_index()
+        if self.index is None:
+            self.index = {}
+            self.refresh()
+
+    # ---- index ----
+    def _read_index(self):
+        try:
+            with open(self.indexPath, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # anything but a current index is stale and rebuilt
+        if (not isinstance(data, dict) or data.get("version") != self.INDEX_VERSION
+                or not isinstance(data.get("entries"), dict)):
+            return None
+        return data["entries"]
+
+    def _write_index(self):
+        tmp = self.indexPath + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": self.INDEX_VERSION, "entries": self.index}, f)
+            os.replace(tmp, self.indexPath)
+        except OSError as exc:
+            warnings.warn(f"Scala: cannot write index {self.indexPath!r} ({exc}); "
+                          "keeping it in memory only")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _scan(self):
+        """(name, relative path) of every .scl file, see __init__ for the names."""
+        files = []
+        for folder, _, names in os.walk(self.directory):
+            for file in names:
+                if file.lower().endswith(".scl"):
+                    relpath = os.path.relpath(os.path.join(folder, file), self.directory)
+                    files.append((os.path.splitext(file)[0].lower(), relpath))
+        counts = Counter(name for name, _ in files)
+        return [
+            (name if counts[name] == 1
+             else os.path.splitext(relpath)[0].replace(os.sep, "/").lower(), relpath)
+            for name, relpath in sorted(files, key=lambda f: f[1])
+        ]
+
+    def refresh(self):
+        """Rescan the directory, parsing only new or modified files."""
+        entries = {}
+        for name, relpath in self._scan():
+            path = os.path.join(self.directory, relpath)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue   # broken link or removed during the scan
+            old = self.index.get(name)
+            if (old and old["path"] == relpath
+                    and old["mtime"] == stat.st_mtime and old["bytes"] == stat.st_size):
+                entries[name] = old
+                continue
+            try:
+                scale = load_scl(path)
+            except (OSError, ValueError):
+                continue   # unreadable or not a valid scale, leave it out of the index
+            entries[name] = {
+                "path": relpath,
+                "description": scale.description,
+                "size": len(scale),
+                "period": scale.period,
+                "mtime": stat.st_mtime,
+                "bytes": stat.st_size,
+            }
+            self._scales.pop(name, None)
+        self.index = entries
+        self._write_index()
+
+    # ---- queries ----
+    def names(self):
+        return sorted(self.index)
+
+    def __contains__(self, name):
+        return str(name).lower() in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def search(self, text=None, size=None, period=None, tolerance=1e-6):
+        """
+        Names of indexed scales matching all given filters: text in the
+        name or description (case-insensitive), number of pitches, and
+        period in semitones.
+        """
+        text = text.lower() if text else None
+        return [
+            name for name, entry in sorted(self.index.items())
+            if (text is None or text in name or text in entry["description"].lower())
+            and (size is None or entry["size"] == size)
+            and (period is None or abs(entry["period"] - period) <= tolerance)
+        ]
+
+    # ---- scales ----
+    def scale(self, name) -> ScalaScale:
+        """The parsed scale (cached after the first call)."""
+        name = str(name).lower()
+        if name not in self._scales:
+            try:
+                entry = self.index[name]
+            except KeyError as exc:
+                raise KeyError(f"Unknown Scala scale: {name!r}") from exc
+            self._scales[name] = load_scl(os.path.join(self.directory, entry["path"]))
+        return self._scales[name]
+
+    def register(self, names=None, prefix="scl:"):
+        """
+        Register octave-periodic scales in TUNING_SYSTEMS as
+        prefix + name (all indexed ones by default). Registration is
+        lazy: a file is only parsed when its system is first used.
+        """
+        names = self.names() if names is None else [str(n).lower() for n in names]
+        for name in names:
+            if abs(self.index[name]["period"] - 12.0) > 1e-6:
+                continue
+            TUNING_SYSTEMS.register(prefix + name,
+                                    lambda name=name: self.scale(name).pitchClasses,
+                                    replace=True)
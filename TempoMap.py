@@ -0,0 +1,150 @@
+import bisect
+import math
+import numpy as np
+
+
+class TempoMap:
+    def __init__(self, changes):
+        """
+        A tempo map: piecewise constant tempi and linear tempo ramps.
+
+        changes is an iterable of (beat, bpm) or (beat, bpm, ramp) tuples.
+        Each change holds from its beat up to the next change; with
+        ramp=True the tempo moves linearly (per beat) from `bpm` to the
+        bpm of the next change. The first change must be at beat 0, the
+        last one holds forever (a ramp there is ignored).
+
+        Example:
+            TempoMap([(0, 120), (16, 120, True), (24, 80)])
+            → 120 bpm for 16 beats, ritardando from 120 to 80 bpm over
+              beats 16–24, then 80 bpm.
+
+        The start time of every segment is precomputed, so beat↔second
+        conversions are a binary search over the segments plus a closed
+        form inside the segment, for scalars and NumPy arrays alike.
+        """
+        changes = sorted((tuple(c) for c in changes), key=lambda c: c[0])
+        if not changes:
+            raise ValueError("TempoMap: at least one tempo change is required.")
+        if changes[0][0] != 0:
+            raise ValueError("TempoMap: the first tempo change must be at beat 0.")
+
+        beats, start_bpms, ramps = [], [], []
+        for change in changes:
+            if len(change) not in (2, 3):
+                raise ValueError(f"TempoMap: invalid tempo change {change!r}")
+            beat, bpm = float(change[0]), float(change[1])
+            if bpm <= 0:
+                raise ValueError(f"TempoMap: bpm must be > 0, got {bpm!r}")
+            if beats and beat == beats[-1]:
+                raise ValueError(f"TempoMap: two tempo changes at beat {beat!r}")
+            beats.append(beat)
+            start_bpms.append(bpm)
+            ramps.append(bool(change[2]) if len(change) == 3 else False)
+
+        # tempo at the end of each segment, and its slope in bpm per beat
+        end_bpms = [
+            start_bpms[i + 1] if ramps[i] and i + 1 < len(beats) else start_bpms[i]
+            for i in range(len(beats))
+        ]
+        slopes = [
+            (end_bpms[i] - start_bpms[i]) / (beats[i + 1] - beats[i])
+            if end_bpms[i] != start_bpms[i] else 0.0
+            for i in range(len(beats))
+        ]
+
+        # cumulative start time of each segment
+        secs = [0.0]
+        for i in range(len(beats) - 1):
+            secs.append(secs[-1] + self._segment_secs(
+                beats[i + 1] - beats[i], start_bpms[i], slopes[i]))
+
+        self.changes = changes
+        self._beats = beats
+        self._secs = secs
+        self._start_bpms = start_bpms
+        self._slopes = slopes
+        # array versions for the vectorized conversions
+        self._beats_array = np.asarray(beats)
+        self._secs_array = np.asarray(secs)
+        self._start_bpms_array = np.asarray(start_bpms)
+        self._slopes_array = np.asarray(slopes)
+
+    @classmethod
+    def constant(cls, bpm: float):
+        """A tempo map with one constant tempo."""
+        return cls([(0.0, bpm)])
+
+    def __len__(self):
+        return len(self._beats)
+
+    def __repr__(self):
+        return f"TempoMap({self.changes!r})"
+
+    # ------------------------------------------------------------------
+    # closed forms inside one segment
+    #   tempo(x) = bpm0 + slope * x   (x = beats since segment start)
+    #   secs(x)  = 60/slope * ln(1 + slope*x/bpm0)   (60*x/bpm0 if slope == 0)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _segment_secs(dx, bpm0, slope):
+        if slope == 0.0:
+            return 60.0 * dx / bpm0
+        return 60.0 / slope * math.log1p(slope * dx / bpm0)
+
+    @staticmethod
+    def _segment_beats(dt, bpm0, slope):
+        if slope == 0.0:
+            return dt * bpm0 / 60.0
+        return bpm0 / slope * math.expm1(slope * dt / 60.0)
+
+    # ------------------------------------------------------------------
+    # scalar conversions
+    # ------------------------------------------------------------------
+    def bpm_at(self, beat: float) -> float:
+        """Tempo (bpm) at a beat position."""
+        i = max(bisect.bisect_right(self._beats, beat) - 1, 0)
+        return self._start_bpms[i] + self._slopes[i] * (beat - self._beats[i])
+
+    def beat_to_sec(self, beat: float) -> float:
+        """Convert a beat position to seconds."""
+        beat = float(beat)
+        i = max(bisect.bisect_right(self._beats, beat) - 1, 0)
+        return self._secs[i] + self._segment_secs(
+            beat - self._beats[i], self._start_bpms[i], self._slopes[i])
+
+    def sec_to_beat(self, sec: float) -> float:
+        """Convert seconds to a beat position."""
+        sec = float(sec)
+        i = max(bisect.bisect_right(self._secs, sec) - 1, 0)
+        return self._beats[i] + self._segment_beats(
+            sec - self._secs[i], self._start_bpms[i], self._slopes[i])
+
+    # ------------------------------------------------------------------
+    # vectorized conversions
+    # ------------------------------------------------------------------
+    def beats_to_secs(self, beats):
+        """Vectorized beat_to_sec for NumPy arrays."""
+        beats = np.asarray(beats, dtype=np.float64)
+        i = np.maximum(np.searchsorted(self._beats_array, beats, side="right") - 1, 0)
+        dx = beats - self._beats_array[i]
+        bpm0 = self._start_bpms_array[i]
+        slope = self._slopes_array[i]
+        ramp = slope != 0.0
+        safe_slope = np.where(ramp, slope, 1.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ramp_secs = 60.0 / safe_slope * np.log1p(safe_slope * dx / bpm0)
+        return self._secs_array[i] + np.where(ramp, ramp_secs, 60.0 * dx / bpm0)
+
+    def secs_to_beats(self, secs):
+        """Vectorized sec_to_beat for NumPy arrays."""
+        secs = np.asarray(secs, dtype=np.float64)
+        i = np.maximum(np.searchsorted(self._secs_array, secs, side="right") - 1, 0)
+        dt = secs - self._secs_array[i]
+        bpm0 = self._start_bpms_array[i]
+        slope = self._slopes_array[i]
+        ramp = slope != 0.0
+        safe_slope = np.where(ramp, slope, 1.0)
+        with np.errstate(over="ignore"):
+            ramp_beats = bpm0 / safe_slope * np.expm1(safe_slope * dt / 60.0)
+        return self._beats_array[i] + np.where(ramp, ramp_beats, dt * bpm0 / 60.0)
@@ -1,31 +1,43 @@
-from .QuantisationGrid import Grid
+from .QuantisationGrid import Grid, ArrayGrid, SeriesGrid
+from .TempoMap import TempoMap
+from collections.abc import Set
+import copy
+import heapq
+import itertools
+import math
 import warnings
+import numpy as np
 
-class TimeGrid(Grid):
-    def __init__(
-        self,
-        durationSec: float | None = None,
-        durationBeats: float | None = None,
-        bpm: float = 120.0,
-        possibleSubdivision=None,
-    ):
-        """
-        A time grid over a given duration, at a given BPM.
 
-        You can specify:
-          - only durationSec
-          - only durationBeats
-          - or both (they must match for the given bpm, otherwise a warning
-            is raised and the larger implied duration is used)
+class _TimeGridBase:
+    """
+    Duration bookkeeping, time conversion and quantisation shared by the
+    TimeGrid storage modes (TimeGrid: a set of floats, ArrayTimeGrid:
+    float64 arrays, LazyTimeGrid: nothing materialised). Subclasses
+    implement `_lattice(ticks_per_step, size)` and
+    `_extend_grids(old_sizes)`.
 
-        possibleSubdivision is a list of integer subdivision factors
-        (e.g. [5, 7, 8]); for each beat, all these subdivisions are
-        added to the grid.
+    Time is counted in integer ticks: `ppq` (ticks per beat) is the lcm
+    of all subdivisions, so every grid point is a whole number of ticks
+    and the float beat of a point is always ticks / ppq, correctly
+    rounded. Points shared by several subdivisions (1/3 and 2/6) are
+    therefore the same float and dedupe exactly.
+    """
+
+    def _init_timing(self, durationSec, durationBeats, bpm, possibleSubdivision,
+                     tempoMap=None):
+        """
+        Normalise and store bpm, tempoMap, durationSec, durationBeats and
+        possibleSubdivision (see TimeGrid.__init__).
         """
         if possibleSubdivision is None:
             possibleSubdivision = [1]
 
-        self.bpm = float(bpm)
+        if tempoMap is not None and not isinstance(tempoMap, TempoMap):
+            tempoMap = TempoMap(tempoMap)
+        self.tempoMap = tempoMap
+        # with a tempo map, bpm is the initial tempo
+        self.bpm = float(bpm) if tempoMap is None else tempoMap.bpm_at(0.0)
 
         if durationSec is None and durationBeats is None:
             raise ValueError(
@@ -37,7 +49,7 @@ class TimeGrid(Grid):
         # If seconds given → compute beats_from_sec
         if durationSec is not None:
             durationSec = float(durationSec)
-            beats_from_sec = durationSec * self.bpm / 60.0
+            beats_from_sec = self.sec_to_beat(durationSec)
 
         # If beats given → normalise
         if durationBeats is not None:
@@ -46,7 +58,7 @@ class TimeGrid(Grid):
         # Case 1: only beats given
         if durationSec is None and durationBeats is not None:
             self.durationBeats = durationBeats
-            self.durationSec = self.durationBeats * 60.0 / self.bpm
+            self.durationSec = self.beat_to_sec(self.durationBeats)
 
         # Case 2: only seconds given
         elif durationSec is not None and durationBeats is None:
@@ -66,27 +78,28 @@ class TimeGrid(Grid):
                     UserWarning,
                 )
                 self.durationBeats = larger_beats
-                self.durationSec = self.durationBeats * 60.0 / self.bpm
+                self.durationSec = self.beat_to_sec(self.durationBeats)
             else:
                 # they match within tolerance
                 self.durationBeats = durationBeats
                 self.durationSec = durationSec
 
         self.possibleSubdivision = list(possibleSubdivision)
-        self.grids: dict[int, Grid] = {}
 
-        # build sub-grids and union
-        all_points = set()
-        for subdiv in self.possibleSubdivision:
-            g = self._make_single_subdivision_grid(subdiv)
-            self.grids[subdiv] = g
-            all_points.update(g)
+        # integer tick timebase (ticks per beat)
+        self.ppq = math.lcm(*(int(s) for s in self.possibleSubdivision if s > 0))
+
+    def _build_grids(self):
+        """(Re)build one sub-grid per subdivision over durationBeats."""
+        self.grids: dict[int, Grid | ArrayGrid] = {
+            subdiv: self._make_single_subdivision_grid(subdiv)
+            for subdiv in self.possibleSubdivision
+        }
 
-        super().__init__(all_points)
     # ------------------------------------------------------------------
     # internal helpers
     # ------------------------------------------------------------------
-    def _make_single_subdivision_grid(self, subdiv: int) -> Grid:
+    def _make_single_subdivision_grid(self, subdiv: int):
         """
         Make a simple Grid with a *single* subdivision over durationBeats.
 
@@ -95,27 +108,88 @@ class TimeGrid(Grid):
         if subdiv <= 0:
             raise ValueError("subdiv must be a positive integer")
 
-        step = 1.0 / subdiv
+        ticks_per_step, rest = divmod(self.ppq, subdiv)
+        if rest:
+            raise ValueError(f"subdiv {subdiv} does not divide the tick resolution ppq={self.ppq}")
+
+        size = self._max_k(subdiv) + 1  # because k runs 0..max_k
+        return self._lattice(ticks_per_step, size)
 
+    def _max_k(self, subdiv: int) -> int:
+        """Index of the last multiple of 1/subdiv within durationBeats."""
         # we want all multiples of `step` from 0 up to durationBeats (inclusive-ish)
         # i.e. k * step  for k = 0 .. floor((durationBeats + eps) / step)
         eps = 1e-9
-        max_k = int((self.durationBeats + eps) / step)
-        size = max_k + 1  # because k runs 0..max_k
-
-        return Grid.series(start=0.0, step=step, size=size)
+        return int((self.durationBeats + eps) / (1.0 / subdiv))
 
     # ------------------------------------------------------------------
     # time conversion helpers
     # ------------------------------------------------------------------
     def beat_to_sec(self, beat: float) -> float:
         """Convert a beat position to seconds."""
+        if self.tempoMap is not None:
+            return self.tempoMap.beat_to_sec(beat)
         return (60.0 / self.bpm) * float(beat)
 
     def sec_to_beat(self, sec: float) -> float:
         """Convert seconds to beat position."""
+        if self.tempoMap is not None:
+            return self.tempoMap.sec_to_beat(sec)
         return float(sec) * self.bpm / 60.0
 
+    def beats_to_secs(self, beats):
+        """Vectorized beat_to_sec for NumPy arrays."""
+        if self.tempoMap is not None:
+            return self.tempoMap.beats_to_secs(beats)
+        return np.asarray(beats, dtype=np.float64) * (60.0 / self.bpm)
+
+    def secs_to_beats(self, secs):
+        """Vectorized sec_to_beat for NumPy arrays."""
+        if self.tempoMap is not None:
+            return self.tempoMap.secs_to_beats(secs)
+        return np.asarray(secs, dtype=np.float64) * self.bpm / 60.0
+
+    def beat_to_tick(self, beat: float) -> int:
+        """Convert a beat position to the nearest whole tick."""
+        return round(float(beat) * self.ppq)
+
+    def tick_to_beat(self, tick: int) -> float:
+        """Convert ticks to a beat position."""
+        return tick / self.ppq
+
+    def sec_to_tick(self, sec: float) -> int:
+        """Convert seconds to the nearest whole tick."""
+        return self.beat_to_tick(self.sec_to_beat(sec))
+
+    def tick_to_sec(self, tick: int) -> float:
+        """Convert ticks to seconds."""
+        return self.beat_to_sec(self.tick_to_beat(tick))
+
+    def beats_to_ticks(self, beats):
+        """Vectorized beat_to_tick: returns an int64 array."""
+        return np.rint(np.asarray(beats, dtype=np.float64) * self.ppq).astype(np.int64)
+
+    @property
+    def beatDurationSec(self) -> float:
+        """Duration of one beat in seconds."""
+        return 60.0 / self.bpm
+
+    @property
+    def fastestDivisionTime(self) -> float:
+        """Duration in seconds of the smallest subdivision step."""
+        return self.beatDurationSec / max(self.possibleSubdivision)
+
+    @property
+    def ticks(self):
+        """All grid points as a sorted int64 array of ticks."""
+        lattices = [
+            np.arange(self._max_k(subdiv) + 1, dtype=np.int64) * (self.ppq // subdiv)
+            for subdiv in self.grids
+        ]
+        if not lattices:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(lattices))
+
     # ------------------------------------------------------------------
     # extension
     # ------------------------------------------------------------------
@@ -123,33 +197,36 @@ class TimeGrid(Grid):
         """
         Extend all sub-grids (and the main grid) so that they cover at least
         up to the given beat.
+
+        Only the points of the added range are generated, so repeated
+        small extensions cost time proportional to the added span.
         """
         if beat <= self.durationBeats:
             return
 
         # how many extra beats do we need?
         extra_beats = float(beat) - self.durationBeats
+        old_sizes = {subdiv: len(g) for subdiv, g in self.grids.items()}
         self.durationBeats += extra_beats
         self.durationSec = self.beat_to_sec(self.durationBeats)
 
-        # rebuild all sub-grids & union again
-        all_points = set()
-        for subdiv in self.possibleSubdivision:
-            g = self._make_single_subdivision_grid(subdiv)
-            self.grids[subdiv] = g
-            all_points.update(g)
+        self._extend_grids(old_sizes)
+
+    def _copy_sub_grids(self, new):
+        """Give a shallow copy its own sub-grids (they are extended in place)."""
+        new.grids = {subdiv: copy.copy(g) for subdiv, g in self.grids.items()}
+        return new
 
-        # clear and refill this Grid
-        self.clear()
-        for p in all_points:
-            self.add(p)
+    def _new_ks(self, subdiv: int, old_size: int) -> range:
+        """Lattice indices k of `subdiv` that an extension has to add."""
+        return range(old_size, self._max_k(subdiv) + 1)
 
     # ------------------------------------------------------------------
     # quantisation
     # ------------------------------------------------------------------
-    def quantize_beat(self, beat: float, subdivision: int | None = None):
+    def _get_grid(self, subdivision: int | None = None):
         """
-        Quantise a raw beat position to the closest grid point.
+        Return the grid to quantise against.
 
         - If `subdivision` is given, use only that sub-grid.
         - Otherwise, use the full union grid.
@@ -157,11 +234,17 @@ class TimeGrid(Grid):
         if subdivision is not None:
             if subdivision not in self.grids:
                 raise KeyError(f"Unknown subdivision {subdivision} in TimeGrid.")
-            grid = self.grids[subdivision]
-        else:
-            grid = self  # the union grid
+            return self.grids[subdivision]
+        return self  # the union grid
 
-        return grid.quantise(float(beat))
+    def quantize_beat(self, beat: float, subdivision: int | None = None):
+        """
+        Quantise a raw beat position to the closest grid point.
+
+        - If `subdivision` is given, use only that sub-grid.
+        - Otherwise, use the full union grid.
+        """
+        return self._get_grid(subdivision).quantise(float(beat))
 
     def quantize_sec(self, sec: float, subdivision: int | None = None):
         """
@@ -170,3 +253,251 @@ class TimeGrid(Grid):
         beat_raw = self.sec_to_beat(sec)
         beat_q = self.quantize_beat(beat_raw, subdivision=subdivision)
         return self.beat_to_sec(beat_q)
+
+    def quantize_beats_many(self, beats, subdivision: int | None = None):
+        """
+        Quantise an array of raw beat positions in one vectorized pass.
+
+        Returns (quantised_beats, indices, errors_beats), see
+        Grid.quantise_many. `indices` refer to the sorted points of the
+        grid that was used (the sub-grid if `subdivision` is given).
+        """
+        return self._get_grid(subdivision).quantise_many(beats)
+
+    def quantize_secs_many(self, secs, subdivision: int | None = None):
+        """
+        Quantise an array of raw times in seconds in one vectorized pass.
+
+        Returns (quantised_secs, indices, errors_secs).
+        """
+        secs = np.asarray(secs, dtype=np.float64)
+        beats_q, indices, _ = self.quantize_beats_many(
+            self.secs_to_beats(secs), subdivision=subdivision
+        )
+        secs_q = self.beats_to_secs(beats_q)
+        return secs_q, indices, secs_q - secs
+
+
+class TimeGrid(_TimeGridBase, Grid):
+    def __init__(
+        self,
+        durationSec: float | None = None,
+        durationBeats: float | None = None,
+        bpm: float = 120.0,
+        possibleSubdivision=None,
+        tempoMap=None,
+    ):
+        """
+        A time grid over a given duration, at a given BPM.
+
+        You can specify:
+          - only durationSec
+          - only durationBeats
+          - or both (they must match for the given bpm, otherwise a warning
+            is raised and the larger implied duration is used)
+
+        possibleSubdivision is a list of integer subdivision factors
+        (e.g. [5, 7, 8]); for each beat, all these subdivisions are
+        added to the grid.
+
+        tempoMap (a TempoMap or its list of changes) replaces the constant
+        bpm for all beat↔second conversions; bpm is then the initial tempo.
+        """
+        self._init_timing(durationSec, durationBeats, bpm, possibleSubdivision,
+                          tempoMap)
+
+        # build sub-grids and union
+        self._build_grids()
+        super().__init__(self._union_points())
+
+    def __copy__(self):
+        return self._copy_sub_grids(Grid.__copy__(self))
+
+    def _lattice(self, ticks_per_step: int, size: int) -> Grid:
+        return Grid(k * ticks_per_step / self.ppq for k in range(size))
+
+    def _union_points(self) -> set:
+        all_points = set()
+        for g in self.grids.values():
+            all_points.update(g)
+        return all_points
+
+    def _extend_grids(self, old_sizes):
+        """Append the points beyond the old duration to sub-grids and union."""
+        new_points = set()
+        for subdiv, g in self.grids.items():
+            ticks_per_step = self.ppq // subdiv
+            points = [k * ticks_per_step / self.ppq
+                      for k in self._new_ks(subdiv, old_sizes[subdiv])]
+            g._append_sorted(points)
+            new_points.update(points)
+        self._append_sorted(sorted(new_points))
+
+
+class ArrayTimeGrid(_TimeGridBase, ArrayGrid):
+    """
+    TimeGrid in compact storage mode.
+
+    Same constructor and API as TimeGrid, but the union grid and every
+    sub-grid in `self.grids` are ArrayGrids (sorted float64 arrays), so
+    each subdivision is built with a single NumPy call and the whole grid
+    costs 8 bytes per point. The union is formed on integer ticks.
+    """
+
+    def __init__(
+        self,
+        durationSec: float | None = None,
+        durationBeats: float | None = None,
+        bpm: float = 120.0,
+        possibleSubdivision=None,
+        tempoMap=None,
+    ):
+        self._init_timing(durationSec, durationBeats, bpm, possibleSubdivision,
+                          tempoMap)
+        self._build_grids()
+        ArrayGrid.__init__(self, self.ticks / self.ppq)
+
+    def __copy__(self):
+        return self._copy_sub_grids(ArrayGrid.__copy__(self))
+
+    def _lattice(self, ticks_per_step: int, size: int) -> ArrayGrid:
+        return ArrayGrid(np.arange(size, dtype=np.int64) * ticks_per_step / self.ppq)
+
+    def _extend_grids(self, old_sizes):
+        """Append the points beyond the old duration to sub-grids and union."""
+        new_ticks = []
+        for subdiv, g in self.grids.items():
+            ks = self._new_ks(subdiv, old_sizes[subdiv])
+            ticks = np.arange(ks.start, ks.stop, dtype=np.int64) * (self.ppq // subdiv)
+            g._append_sorted(ticks / self.ppq)
+            new_ticks.append(ticks)
+        if new_ticks:
+            self._append_sorted(np.unique(np.concatenate(new_ticks)) / self.ppq)
+
+
+class LazyTimeGrid(_TimeGridBase, Set):
+    """
+    TimeGrid that never materialises its points.
+
+    A TimeGrid is a union of regular lattices (one per subdivision s:
+    k/s for k = 0 .. durationBeats*s), so the nearest point of each
+    lattice is found arithmetically. quantize_beat, quantize_sec and
+    membership cost O(len(possibleSubdivision)) regardless of duration,
+    and construction / extend_to_beat are O(1) per subdivision.
+    `self.grids` holds one SeriesGrid per subdivision. Points are only
+    produced (in ascending order, duplicates across subdivisions
+    removed exactly) when the grid is iterated.
+    """
+
+    def __init__(
+        self,
+        durationSec: float | None = None,
+        durationBeats: float | None = None,
+        bpm: float = 120.0,
+        possibleSubdivision=None,
+        tempoMap=None,
+    ):
+        self._init_timing(durationSec, durationBeats, bpm, possibleSubdivision,
+                          tempoMap)
+        self._build_grids()
+
+    def _lattice(self, ticks_per_step: int, size: int) -> SeriesGrid:
+        return SeriesGrid(0, ticks_per_step, size, divisor=self.ppq)
+
+    def _extend_grids(self, old_sizes):
+        # nothing is materialised, the lattices just get longer
+        self._build_grids()
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return ArrayGrid(it)
+
+    # ------------------------------------------------------------------
+    # set-like API
+    # ------------------------------------------------------------------
+    def __contains__(self, value):
+        return any(value in g for g in self.grids.values())
+
+    def __iter__(self):
+        # merge the lattices on the integer tick axis so that shared
+        # points are yielded once
+        merged = heapq.merge(*(
+            range(0, len(g) * g.step, g.step) for g in self.grids.values()
+        ))
+        last_tick = None
+        for tick in merged:
+            if tick != last_tick:
+                last_tick = tick
+                yield tick / self.ppq
+
+    def __len__(self):
+        # inclusion–exclusion: the points shared by all subdivisions in a
+        # subset T are the multiples of 1/gcd(T)
+        total = 0
+        subdivs = list(self.grids)
+        for r in range(1, len(subdivs) + 1):
+            sign = 1 if r % 2 else -1
+            for subset in itertools.combinations(subdivs, r):
+                total += sign * (self._max_k(math.gcd(*subset)) + 1)
+        return total
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(durationBeats={self.durationBeats!r}, "
+                f"bpm={self.bpm!r}, possibleSubdivision={self.possibleSubdivision!r})")
+
+    def sorted(self):
+        """Return grid values in sorted order (materialises the grid)."""
+        return list(self)
+
+    def check_types(self, expected_type=None):
+        return all(g.check_types(expected_type) for g in self.grids.values())
+
+    def is_comparable(self, value) -> bool:
+        return any(g.is_comparable(value) for g in self.grids.values())
+
+    # ------------------------------------------------------------------
+    # quantisation of the union
+    # ------------------------------------------------------------------
+    def quantise(self, value):
+        """Return the closest grid point (ties resolve to the lower point)."""
+        if not self.grids:
+            raise ValueError("closest: Grid is empty — cannot find closest element.")
+        candidates = [g.quantise(value) for g in self.grids.values()]
+        return min(candidates, key=lambda c: (abs(c - value), c))
+
+    def quantise_many(self, values):
+        """
+        Vectorized quantise, see Grid.quantise_many.
+
+        `indices` are the positions of the quantised points in sorted(self),
+        counted arithmetically without materialising the grid. Non-finite
+        values quantise to nan with index -1.
+        """
+        if not self.grids:
+            raise ValueError("quantise_many: Grid is empty — cannot find closest elements.")
+
+        subdivs = list(self.grids)
+        per_grid = [self.grids[s].quantise_many(values) for s in subdivs]
+        values = np.asarray(values, dtype=np.float64)
+        q = np.stack([pg[0] for pg in per_grid])
+        k = np.stack([pg[1] for pg in per_grid])
+        dist = np.abs(q - values)
+
+        # nearest over all lattices; on equal distance take the lower point
+        q_best = np.where(dist == dist.min(axis=0), q, np.inf)
+        choice = np.argmin(q_best, axis=0)
+        quantised = np.take_along_axis(q, choice[None], axis=0)[0]
+        k_best = np.take_along_axis(k, choice[None], axis=0)[0]
+        s_best = np.asarray(subdivs, dtype=np.int64)[choice]
+
+        # rank of k/s in the union = number of distinct points < k/s,
+        # counted exactly with inclusion–exclusion over subdivision subsets
+        indices = np.zeros(values.shape, dtype=np.int64)
+        for r in range(1, len(subdivs) + 1):
+            sign = 1 if r % 2 else -1
+            for subset in itertools.combinations(subdivs, r):
+                g = math.gcd(*subset)
+                indices += sign * -(-k_best * g // s_best)
+        indices[~np.isfinite(values)] = -1
+
+        return quantised, indices.astype(np.intp), quantised - values
@@ -0,0 +1,91 @@
+import math
+import numpy as np
+from .PitchGrid import ModularPitchGrid, _edo_pitch_classes
+
+
+class Tuning:
+    def __init__(self, refFreq: float = 440.0, refMidi: float = 69, stepsPerOctave: int = 12):
+        """
+        Frequency ↔ MIDI conversion for a reference pitch:
+
+            midi = refMidi + 12 * log2(freq / refFreq)
+
+        MIDI values stay in semitones; stepsPerOctave sets the equal
+        division of the octave used by pitch_grid() (12 = semitones,
+        24 = quarter tones, ...), anchored on refMidi.
+
+        Scalar and vectorized (NumPy) versions of every conversion are
+        provided, so spectra with thousands of partials convert in one
+        call.
+        """
+        if refFreq <= 0:
+            raise ValueError(f"Tuning: refFreq must be > 0, got {refFreq!r}")
+        if stepsPerOctave <= 0:
+            raise ValueError(f"Tuning: stepsPerOctave must be > 0, got {stepsPerOctave!r}")
+        self.refFreq = float(refFreq)
+        self.refMidi = float(refMidi)
+        self.stepsPerOctave = int(stepsPerOctave)
+
+    def __repr__(self):
+        return (f"Tuning(refFreq={self.refFreq!r}, refMidi={self.refMidi!r}, "
+                f"stepsPerOctave={self.stepsPerOctave!r})")
+
+    @property
+    def step(self) -> float:
+        """Size of one step of the tuning in semitones."""
+        return 12.0 / self.stepsPerOctave
+
+    # ------------------------------------------------------------------
+    # scalar conversions
+    # ------------------------------------------------------------------
+    def freq_to_midi(self, freq: float) -> float:
+        """Convert a frequency (Hz) to a (fractional) MIDI value."""
+        if freq <= 0:
+            raise ValueError(f"freq_to_midi: frequency must be > 0, got {freq!r}")
+        return self.refMidi + 12.0 * math.log2(freq / self.refFreq)
+
+    def midi_to_freq(self, midi: float) -> float:
+        """Convert a (fractional) MIDI value to a frequency (Hz)."""
+        return self.refFreq * 2.0 ** ((midi - self.refMidi) / 12.0)
+
+    # ------------------------------------------------------------------
+    # vectorized conversions
+    # ------------------------------------------------------------------
+    def freqs_to_midis(self, freqs):
+        """Vectorized freq_to_midi; non-positive frequencies give nan."""
+        freqs = np.asarray(freqs, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            midis = self.refMidi + 12.0 * np.log2(freqs / self.refFreq)
+        return np.where(freqs > 0, midis, np.nan)
+
+    def midis_to_freqs(self, midis):
+        """Vectorized midi_to_freq."""
+        midis = np.asarray(midis, dtype=np.float64)
+        return self.refFreq * np.exp2((midis - self.refMidi) / 12.0)
+
+    # ------------------------------------------------------------------
+    # pitch grids
+    # ------------------------------------------------------------------
+    def pitch_grid(self, midiMin=0, midiMax=127, name=None):
+        """
+        The equal-step grid of this tuning between midiMin and midiMax,
+        as a ModularPitchGrid (no octave is materialised).
+        """
+        return ModularPitchGrid(
+            _edo_pitch_classes(self.stepsPerOctave), self.refMidi, midiMin, midiMax,
+            name=name or f"edo{self.stepsPerOctave}",
+        )
+
+    def quantise_freqs(self, freqs, pitchGrid):
+        """
+        Quantise frequencies to a pitch grid (PitchGrid, ModularPitchGrid
+        or ExactPitchGrid). Returns (midis, freqs, errors): the quantised
+        MIDI values, their frequencies in this tuning, and the errors
+        quantised - raw in semitones (nan for non-positive frequencies).
+        """
+        midis = self.freqs_to_midis(freqs)
+        quantise_many = getattr(pitchGrid, "quantise_midi_many", pitchGrid.quantise_many)
+        valid = ~np.isnan(midis)
+        quantised = np.full(midis.shape, np.nan)
+        quantised[valid] = quantise_many(midis[valid])[0]
+        return quantised, self.midis_to_freqs(quantised), quantised - midis
@@ -0,0 +1,239 @@
+import bisect
+import math
+from fractions import Fraction
+import numpy as np
+
+# offsets (in beats) closer than this count as equal: a raw point this
+# close to the midpoint of two grid points is a tie (→ lower point)
+_TOLERANCE = 1e-9
+
+
+class RhythmTree:
+    def __init__(self, spec=1):
+        """
+        Recursive subdivision of one beat, written as a rhythm tree
+        (as in slippery chicken / OpenMusic):
+
+            spec = n                 → n equal parts
+            spec = [c1, c2, ...]     → parts proportional to the weights
+                                       of the children, where a child is
+                                       w        (leaf of weight w) or
+                                       (w, sub) (weight w, subdivided by sub)
+
+        Examples:
+            4                    → semiquavers
+            [1, 1, 1, 1, 1]      → quintuplet
+            [(2, 3), 1, 1, 1]    → quintuplet whose first two fifths hold
+                                   a triplet (3 in the time of 2)
+
+        Grid points are the boundaries of all leaves, as exact Fractions
+        of the beat in `self.points` (always including 0 and 1).
+        """
+        self.spec = spec
+        self._root = self._build(spec, Fraction(0), Fraction(1))
+
+        points = set()
+        self._collect(self._root, points)
+        self.points = tuple(sorted(points))
+        self.offsets = np.array([float(p) for p in self.points])
+        # ticks per beat needed to represent every point exactly
+        self.ppq = math.lcm(*(p.denominator for p in self.points))
+
+    # ------------------------------------------------------------------
+    # tree construction
+    #   a node is (bounds, floatBounds, children): the exact and float
+    #   boundaries of its parts, and a sub-node or None (leaf) per part
+    # ------------------------------------------------------------------
+    @classmethod
+    def _build(cls, spec, start, end):
+        if isinstance(spec, int):
+            if spec <= 0:
+                raise ValueError("RhythmTree: subdivisions must be positive integers")
+            spec = [1] * spec
+        if not isinstance(spec, (list, tuple)) or not spec:
+            raise ValueError(f"RhythmTree: invalid rhythm tree {spec!r}")
+
+        weights, subs = [], []
+        for child in spec:
+            if isinstance(child, int):
+                weight, sub = child, None
+            elif isinstance(child, (list, tuple)) and len(child) == 2:
+                weight, sub = child
+            else:
+                raise ValueError(f"RhythmTree: invalid rhythm tree child {child!r}")
+            if not isinstance(weight, int) or weight <= 0:
+                raise ValueError("RhythmTree: weights must be positive integers")
+            weights.append(weight)
+            subs.append(sub)
+
+        total = sum(weights)
+        bounds = [start]
+        for w in weights:
+            bounds.append(bounds[-1] + (end - start) * Fraction(w, total))
+
+        children = [
+            None if sub is None else cls._build(sub, bounds[i], bounds[i + 1])
+            for i, sub in enumerate(subs)
+        ]
+        return (bounds, [float(b) for b in bounds], children)
+
+    @classmethod
+    def _collect(cls, node, points):
+        bounds, _, children = node
+        points.update(bounds)
+        for child in children:
+            if child is not None:
+                cls._collect(child, points)
+
+    # ------------------------------------------------------------------
+    # lookup
+    # ------------------------------------------------------------------
+    def nearest(self, offset: float) -> float:
+        """
+        Nearest grid point to an offset in [0, 1] within the beat, by
+        descending the tree (O(depth)); ties resolve to the lower point.
+        """
+        node = self._root
+        while True:
+            _, bounds, children = node
+            i = bisect.bisect_right(bounds, offset) - 1
+            i = min(max(i, 0), len(children) - 1)
+            if children[i] is None:
+                low, high = bounds[i], bounds[i + 1]
+                return low if offset - low <= high - offset + _TOLERANCE else high
+            node = children[i]
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"RhythmTree({self.spec!r})"
+
+
+class TupletGrid:
+    def __init__(self, timeGrid, trees=None, default=1):
+        """
+        Hierarchical time grid on top of a TimeGrid: every beat carries a
+        RhythmTree (nested tuplets) instead of a flat union of lattices.
+
+        - timeGrid: provides durationBeats and beat↔second conversion
+          (bpm or tempo map)
+        - trees: dict {beat number: tree spec or RhythmTree}, or a list
+          with one entry per beat (None = use default)
+        - default: tree for all other beats (1 = beats only)
+
+        Identical specs share one RhythmTree, so memory grows with the
+        number of distinct trees, not with duration x nesting.
+        """
+        self.timeGrid = timeGrid
+        self.durationBeats = timeGrid.durationBeats
+        self.numBeats = max(int(math.ceil(self.durationBeats - 1e-9)), 1)
+
+        self._trees = []
+        self._treeIds = {}
+        self.defaultTree = self._tree_id(default)
+
+        # tree id per beat
+        self._beatTrees = np.full(self.numBeats, self.defaultTree, dtype=np.intp)
+        if trees is not None:
+            items = trees.items() if isinstance(trees, dict) else enumerate(trees)
+            for beat, spec in items:
+                if spec is None:
+                    continue
+                if not 0 <= beat < self.numBeats:
+                    raise KeyError(f"TupletGrid: beat {beat} outside the grid")
+                self._beatTrees[beat] = self._tree_id(spec)
+
+        # flattened lookup table: the offsets of tree t are stored as
+        # 2*t + offset, so one searchsorted serves every beat at once
+        self._flat = np.concatenate(
+            [2.0 * t + tree.offsets for t, tree in enumerate(self._trees)])
+        self._flatOffsets = np.concatenate([tree.offsets for tree in self._trees])
+        self._flatStart = np.cumsum([0] + [len(tree) for tree in self._trees])
+
+        self.ppq = math.lcm(*(tree.ppq for tree in self._trees))
+        # exact tick offsets (at self.ppq) of every tree, for membership
+        self._treeTicks = [frozenset(int(p * self.ppq) for p in tree.points)
+                           for tree in self._trees]
+
+    def _tree_id(self, spec):
+        tree = spec if isinstance(spec, RhythmTree) else RhythmTree(spec)
+        key = repr(tree.spec)
+        if key not in self._treeIds:
+            self._treeIds[key] = len(self._trees)
+            self._trees.append(tree)
+        return self._treeIds[key]
+
+    def tree_at(self, beat: int) -> RhythmTree:
+        """The RhythmTree of a beat."""
+        return self._trees[self._beatTrees[beat]]
+
+    # ------------------------------------------------------------------
+    # points
+    # ------------------------------------------------------------------
+    def __iter__(self):
+        """All grid points in ascending order (beats), produced on demand."""
+        yield 0.0
+        for beat in range(self.numBeats):
+            for offset in self.tree_at(beat).offsets[1:].tolist():
+                yield beat + offset
+
+    def __contains__(self, beat):
+        """Membership on exact ticks: float rounding of a point is tolerated."""
+        ticks = float(beat) * self.ppq
+        if not math.isfinite(ticks):
+            return False
+        tick = round(ticks)
+        if abs(ticks - tick) > _TOLERANCE * self.ppq or not 0 <= tick <= self.numBeats * self.ppq:
+            return False
+        b = min(tick // self.ppq, self.numBeats - 1)
+        return tick - b * self.ppq in self._treeTicks[self._beatTrees[b]]
+
+    def sorted(self):
+        return list(self)
+
+    # ------------------------------------------------------------------
+    # quantisation
+    # ------------------------------------------------------------------
+    def quantize_beat(self, beat: float) -> float:
+        """Nearest grid point to a raw beat position (tree descent)."""
+        beat = min(max(float(beat), 0.0), float(self.numBeats))
+        b = min(int(beat), self.numBeats - 1)
+        return b + self.tree_at(b).nearest(beat - b)
+
+    def quantize_sec(self, sec: float) -> float:
+        """Nearest grid point to a raw time in seconds (in seconds)."""
+        tg = self.timeGrid
+        return tg.beat_to_sec(self.quantize_beat(tg.sec_to_beat(sec)))
+
+    def quantize_beats_many(self, beats):
+        """
+        Vectorized quantize_beat on the flattened table.
+
+        Returns (quantised, indices, errors): indices are the positions of
+        the quantised points in their beat's RhythmTree.points (the last
+        one being the next downbeat); errors are quantised - beats.
+        """
+        beats = np.asarray(beats, dtype=np.float64)
+        clamped = np.clip(beats, 0.0, float(self.numBeats))
+        b = np.minimum(np.floor(clamped), self.numBeats - 1)
+        tree = self._beatTrees[b.astype(np.intp)]
+        frac = clamped - b
+        keys = 2.0 * tree + frac
+
+        start = self._flatStart[tree]
+        end = self._flatStart[tree + 1] - 1
+        hi = np.clip(np.searchsorted(self._flat, keys), start + 1, end)
+        lo = hi - 1
+        # distances within the beat, as in RhythmTree.nearest (the keys
+        # lose precision for large tree ids)
+        off = self._flatOffsets
+        pick = np.where(frac - off[lo] <= off[hi] - frac + _TOLERANCE, lo, hi)
+
+        quantised = b + self._flatOffsets[pick]
+        return quantised, pick - start, quantised - beats
+
+    def quantize_ticks_many(self, beats):
+        """Vectorized quantisation to exact int64 ticks (self.ppq per beat)."""
+        quantised, _, _ = self.quantize_beats_many(beats)
+        return np.rint(quantised * self.ppq).astype(np.int64)
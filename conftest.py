@@ -0,0 +1,38 @@
+import importlib.util
+import sys
+import types
+
+# Event and Composition build musicscore chords. When musicscore is not
+# installed, register a minimal stand-in for musicscore.chord so their
+# timing and pitch logic is still tested; with musicscore installed the
+# real Chord is used.
+if importlib.util.find_spec("musicscore") is None:
+    class _Midi:
+        def __init__(self, value):
+            self.value = value
+
+    class Chord:
+        def __init__(self, midis=60, quarter_duration=1):
+            self.midis = midis
+            self.quarter_duration = quarter_duration
+            self.ties = []
+
+        @property
+        def midis(self):
+            return self._midis
+
+        @midis.setter
+        def midis(self, midis):
+            if not isinstance(midis, (list, tuple)):
+                midis = [midis]
+            self._midis = [m if isinstance(m, _Midi) else _Midi(m) for m in midis]
+
+        def add_tie(self, tie_type):
+            self.ties.append(tie_type)
+
+    _musicscore = types.ModuleType("musicscore")
+    _chord = types.ModuleType("musicscore.chord")
+    _chord.Chord = Chord
+    _musicscore.chord = _chord
+    sys.modules["musicscore"] = _musicscore
+    sys.modules["musicscore.chord"] = _chord
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from .ChordQuantiser import ChordQuantiser, flatten_chords, split_chords
+from .Instrument import Instrument
+from .PitchGrid import PitchGrid, ModularPitchGrid, ExactPitchGrid
+
+
+@pytest.fixture
+def semitones():
+    return ModularPitchGrid(range(12), 0, 0, 127)
+
+
+def test_flatten_and_split_roundtrip():
+    values, offsets = flatten_chords([[60, 64], 67, [], [1, 2, 3]])
+    assert values.tolist() == [60, 64, 67, 1, 2, 3]
+    assert offsets.tolist() == [0, 2, 3, 3, 6]
+    assert [c.tolist() for c in split_chords(values, offsets)] == \
+        [[60, 64], [67], [], [1, 2, 3]]
+
+
+def test_quantise_without_instrument_dedupes_and_sorts(semitones):
+    q = ChordQuantiser(semitones)
+    chords = q.quantise_chords([[64.2, 60.4, 59.6], [70.5, 70.4]])
+    assert [c.tolist() for c in chords] == [[60.0, 64.0], [70.0]]
+
+
+def test_instrument_range_microtones_and_missing_notes():
+    grid = PitchGrid.from_range(0, 127, 0.5)
+    ins = Instrument(rangeMidi=(40, 80), microTones=False, missing_notes={61})
+    q = ChordQuantiser(grid, ins)
+    assert q.points.min() == 40 and q.points.max() == 80
+    assert 61.0 not in q.points and 60.5 not in q.points
+
+    chords = q.quantise_chords([[20, 95.2], [61, 61.2], [60.4], []])
+    assert [c.tolist() for c in chords] == [[44.0, 71.0], [60.0, 62.0], [60.0], []]
+
+
+def test_microtonal_instrument_keeps_grid_microtones():
+    ins = Instrument(rangeMidi=(40, 80), microTones=True)
+    q = ChordQuantiser(PitchGrid.from_range(0, 127, 0.5), ins)
+    assert [c.tolist() for c in q.quantise_chords([[60.4, 60.6]])] == [[60.5]]
+
+
+def test_transposing_instrument_uses_sounding_range():
+    ins = Instrument(rangeMidi=(50, 60), transposition_semitones=-2)
+    q = ChordQuantiser(ModularPitchGrid(range(12), 0, 0, 127), ins)
+    assert (q.low, q.high) == (48.0, 58.0)
+    written = ChordQuantiser(ModularPitchGrid(range(12), 0, 0, 127), ins, sounding=False)
+    assert (written.low, written.high) == (50, 60)
+
+
+def test_monophonic_instrument_keeps_top_note(semitones):
+    q = ChordQuantiser(semitones, Instrument(chordsPossible=False))
+    assert [c.tolist() for c in q.quantise_chords([[60, 72, 50], [1]])] == [[72.0], [1.0]]
+
+
+def test_flat_matches_per_note_loop():
+    rng = np.random.default_rng(1)
+    chords = [rng.uniform(20, 110, rng.integers(1, 6)) for _ in range(500)]
+    ins = Instrument(rangeMidi=(36, 96), microTones=False, missing_notes={50, 51})
+    grid = ExactPitchGrid.from_range(0, 127, 1)
+    q = ChordQuantiser(grid, ins)
+    for chord, got in zip(chords, q.quantise_chords(chords)):
+        expected = set()
+        for note in chord:
+            while note < 36:
+                note += 12
+            while note > 96:
+                note -= 12
+            expected.add(q.points[np.argmin(np.abs(q.points - note))])
+        assert got.tolist() == sorted(expected)
+
+
+def test_no_playable_points():
+    with pytest.raises(ValueError):
+        ChordQuantiser(PitchGrid([10.5]), Instrument(microTones=False))
+
+
+def test_detuned_instrument_keeps_missing_notes_and_semitones():
+    ins = Instrument(rangeMidi=(40, 80), microTones=False, missing_notes={61}).variant(tuningCents=-15)
+    q = ChordQuantiser(PitchGrid([m - 0.15 for m in range(128)] + [60.0]), ins)
+    assert 60.85 not in q.points and 59.85 in q.points
+    assert 60.0 not in q.points                 # a microtone for the detuned instrument
+    assert q.points.min() == pytest.approx(39.85)
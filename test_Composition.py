@@ -0,0 +1,234 @@
+import numpy as np
+import pytest
+
+from .Composition import Composition
+from .Event import Event
+from .Instrument import Instrument
+from .Player import Player
+from .TempoMap import TempoMap
+from .TimeGrid import TimeGrid
+
+
+# ---------------------------------------------------------------------------
+# polytempo quantisation
+# ---------------------------------------------------------------------------
+
+def test_polytempo_uses_player_grid_subdivisions():
+    player = Player(timeGrid=TimeGrid(durationSec=4, bpm=60, possibleSubdivision=[5]))
+    comp = Composition(durationSec=4, bpm=60, possibleBeatSubdivision=[4],
+                       playerList=[player], polytempo=True)
+    player.eventList = []
+    player.addEvent(startTimeSec=0.41, durationSec=0.4, bpm=60)
+
+    comp.quantizeEventListToBeats(0)
+    ev = player.eventList[0]
+    assert ev.ppq == 5
+    assert ev.startTimeBeats == pytest.approx(0.4)
+    assert ev.quarterDurationFloat == pytest.approx(0.4)
+    assert comp.playerRhythmQuantiser(0).possibleSubdivision == [5]
+
+    # same subdivisions → the composition's own quantiser
+    player.timeGrid = TimeGrid(durationSec=4, bpm=90, possibleSubdivision=[4])
+    assert comp.playerRhythmQuantiser(0) is comp.rhythmQuantiser
+
+
+def test_event_list_uses_one_subdivision_per_beat():
+    player = Player()
+    comp = Composition(durationSec=4, bpm=60, possibleBeatSubdivision=[4, 5],
+                       playerList=[player])
+    player.eventList = []
+    player.addEvent(startTimeSec=0.26, durationSec=0.34, bpm=60)
+    # nearest points of the union grid would be 0.25 (4) and 0.6 (5)
+    assert comp.timeGrid.quantize_beat(0.6) == pytest.approx(0.6)
+
+    comp.quantizeEventListToBeats(0)
+    ev = player.eventList[0]
+    assert ev.ppq == 20
+    assert (ev.startTimeBeats, ev.endTimeBeats) == (0.25, 0.5)
+
+
+# ---------------------------------------------------------------------------
+# player clocks
+# ---------------------------------------------------------------------------
+
+def make_composition(*players, **kwargs):
+    kwargs = {"durationSec": 8, "bpm": 120, "possibleBeatSubdivision": [4], **kwargs}
+    return Composition(playerList=list(players), polytempo=True, **kwargs)
+
+
+def test_player_time_grid_selection_and_cache():
+    own = TimeGrid(durationSec=8, bpm=90, possibleSubdivision=[3])
+    comp = make_composition(Player(), Player(bpm=60), Player(timeGrid=own))
+
+    assert comp.playerTimeGrid(0) is comp.timeGrid      # same tempo
+    assert comp.playerTimeGrid(2) is own
+    grid = comp.playerTimeGrid(1)
+    assert grid.bpm == 60 and grid.durationSec == pytest.approx(8)
+    assert comp.playerTimeGrid(1) is grid                # cached
+
+    comp.playerList[1].bpm = 30
+    assert comp.playerTimeGrid(1).bpm == 30
+    comp.playerList[1].tempoMap = TempoMap([(0, 60), (4, 120)])
+    assert comp.playerTimeGrid(1).tempoMap is comp.playerList[1].tempoMap
+
+
+def test_player_time_grid_follows_composition_changes():
+    comp = make_composition(Player(bpm=60))
+    grid = comp.playerTimeGrid(0)
+    comp.durationSec = 16
+    longer = comp.playerTimeGrid(0)
+    assert longer is not grid and longer.durationSec == pytest.approx(16)
+
+    comp.possibleBeatSubdivision = [3]
+    assert comp.playerTimeGrid(0).possibleSubdivision == [3]
+
+
+def test_player_tempo_map_list_is_normalised():
+    changes = [(0, 60), (4, 120)]
+    player = Player(tempoMap=changes)
+    comp = make_composition(player)
+    assert isinstance(player.tempoMap, TempoMap)
+    grid = comp.playerTimeGrid(0)
+
+    changes[1] = (4, 30)                     # editing the list changes nothing
+    assert comp.playerTimeGrid(0) is grid
+    player.tempoMap = changes                # reassigning it does
+    assert comp.playerTimeGrid(0).beat_to_sec(6) == pytest.approx(8.0)
+
+
+def test_consolidate_durations_counts_beats_on_player_clock():
+    player = Player(bpm=60)
+    comp = make_composition(player)
+    player.eventList = []
+    player.addEvent(startTimeSec=0.0, durationSec=0.95, bpm=60)
+    player.addEvent(startTimeSec=1.0, durationSec=0.5, bpm=60)
+    player.addEvent(startTimeSec=3.0, durationSec=0.5, bpm=60)
+
+    comp.consolidateDurations(0)
+    first, second, rest, third = player.eventList
+    assert first.durationSec == pytest.approx(1.0)
+    assert first.quarterDurationFloat == 1.0     # one beat at 60 bpm, not two
+    assert rest.startTimeSec == pytest.approx(1.5)
+    assert rest.quarterDurationFloat == pytest.approx(1.5)
+
+
+def test_beat_and_second_conversions_between_clocks():
+    comp = make_composition(Player(bpm=60), Player(tempoMap=TempoMap([(0, 60), (4, 120)])))
+    beats = np.array([0.0, 1.0, 4.0, 6.0])
+
+    assert comp.playerBeatsToMasterSecs(beats, 0) == pytest.approx(beats)
+    assert comp.playerBeatsToMasterSecs(beats, 1) == pytest.approx([0.0, 1.0, 4.0, 5.0])
+    assert comp.masterSecsToPlayerBeats([0.0, 5.0], 1) == pytest.approx([0.0, 6.0])
+    # master clock at 120 bpm: two beats per second
+    assert comp.playerBeatsToMasterBeats(beats, 0) == pytest.approx(2 * beats)
+    assert comp.convertPlayerBeats(beats, 1, 0) == pytest.approx([0.0, 1.0, 4.0, 5.0])
+    assert comp.convertPlayerBeats(comp.convertPlayerBeats(beats, 0, 1), 1, 0) \
+        == pytest.approx(beats)
+
+
+def test_quantize_event_through_player_clock():
+    comp = make_composition(Player(tempoMap=TempoMap([(0, 60), (4, 120)])))
+    ev = Event(4.26, 0.5, bpm=120)
+    comp.quantizeEventToBeats(ev, timeGrid=comp.playerTimeGrid(0))
+    # 4.26 s is beat 4.52 on the player's clock → 4.5
+    assert ev.startTimeBeats == 4.5
+    assert ev.startTimeSec == pytest.approx(4.25)
+    assert ev.bpm == comp.playerTimeGrid(0).bpm
+
+
+# ---------------------------------------------------------------------------
+# integer tick timebase
+# ---------------------------------------------------------------------------
+
+def test_quantised_events_land_on_composition_ticks():
+    player = Player()
+    comp = Composition(durationSec=4, bpm=60, possibleBeatSubdivision=[4],
+                       playerList=[player])
+    player.eventList = []
+    player.addEvent(startTimeSec=0.26, durationSec=0.5, bpm=60)
+
+    comp.quantizeEventListToBeats(0)
+    ev = player.eventList[0]
+    assert ev.ppq == comp.ppq == 4
+    assert (ev.startTicks, ev.durationTicks) == (1, 2)
+    assert ev.startTimeSec == 0.25 and ev.durationSec == 0.5
+    assert ev.chord.quarter_duration == 0.5
+
+    single = Event(1.49, 0.26, bpm=60)
+    comp.quantizeEventToBeats(single)
+    assert (single.ppq, single.startTicks, single.durationTicks) == (4, 6, 1)
+
+
+def test_consolidate_durations_keeps_ticks_in_step():
+    player = Player(minRestDurationSec=0.2)
+    comp = Composition(durationSec=4, bpm=90, possibleBeatSubdivision=[4],
+                       playerList=[player])
+    player.eventList = []
+    for start in (0.0, 0.5, 2.0):
+        player.addEvent(startTimeSec=start, durationSec=1 / 3, bpm=90)
+    comp.quantizeEventListToBeats(0)
+    assert [(ev.startTicks, ev.durationTicks) for ev in player.eventList] == \
+        [(0, 2), (3, 2), (12, 2)]
+
+    comp.consolidateDurations(0)
+    first, second, rest, third = player.eventList
+    # 1/6 s gap → first note cut to the next start, on ticks
+    assert (first.startTicks, first.durationTicks) == (0, 3)
+    assert first.quarterDurationFloat == 0.75 == first.chord.quarter_duration
+    assert first.endTimeSec == pytest.approx(second.startTimeSec)
+    # 1 s gap → a rest on ticks
+    assert (rest.startTicks, rest.durationTicks) == (5, 7)
+    assert rest.startTimeSec == pytest.approx(second.endTimeSec)
+    assert rest.durationSec == pytest.approx(7 / 4 * 60 / 90)
+    assert third.startTicks == 12
+
+
+def test_remove_simultaneous_mixes_quantised_and_raw_events():
+    player = Player()
+    comp = Composition(durationSec=4, bpm=60, possibleBeatSubdivision=[3],
+                       playerList=[player])
+    player.eventList = []
+    player.addEvent(startTimeSec=0.34, durationSec=0.5, bpm=60)
+    comp.quantizeEventListToBeats(0)          # lands on 1/3 beat
+    player.addEvent(startTimeSec=0.3333, durationSec=0.5, bpm=60)
+    player.addEvent(startTimeSec=1.0, durationSec=0.5, bpm=60)
+    assert player.eventList[0].startTicks is not None
+    assert player.eventList[1].startTicks is None
+
+    comp.removeSimultaneousEvents(0)
+    assert [ev.startTimeSec for ev in player.eventList] == [pytest.approx(1 / 3), 1.0]
+
+
+# ---------------------------------------------------------------------------
+# tuning
+# ---------------------------------------------------------------------------
+
+def test_quantize_freqs_uses_composition_tuning():
+    comp = Composition(refFreq=440.0, refMidi=69, stepsPerOctave=24,
+                       midiMin=21, midiMax=108, playerList=[])
+    assert comp.tuning.freq_to_midi(440.0) == 69.0
+    assert (min(comp.pitchGrid), max(comp.pitchGrid)) == (21.0, 108.0)
+
+    midis, freqs, errors = comp.quantizeFreqs([440.0, 452.0, 0.0])
+    assert midis[:2].tolist() == [69.0, 69.5]
+    assert freqs[0] == pytest.approx(440.0)
+    assert freqs[1] == pytest.approx(440.0 * 2 ** (1 / 24))
+    assert errors[1] == pytest.approx(69.5 - comp.tuning.freq_to_midi(452.0))
+    assert np.isnan(midis[2]) and np.isnan(errors[2])
+
+
+# ---------------------------------------------------------------------------
+# chord quantisation
+# ---------------------------------------------------------------------------
+
+def test_quantize_event_pitches_under_instrument_rules():
+    player = Player(instrument=Instrument(rangeMidi=(40, 80), missing_notes={64}))
+    comp = Composition(durationSec=4, playerList=[player])
+    player.eventList = []
+    player.addEvent(startTimeSec=0, pitchesMidi=[60.5, 64.5])
+    player.addEvent(startTimeSec=1, pitchesMidi=0)      # rest
+    player.addEvent(startTimeSec=2, pitchesMidi=95.5)
+
+    comp.quantizeEventPitches(0)
+    midis = [[m.value for m in ev.chord.midis] for ev in player.eventList]
+    assert midis == [[60.0, 65.0], [0], [71.0]]
@@ -0,0 +1,35 @@
+import pytest
+
+from .Event import Event
+from .TempoMap import TempoMap
+
+
+# ---------------------------------------------------------------------------
+# Event ticks
+# ---------------------------------------------------------------------------
+
+def test_event_set_ticks_derives_beats_and_seconds():
+    ev = Event(0.3, 0.4, -10, 60, bpm=120)
+    ev.setTicks(6, 3, 12)
+    assert (ev.ppq, ev.startTicks, ev.durationTicks, ev.endTicks) == (12, 6, 3, 9)
+    assert ev.startTimeBeats == 0.5 and ev.quarterDurationFloat == 0.25
+    assert ev.endTimeBeats == 0.75
+    assert ev.startTimeSec == pytest.approx(0.25)
+    assert ev.durationSec == pytest.approx(0.125)
+    assert ev.endTimeSec == pytest.approx(0.375)
+
+
+def test_event_ppq_places_event_on_ticks():
+    ev = Event(0.25, 0.5, 0, 60, bpm=120, ppq=4)
+    assert (ev.startTicks, ev.durationTicks) == (2, 4)
+    assert Event(0.25, 0.5).endTicks is None
+
+
+def test_event_set_ticks_through_tempo_map():
+    tm = TempoMap([(0, 60), (1, 120)])
+    ev = Event(0.3, 0.4, -10, 60, bpm=120)
+    ev.setTicks(12, 12, 12, tempoMap=tm)
+    assert ev.startTimeBeats == 1.0 and ev.endTimeBeats == 2.0
+    assert ev.startTimeSec == pytest.approx(tm.beat_to_sec(1.0))
+    assert ev.endTimeSec == pytest.approx(tm.beat_to_sec(2.0))
+    assert ev.durationSec == pytest.approx(ev.endTimeSec - ev.startTimeSec)
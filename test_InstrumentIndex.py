@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from .Instrument import Instrument
+from .InstrumentIndex import InstrumentIndex, _IntervalTree
+from .Instruments import STANDARD_INSTRUMENTS
+
+
+def _brute_force(passage, exact=True, chordsPossible=None, microTones=None, numSystems=None):
+    chords = [p if isinstance(p, list) else [p] for p in passage]
+    pitches = [p for chord in chords for p in chord]
+    result = []
+    for key, ins in STANDARD_INSTRUMENTS.items():
+        if chordsPossible is not None and ins.chordsPossible != chordsPossible:
+            continue
+        if microTones is not None and ins.microTones != microTones:
+            continue
+        if numSystems is not None and ins.numSystems != numSystems:
+            continue
+        if any(len(c) > 1 for c in chords) and not ins.chordsPossible:
+            continue
+        if exact:
+            ok = all(ins.in_range(p, sounding=True)[0] for p in pitches)
+        else:
+            ok = all(ins.lowest_sounding_midi <= p <= ins.highest_sounding_midi
+                     for p in pitches)
+            ok = ok and (ins.microTones or all(float(p).is_integer() for p in pitches))
+        if ok:
+            result.append(key)
+    return result
+
+
+@pytest.fixture(scope="module")
+def index():
+    return InstrumentIndex()
+
+
+def test_interval_tree_stab_matches_scan():
+    rng = np.random.default_rng(1)
+    lows = rng.integers(0, 100, 200).astype(float)
+    highs = lows + rng.integers(0, 40, 200)
+    tree = _IntervalTree(lows.tolist(), highs.tolist())
+    for x in np.arange(-5, 145, 0.5):
+        expected = np.flatnonzero((lows <= x) & (highs >= x)).tolist()
+        assert sorted(tree.stab(x)) == expected
+    assert _IntervalTree([], []).stab(60) == []
+
+
+def test_in_range_and_filters(index):
+    keys = index.in_range(60, 84)
+    assert "flute" in keys and "violin" in keys and "double-bass" not in keys
+    chordal = index.in_range(60, 84, chordsPossible=True)
+    assert "violin" in chordal and "flute" not in chordal
+    assert all(STANDARD_INSTRUMENTS[k].numSystems == 2
+               for k in index.in_range(60, numSystems=2))
+
+
+@pytest.mark.parametrize("passage, filters", [
+    ([60, 64, 67], {}),
+    ([[48, 55, 64], [50]], {}),
+    ([60.5, 62, 72], {}),
+    ([[60.5, 67]], {"numSystems": 1}),
+    ([30, 100], {}),
+    ([72, 79, 84], {"microTones": False}),
+])
+def test_can_play_matches_brute_force(index, passage, filters):
+    assert index.can_play(passage, **filters) == _brute_force(passage, **filters)
+    assert index.can_play(passage, exact=False, **filters) == \
+        _brute_force(passage, exact=False, **filters)
+
+
+def test_can_play_respects_missing_notes():
+    ins = Instrument(name="holey", rangeMidi=(48, 72), missing_notes={61})
+    index = InstrumentIndex([ins, Instrument(name="full", rangeMidi=(48, 72))])
+    assert index.can_play([60, 61]) == ["full"]
+    assert index.can_play([60, 61], exact=False) == ["holey", "full"]
+
+
+def test_can_play_many_matches_single_queries(index):
+    rng = np.random.default_rng(2)
+    passages = [np.round(rng.uniform(20, 110, rng.integers(1, 6)) * 2) / 2 for _ in range(60)]
+    passages += [[[60, 64], [67]], [], 64]
+    for exact in (True, False):
+        batch = index.can_play_many(passages, exact=exact)
+        assert batch == [index.can_play(p, exact=exact) for p in passages]
+    assert index.can_play_many([]) == []
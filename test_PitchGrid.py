@@ -1,11 +1,27 @@
 # tests/test_pitchgrid.py
 
+import copy
 import math
 import numbers
 import pytest
 
+from fractions import Fraction
+
+import numpy as np
+
 from .PitchGrid import (
     PitchGrid,
+    ModularPitchGrid,
+    FrozenPitchGrid,
+    PitchGridCache,
+    PITCH_GRID_CACHE,
+    get_pitch_grid,
+    ExactPitchGrid,
+    EDO_SYSTEMS_EXACT,
+    midi_to_units,
+    units_to_midi,
+    TUNING_SYSTEMS,
+    TuningSystemRegistry,
     _edo_pitch_classes,
     EDO_SYSTEMS,
     PARTCH_43,
@@ -17,6 +33,7 @@ from .PitchGrid import (
     get_sruti_mask,
 )
 from .Pitch import note2midi
+from .Tuning import Tuning
 
 
 # ----------------------------------------------------------------------
@@ -311,4 +328,325 @@ def test_scale_masks_12tet_structure():
     # 7 notes per scale (church modes)
     for mode, pcs in SCALE_MASKS_12TET.items():
         assert len(pcs) == 7, f"{mode} should have 7 scale degrees"
-        assert all(0 <= p < 12 for p in pcs)
\ No newline at end of file
+        assert all(0 <= p < 12 for p in pcs)
+
+# ----------------------------------------------------------------------
+# ModularPitchGrid
+# ----------------------------------------------------------------------
+
+@pytest.mark.parametrize("system", ["edo12", "edo72", "partch43", "werckmeister3"])
+def test_modular_matches_from_pitch_classes(system):
+    pcs = get_system_pitch_classes(system)
+    g = PitchGrid.from_pitch_classes(pcs, "a3", 40.3, 90.7)
+    m = ModularPitchGrid(pcs, "a3", 40.3, 90.7)
+    assert m.sorted() == g.sorted()
+    assert len(m) == len(g)
+    assert all(v in m for v in g)
+
+    values = np.linspace(30.0, 100.0, 701)
+    quantised, indices, errors = m.quantise_many(values)
+    assert quantised.tolist() == [g.quantise(v) for v in values]
+    assert quantised.tolist() == [m.quantise(v) for v in values]
+    assert [m.sorted()[i] for i in indices] == quantised.tolist()
+    assert np.allclose(errors, quantised - values)
+
+
+def test_modular_continues_below_the_root_pitch_class():
+    # a is pitch class 9: from_pitch_classes starts at 9, the modular
+    # grid also has the classes of the octave below
+    g = PitchGrid.from_pitch_classes([0, 4, 7], 9, 0, 20)
+    m = ModularPitchGrid([0, 4, 7], 9, 0, 20)
+    assert g.sorted() == [9.0, 13.0, 16.0]
+    assert m.sorted() == [1.0, 4.0, 9.0, 13.0, 16.0]
+    assert m.sorted()[2:] == g.sorted()
+    assert m.quantise(0.0) == 1.0
+    assert m.quantise_many([0.0, 5.0])[0].tolist() == [1.0, 4.0]
+
+
+def test_modular_wraps_across_the_octave_and_clamps_to_range():
+    # c major triad around c4: 55, 60, 64, 67, 72
+    m = ModularPitchGrid([0, 4, 7], "c4", 55, 72)
+    assert m.sorted() == [55.0, 60.0, 64.0, 67.0, 72.0]
+    assert m.quantise(70.0) == 72.0   # nearest class is in the next octave
+    assert m.quantise(69.5) == 67.0   # tie → lower point
+    assert m.quantise(20.0) == 55.0
+    assert m.quantise(200.0) == 72.0
+    assert 48.0 not in m and 61.0 not in m
+
+
+def test_modular_folds_pitch_classes_and_constructors():
+    assert ModularPitchGrid([0, 12, 4], 60, 60, 72).sorted() == [60.0, 64.0, 72.0]
+    m = ModularPitchGrid.fromChurchModes("dorian", "d4", 50, 70)
+    assert m.name == "dorian"
+    assert m.sorted() == PitchGrid.fromChurchModes("dorian", "d4", 50, 70).sorted()
+    assert isinstance(m.to_pitch_grid(), PitchGrid)
+
+
+def test_modular_rejects_non_finite_values():
+    m = ModularPitchGrid([0, 4, 7], "c4", 55, 72)
+    for value in (math.inf, -math.inf, math.nan):
+        assert value not in m
+        with pytest.raises(ValueError):
+            m.quantise(value)
+
+    quantised, indices, errors = m.quantise_many([61.0, math.inf, math.nan, -math.inf])
+    assert quantised[0] == 60.0 and indices[0] == 1
+    assert np.isnan(quantised[1:]).all()
+    assert indices[1:].tolist() == [-1, -1, -1]
+    assert np.isnan(errors[1:]).all()
+
+
+def test_modular_empty_range():
+    m = ModularPitchGrid([0], 60, 61, 62)
+    assert len(m) == 0
+    assert list(m) == []
+    with pytest.raises(ValueError):
+        m.quantise(61.5)
+    with pytest.raises(ValueError):
+        m.quantise_many([61.5])
+
+
+# ----------------------------------------------------------------------
+# FrozenPitchGrid / get_pitch_grid cache
+# ----------------------------------------------------------------------
+
+def test_frozen_pitch_grid_is_immutable_and_hashable():
+    g = FrozenPitchGrid.fromChurchModes("ionian", "c4", 60, 72)
+    assert g == PitchGrid.fromChurchModes("ionian", "c4", 60, 72)
+    assert hash(g) == hash(frozenset(g))
+    assert {g: "x"}[FrozenPitchGrid(g.sorted())] == "x"
+    assert g.quantise(61.4) == 62.0
+
+    for mutate in (lambda: g.add(61), lambda: g.discard(60), lambda: g.clear(),
+                   lambda: g.update([1]), lambda: g.__ior__({1})):
+        with pytest.raises(TypeError):
+            mutate()
+    with pytest.raises(TypeError):
+        g.name = "other"
+    assert 61 not in g
+
+
+def test_frozen_pitch_grid_copies():
+    g = FrozenPitchGrid([1.0, 2.0], name="f")
+    g.quantise(1.2)
+    assert copy.copy(g) is g
+    for c in (copy.copy(g), copy.deepcopy(g)):
+        assert c == g and hash(c) == hash(g) and c.name == "f"
+        assert c.quantise(1.8) == 2.0
+        with pytest.raises(TypeError):
+            c.add(3.0)
+
+
+def test_get_pitch_grid_returns_shared_instances():
+    PITCH_GRID_CACHE.clear()
+    a = get_pitch_grid("dorian", "d4", 50, 70)
+    b = get_pitch_grid("Dorian", 62, 70, 50)   # same key after normalisation
+    assert a is b
+    assert isinstance(a, FrozenPitchGrid)
+    assert a == PitchGrid.fromChurchModes("dorian", "d4", 50, 70)
+
+    assert get_pitch_grid("range", min_midi=60, max_midi=64).sorted() == [60, 61, 62, 63, 64]
+    assert get_pitch_grid("abhogi", "c4", 48, 72).name == "abhogi"
+    assert len(get_pitch_grid("edo24", "c4", 60, 72)) == 25
+
+    info = PITCH_GRID_CACHE.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 4, 4)
+
+    with pytest.raises(KeyError):
+        get_pitch_grid("made_up_system")
+
+
+def test_pitch_grid_cache_evicts_least_recently_used():
+    cache = PitchGridCache(maxsize=2)
+    cache.get("a", lambda: FrozenPitchGrid([1]))
+    cache.get("b", lambda: FrozenPitchGrid([2]))
+    cache.get("a", lambda: FrozenPitchGrid([1]))   # "b" is now oldest
+    cache.get("c", lambda: FrozenPitchGrid([3]))
+    assert cache.get("a", lambda: None) == {1}
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 3, 1, 2)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+# ----------------------------------------------------------------------
+# ExactPitchGrid / integer pitch units
+# ----------------------------------------------------------------------
+
+def test_midi_units_roundtrip():
+    assert midi_to_units(60) == 18000
+    assert midi_to_units(Fraction(181, 3)) == 18100
+    assert midi_to_units(60 + 1 / 3) == 18100      # float noise is absorbed
+    assert units_to_midi(18150) == 60.5
+    assert units_to_midi([18000, 18150]).tolist() == [60.0, 60.5]
+    with pytest.raises(ValueError):
+        midi_to_units(Fraction(1, 7))
+    with pytest.raises(TypeError):
+        midi_to_units("c4")
+
+
+def test_EDO_SYSTEMS_EXACT_matches_float_systems():
+    assert EDO_SYSTEMS_EXACT.keys() == EDO_SYSTEMS.keys()
+    for name, pcs in EDO_SYSTEMS_EXACT.items():
+        assert all(isinstance(p, Fraction) for p in pcs)
+        assert [float(p) for p in pcs] == pytest.approx(EDO_SYSTEMS[name])
+
+
+def test_exact_grid_dedupes_near_equal_floats():
+    g = ExactPitchGrid([60 + 1 / 3, Fraction(181, 3), note2midi("css4"), 60.0])
+    assert len(g) == 2
+    assert sorted(g) == [18000, 18100]
+    assert g.contains_midi(Fraction(181, 3))
+    assert not g.contains_midi(61)
+    assert g.midis.tolist() == [60.0, 181 / 3]
+    with pytest.raises(TypeError):
+        ExactPitchGrid(["c4"])
+
+
+def test_exact_grid_accepts_generators():
+    g = ExactPitchGrid(v for v in [60, 61, 60.0])
+    assert sorted(g) == [18000, 18300]
+    assert g.midis.tolist() == [60.0, 61.0]
+
+
+def test_exact_grid_from_system_matches_float_grid():
+    exact = ExactPitchGrid.from_system("edo53", "c4", 48, 72)
+    floats = PitchGrid.from_pitch_classes(EDO_SYSTEMS["edo53"], "c4", 48, 72)
+    assert exact.unitsPerOctave % 53 == 0
+    assert len(exact) == len(floats)
+    assert np.allclose(exact.midis, floats.sorted())
+
+    values = np.linspace(40.0, 80.0, 401)
+    quantised, indices, errors = exact.quantise_midi_many(values)
+    assert np.allclose(quantised, [floats.quantise(v) for v in values])
+    assert np.array_equal(quantised, exact.midis[indices])
+    assert exact.quantise_midi(60.1) == 60.0
+
+
+def test_exact_grid_integer_quantisation_and_constructors():
+    g = ExactPitchGrid.from_notes(["c4", "css4", 61])
+    quantised, indices, errors = g.quantise_units_many([17000, 18040, 18060])
+    assert quantised.tolist() == [18000, 18000, 18100]
+    assert indices.tolist() == [0, 0, 1]
+    assert errors.tolist() == [1000, -40, 40]
+
+    r = ExactPitchGrid.from_range(60, 62, Fraction(1, 3))
+    assert len(r) == 7
+    assert ExactPitchGrid.fromChurchModes("dorian", "d4", 50, 70).midis.tolist() == \
+        sorted(PitchGrid.fromChurchModes("dorian", "d4", 50, 70))
+
+
+# ----------------------------------------------------------------------
+# spectral constructors
+# ----------------------------------------------------------------------
+
+def test_from_freqs_converts_and_dedupes():
+    g = PitchGrid.from_freqs([440.0, 880.0, 440.0, 0.0, -5.0, 220.0], name="spec")
+    assert g.name == "spec"
+    assert g.sorted() == [57.0, 69.0, 81.0]
+
+    # reference pitch from the composition's Tuning
+    tuning = Tuning(refFreq=443.0, refMidi=69)
+    g443 = PitchGrid.from_freqs([443.0, 886.0, 440.0], tuning)
+    assert g443.sorted()[1:] == [69.0, 81.0]
+    assert g443.sorted()[0] == pytest.approx(tuning.freq_to_midi(440.0))
+    assert PitchGrid.from_harmonics(443.0, 2, tuning=tuning).sorted() == [69.0, 81.0]
+
+    close = PitchGrid.from_freqs([440.0, 441.0, 442.0, 466.16], tolerance=0.1)
+    assert close.sorted()[0] == 69.0
+    assert len(close) == 2
+
+    ranged = PitchGrid.from_freqs([110.0, 440.0, 1760.0], min_midi=50, max_midi=90)
+    assert ranged.sorted() == [69.0]          # 45 and 93 are outside
+
+
+def test_from_harmonics_and_subharmonics():
+    g = PitchGrid.from_harmonics(55.0, 8)
+    assert len(g) == 8
+    assert g.sorted()[:2] == [33.0, 45.0]
+    assert g.sorted()[2] == pytest.approx(33.0 + 12 * math.log2(3))
+
+    u = PitchGrid.from_subharmonics(880.0, 4)
+    assert u.sorted() == pytest.approx([57.0, 81.0 - 12 * math.log2(3), 69.0, 81.0])
+
+
+def test_dense_harmonics_merge_against_kept_points():
+    # partials 100..200 of 55 Hz are all closer than 0.25 semitones to
+    # their neighbour; merging must not chain them into one cluster
+    g = PitchGrid.from_harmonics(55.0, 200, tolerance=0.25)
+    points = g.sorted()
+    assert points[-1] == pytest.approx(33.0 + 12 * math.log2(200), abs=0.25)
+    assert np.all(np.diff(points) > 0.25)
+
+
+def test_from_fm_reflects_negative_sidebands():
+    g = PitchGrid.from_fm(440.0, 110.0, 4)
+    # 0 Hz is dropped, 440 - 4*110 = 0; 440 - 3*110 = 110 Hz
+    assert g.sorted()[0] == 45.0
+    assert g.sorted()[-1] == 81.0
+    assert len(g) == 8
+    # carrier 100, modulator 300: |100 - 300| = 200 Hz reflected
+    assert PitchGrid.from_fm(100.0, 300.0, 1).sorted() == \
+        PitchGrid.from_freqs([100.0, 200.0, 400.0]).sorted()
+    assert isinstance(FrozenPitchGrid.from_fm(440.0, 110.0, 2), FrozenPitchGrid)
+
+
+# ----------------------------------------------------------------------
+# TUNING_SYSTEMS registry
+# ----------------------------------------------------------------------
+
+def test_registry_builtin_and_any_edo():
+    assert {"edo12", "partch43", "werckmeister3"} <= set(TUNING_SYSTEMS.names())
+    assert TUNING_SYSTEMS.pitch_classes("edo12") == tuple(EDO_SYSTEMS["edo12"])
+    assert "edo31" in TUNING_SYSTEMS and "nonsense" not in TUNING_SYSTEMS
+    assert len(get_system_pitch_classes("edo31")) == 31
+    assert len(get_system_pitch_classes("meantoneQuarterComma")) == 12
+
+    array = TUNING_SYSTEMS.array("edo31")
+    assert array is TUNING_SYSTEMS.array("EDO31")   # cached
+    assert not array.flags.writeable
+    assert np.all(np.diff(array) > 0)
+
+
+def test_registry_grids_are_shared_and_immutable():
+    g = TUNING_SYSTEMS.grid("edo31", "c4", 60, 72)
+    assert isinstance(g, FrozenPitchGrid)
+    assert len(g) == 32
+    assert TUNING_SYSTEMS.grid("edo31", "c4", 60, 72) is g
+    m = TUNING_SYSTEMS.modular_grid("edo31", "c4", 60, 72)
+    assert m.sorted() == g.sorted()
+
+
+def test_registry_register_lazy_and_replace():
+    registry = TuningSystemRegistry()
+    calls = []
+
+    def slendro():
+        calls.append(1)
+        return [0, 2.4, 4.8, 7.2, 9.6]
+
+    registry.register("Slendro", slendro)
+    assert calls == []                      # not built until used
+    assert registry.pitch_classes("slendro") == (0, 2.4, 4.8, 7.2, 9.6)
+    registry.pitch_classes("slendro")
+    assert calls == [1]
+
+    with pytest.raises(ValueError):
+        registry.register("slendro", [0])
+    registry.register("slendro", [0, 6], replace=True)
+    assert registry.array("slendro").tolist() == [0.0, 6.0]
+
+    with pytest.raises(KeyError):
+        registry.pitch_classes("unknown")
+
+
+def test_registered_system_in_get_pitch_grid():
+    TUNING_SYSTEMS.register("test-pelog", [0, 1.2, 2.7, 5.4, 6.6, 7.9, 9.6])
+    try:
+        g = get_pitch_grid("test-pelog", "c4", 60, 72)
+        assert g.sorted()[:3] == [60.0, 61.2, 62.7]
+        TUNING_SYSTEMS.register("test-pelog", [0, 6], replace=True)
+        assert get_pitch_grid("test-pelog", "c4", 60, 72).sorted() == [60.0, 66.0, 72.0]
+    finally:
+        TUNING_SYSTEMS.unregister("test-pelog")
+    assert "test-pelog" not in TUNING_SYSTEMS
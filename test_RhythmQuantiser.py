@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from .RhythmQuantiser import RhythmQuantiser
+from .TimeGrid import TimeGrid
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+def test_init_defaults_and_ppq():
+    rq = RhythmQuantiser([5, 7, 8])
+    assert rq.possibleSubdivision == [5, 7, 8]
+    assert rq.ppq == 280
+    assert rq.complexity[8] == pytest.approx(3.0)
+    assert rq.complexity[7] == pytest.approx(7.0)
+
+
+def test_init_rejects_non_positive():
+    with pytest.raises(ValueError):
+        RhythmQuantiser([0, 4])
+
+
+# ---------------------------------------------------------------------------
+# One subdivision per beat
+# ---------------------------------------------------------------------------
+
+def test_no_mixed_subdivisions_within_a_beat():
+    rq = RhythmQuantiser([5, 7], complexityWeight=0.0)
+    # 0.2 is a quintuplet point, 0.43 is nearest to the septuplet 3/7;
+    # the union grid would mix both inside beat 0
+    tg = TimeGrid(durationBeats=2, possibleSubdivision=[5, 7])
+    assert tg.quantize_beat(0.2) == pytest.approx(0.2)
+    assert tg.quantize_beat(0.43) == pytest.approx(3 / 7)
+
+    ticks, subdivs = rq.quantise_ticks([0.2, 0.43])
+    assert subdivs[0] == subdivs[1]
+
+
+def test_choice_minimises_error():
+    rq = RhythmQuantiser([3, 4], complexityWeight=0.0)
+    occupied, chosen = rq.choose_subdivisions([0.33, 0.67, 1.25, 1.5, 1.74])
+    assert list(occupied) == [0, 1]
+    assert list(chosen) == [3, 4]
+
+    q = rq.quantise_beats([0.33, 0.67, 1.25, 1.5, 1.74])
+    assert q == pytest.approx([1 / 3, 2 / 3, 1.25, 1.5, 1.75])
+
+
+def test_complexity_penalty_prefers_simple_subdivision():
+    points = [0.26, 0.52]
+    plain = RhythmQuantiser([4, 7], complexityWeight=0.0)
+    assert list(plain.choose_subdivisions(points)[1]) == [4]
+    assert list(RhythmQuantiser([4, 5], complexityWeight=0.0).choose_subdivisions([0.2, 0.4])[1]) == [5]
+    # heavy tuplet penalty → stay binary
+    assert list(RhythmQuantiser([4, 5], complexityWeight=1.0).choose_subdivisions([0.2, 0.4])[1]) == [4]
+
+
+def test_change_penalty_keeps_adjacent_beats_consistent():
+    points = [0.33, 1.24, 1.5]
+    free = RhythmQuantiser([3, 4], complexityWeight=0.0)
+    assert list(free.choose_subdivisions(points)[1]) == [3, 4]
+
+    sticky = RhythmQuantiser([3, 4], complexityWeight=0.0, changePenalty=1.0)
+    chosen = sticky.choose_subdivisions(points)[1]
+    assert chosen[0] == chosen[1]
+
+    # non-adjacent beats are not tied together
+    apart = sticky.choose_subdivisions([0.33, 2.24, 2.5])[1]
+    assert list(apart) == [3, 4]
+
+
+def test_points_snap_to_next_downbeat_and_shape():
+    rq = RhythmQuantiser([4])
+    ticks, subdivs = rq.quantise_ticks(np.array([[0.95, 2.1], [3.0, 0.0]]))
+    assert ticks.shape == (2, 2)
+    assert ticks.tolist() == [[4, 8], [12, 0]]
+
+
+def test_empty_input():
+    rq = RhythmQuantiser([4])
+    ticks, subdivs = rq.quantise_ticks([])
+    assert ticks.shape == (0,)
@@ -0,0 +1,183 @@
+import json
+import math
+import os
+
+import pytest
+
+from . import Scala
+from .Scala import ScalaArchive, parse_scl, parse_kbm
+from .PitchGrid import TUNING_SYSTEMS, get_pitch_grid
+
+JI_MAJOR = """! ji_major.scl
+!
+Just intonation major
+ 7
+!
+ 9/8
+ 5/4
+ 4/3
+ 3/2
+ 5/3
+ 15/8
+ 2/1
+"""
+
+BOHLEN_PIERCE = """! bp.scl
+Bohlen-Pierce, 13 equal divisions of 3/1
+13
+""" + "\n".join(f"{1901.955 * i / 13:.5f}" for i in range(1, 13)) + "\n3/1\n"
+
+WHITE_KEYS = """! 12 keys onto a 7-note scale, a4 = 440 Hz
+12
+0
+127
+60
+69
+440.0
+7
+0
+x
+1
+x
+2
+3
+x
+4
+x
+5
+x
+6
+"""
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    (tmp_path / "ji_major.scl").write_text(JI_MAJOR)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "bp.scl").write_text(BOHLEN_PIERCE)
+    (tmp_path / "broken.scl").write_text("only a description\n")
+    return tmp_path
+
+
+def test_parse_scl_ratios_and_cents():
+    scale = parse_scl(JI_MAJOR, name="ji")
+    assert len(scale) == 7
+    assert scale.description == "Just intonation major"
+    assert scale.period == 12.0
+    assert scale.pitchClasses[4] == pytest.approx(12 * math.log2(1.5))
+
+    bp = parse_scl(BOHLEN_PIERCE)
+    assert bp.period == pytest.approx(12 * math.log2(3))
+    assert not bp.is_octave_periodic
+    assert bp.pitchClasses[1] == pytest.approx(1.46304, abs=1e-5)
+
+    with pytest.raises(ValueError):
+        parse_scl("description\n3\n100.0\n")
+
+
+def test_scale_grid_repeats_by_period():
+    ji = parse_scl(JI_MAJOR)
+    assert len(ji.grid(60, 60, 72)) == 8
+    assert ji.grid(60, 60, 72).sorted()[-1] == 72.0
+
+    bp = parse_scl(BOHLEN_PIERCE)
+    grid = bp.grid(60, 50, 80).sorted()
+    assert 60.0 in grid
+    assert grid[0] >= 50 and grid[-1] <= 80
+    assert any(abs(p - (60 + bp.period)) < 1e-9 for p in grid)
+
+
+def test_keyboard_mapping():
+    mapping = parse_kbm(WHITE_KEYS)
+    assert (mapping.size, mapping.middleKey, mapping.referenceKey) == (12, 60, 69)
+    assert mapping.mapping[1] is None
+
+    keys, midis = mapping.key_pitches(parse_scl(JI_MAJOR))
+    assert 61 not in keys and 60 in keys
+    pitch = dict(zip(keys.tolist(), midis.tolist()))
+    assert pitch[69] == pytest.approx(69.0)                       # reference
+    assert pitch[60] == pytest.approx(69 - 12 * math.log2(5 / 3))
+    assert pitch[72] == pytest.approx(pitch[60] + 12)
+
+
+def test_archive_index_is_persistent(archive_dir):
+    archive = ScalaArchive(archive_dir)
+    assert archive.names() == ["bp", "ji_major"]        # broken file skipped
+    assert os.path.exists(archive.indexPath)
+    entry = json.loads(open(archive.indexPath).read())["entries"]["bp"]
+    assert entry["size"] == 13 and entry["path"] == os.path.join("sub", "bp.scl")
+
+    assert archive.search("pierce") == ["bp"]
+    assert archive.search(period=12.0) == ["ji_major"]
+    assert archive.search(size=7) == ["ji_major"]
+
+    # a second archive reads the index without parsing anything
+    again = ScalaArchive(archive_dir)
+    assert again.index == archive.index
+    assert again._scales == {}
+    scale = again.scale("JI_MAJOR")
+    assert again.scale("ji_major") is scale
+    with pytest.raises(KeyError):
+        again.scale("missing")
+
+
+def test_archive_refresh_picks_up_changes(archive_dir):
+    archive = ScalaArchive(archive_dir)
+    (archive_dir / "pent.scl").write_text("pentatonic\n5\n200.\n400.\n700.\n900.\n2/1\n")
+    assert "pent" not in archive
+    archive.refresh()
+    assert "pent" in archive
+    assert archive.scale("pent").pitchClasses == (0.0, 2.0, 4.0, 7.0, 9.0)
+
+
+def test_archive_names_clashing_files_by_path(archive_dir):
+    (archive_dir / "a").mkdir()
+    (archive_dir / "a" / "ji_major.scl").write_text(JI_MAJOR.replace("major", "copy"))
+    archive = ScalaArchive(archive_dir)
+    assert archive.names() == ["a/ji_major", "bp", "ji_major"]
+    assert archive.index["a/ji_major"]["description"] == "Just intonation copy"
+    assert archive.scale("ji_major").description == "Just intonation major"
+
+
+def test_archive_in_read_only_location(archive_dir):
+    index = archive_dir / "missing-dir" / "index.json"
+    with pytest.warns(UserWarning, match="cannot write index"):
+        archive = ScalaArchive(archive_dir, indexPath=str(index))
+    assert archive.names() == ["bp", "ji_major"]
+    assert not index.exists()
+
+
+@pytest.mark.parametrize("content", ['[1, 2]', '{"version": 2}',
+                                     '{"version": 2, "entries": []}', '"index"'])
+def test_archive_rebuilds_malformed_index(archive_dir, content):
+    (archive_dir / ScalaArchive.INDEX_FILE).write_text(content)
+    archive = ScalaArchive(archive_dir)
+    assert archive.names() == ["bp", "ji_major"]
+    assert json.loads((archive_dir / ScalaArchive.INDEX_FILE).read_text())["version"] == 2
+
+
+def test_archive_skips_unreadable_files(archive_dir, monkeypatch):
+    os.symlink(archive_dir / "nowhere.scl", archive_dir / "dangling.scl")
+    (archive_dir / "locked.scl").write_text(JI_MAJOR)
+    load_scl = Scala.load_scl
+
+    def failing_load(path):
+        if path.endswith("locked.scl"):
+            raise PermissionError(path)
+        return load_scl(path)
+
+    monkeypatch.setattr(Scala, "load_scl", failing_load)
+    archive = ScalaArchive(archive_dir)
+    assert archive.names() == ["bp", "ji_major"]
+
+
+def test_archive_register_in_tuning_systems(archive_dir):
+    archive = ScalaArchive(archive_dir)
+    archive.register()
+    try:
+        assert "scl:ji_major" in TUNING_SYSTEMS
+        assert "scl:bp" not in TUNING_SYSTEMS          # not octave-periodic
+        grid = get_pitch_grid("scl:ji_major", "c4", 60, 72)
+        assert grid.sorted() == archive.scale("ji_major").grid(60, 60, 72).sorted()
+    finally:
+        TUNING_SYSTEMS.unregister("scl:ji_major")
@@ -0,0 +1,94 @@
+import math
+import numpy as np
+import pytest
+
+from .TempoMap import TempoMap
+from .TimeGrid import TimeGrid
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+def test_constant_map():
+    tm = TempoMap.constant(120)
+    assert len(tm) == 1
+    assert tm.bpm_at(100) == 120
+    assert tm.beat_to_sec(4) == pytest.approx(2.0)
+    assert tm.sec_to_beat(2.0) == pytest.approx(4.0)
+
+
+def test_invalid_maps_raise():
+    with pytest.raises(ValueError):
+        TempoMap([])
+    with pytest.raises(ValueError):
+        TempoMap([(1, 120)])
+    with pytest.raises(ValueError):
+        TempoMap([(0, 120), (4, 0)])
+    with pytest.raises(ValueError):
+        TempoMap([(0, 120), (4, 90), (4, 100)])
+
+
+# ---------------------------------------------------------------------------
+# Piecewise constant and ramped tempi
+# ---------------------------------------------------------------------------
+
+def test_piecewise_constant():
+    tm = TempoMap([(0, 120), (4, 60)])
+    assert tm.beat_to_sec(4) == pytest.approx(2.0)
+    assert tm.beat_to_sec(6) == pytest.approx(4.0)
+    assert tm.sec_to_beat(3.0) == pytest.approx(5.0)
+    assert tm.bpm_at(3.99) == 120
+    assert tm.bpm_at(4) == 60
+
+
+def test_linear_ramp_matches_numeric_integration():
+    tm = TempoMap([(0, 60, True), (8, 120), (12, 90)])
+
+    # tempo moves linearly 60 → 120 over beats 0..8
+    assert tm.bpm_at(4) == pytest.approx(90)
+
+    xs = np.linspace(0, 8, 200001)
+    secs = np.trapezoid(60.0 / (60 + 7.5 * xs), xs)
+    assert tm.beat_to_sec(8) == pytest.approx(secs, rel=1e-9)
+    assert tm.beat_to_sec(8) == pytest.approx(8 * math.log(2))
+
+    # constant 120 afterwards
+    assert tm.beat_to_sec(10) == pytest.approx(8 * math.log(2) + 1.0)
+
+
+def test_roundtrip_scalar_and_vectorized():
+    tm = TempoMap([(0, 100), (3, 100, True), (7, 140, True), (11, 70), (20, 90)])
+    beats = np.linspace(0, 30, 301)
+    secs = tm.beats_to_secs(beats)
+
+    assert np.all(np.diff(secs) > 0)
+    assert secs == pytest.approx([tm.beat_to_sec(b) for b in beats])
+    assert tm.secs_to_beats(secs) == pytest.approx(beats)
+    assert [tm.sec_to_beat(s) for s in secs] == pytest.approx(list(beats))
+
+
+# ---------------------------------------------------------------------------
+# TimeGrid integration
+# ---------------------------------------------------------------------------
+
+def test_timegrid_with_tempo_map():
+    tm = TempoMap([(0, 120), (4, 60)])
+    tg = TimeGrid(durationBeats=8, possibleSubdivision=[2], tempoMap=tm)
+
+    assert tg.bpm == 120
+    assert tg.durationSec == pytest.approx(2.0 + 4.0)
+    assert tg.beat_to_sec(5) == pytest.approx(3.0)
+
+    # 3.3 s → beat 5.3 → 5.5 → 3.5 s
+    assert tg.quantize_sec(3.3) == pytest.approx(3.5)
+    q, idx, err = tg.quantize_secs_many([0.3, 3.3, 5.9])
+    assert q == pytest.approx([0.25, 3.5, 6.0])
+
+
+def test_timegrid_tempo_map_from_changes_and_seconds():
+    tg = TimeGrid(durationSec=6.0, possibleSubdivision=[1],
+                  tempoMap=[(0, 120), (4, 60)])
+    assert isinstance(tg.tempoMap, TempoMap)
+    assert tg.durationBeats == pytest.approx(8.0)
+    assert max(tg) == pytest.approx(8.0)
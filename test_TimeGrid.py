@@ -1,7 +1,9 @@
+import copy
 import math
+import numpy as np
 import pytest
 
-from GreasyPidgin.TimeGrid import TimeGrid  # or `from TimeGrid import TimeGrid`
+from GreasyPidgin.TimeGrid import TimeGrid, ArrayTimeGrid, LazyTimeGrid  # or `from TimeGrid import ...`
 
 
 # ---------------------------------------------------------------------------
@@ -208,4 +210,172 @@ def test_timegrid_is_grid_subclass():
     # basic set-like behaviour
     assert isinstance(tg, set)
     assert 0.0 in tg
-    assert 1.0 in tg
\ No newline at end of file
+    assert 1.0 in tg
+
+# ---------------------------------------------------------------------------
+# Batch quantisation
+# ---------------------------------------------------------------------------
+
+def test_quantize_beats_many_matches_scalar():
+    tg = TimeGrid(durationBeats=4.0, bpm=120, possibleSubdivision=[3, 4])
+    beats = np.array([0.1, 0.3, 1.45, 2.9, 5.0])
+    q, idx, err = tg.quantize_beats_many(beats)
+    assert list(q) == [tg.quantize_beat(b) for b in beats]
+    assert np.allclose(err, q - beats)
+
+    q3, _, _ = tg.quantize_beats_many(beats, subdivision=3)
+    assert list(q3) == [tg.quantize_beat(b, subdivision=3) for b in beats]
+
+
+def test_quantize_secs_many():
+    tg = TimeGrid(durationBeats=4.0, bpm=60, possibleSubdivision=[2])
+    secs = np.array([0.6, 1.8, 3.26])
+    q, idx, err = tg.quantize_secs_many(secs)
+    assert q == pytest.approx([0.5, 2.0, 3.5])
+    assert err == pytest.approx(q - secs)
+
+
+# ---------------------------------------------------------------------------
+# ArrayTimeGrid (compact storage mode)
+# ---------------------------------------------------------------------------
+
+def test_array_timegrid_matches_timegrid():
+    tg = TimeGrid(durationBeats=3.0, bpm=90, possibleSubdivision=[3, 4, 5])
+    ag = ArrayTimeGrid(durationBeats=3.0, bpm=90, possibleSubdivision=[3, 4, 5])
+
+    assert ag == tg
+    assert ag.sorted() == tg.sorted()
+    for subdiv in (3, 4, 5):
+        assert ag.grids[subdiv] == tg.grids[subdiv]
+
+    assert ag.quantize_beat(1.41) == tg.quantize_beat(1.41)
+    assert ag.quantize_sec(0.7, subdivision=4) == tg.quantize_sec(0.7, subdivision=4)
+    with pytest.raises(KeyError):
+        ag.quantize_beat(0.3, subdivision=7)
+
+
+def test_array_timegrid_extend_to_beat():
+    ag = ArrayTimeGrid(durationBeats=1.0, bpm=120, possibleSubdivision=[2])
+    ag.extend_to_beat(3.0)
+    assert ag.durationBeats == pytest.approx(3.0)
+    assert 2.5 in ag.grids[2]
+    assert max(ag) == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize("cls", [TimeGrid, ArrayTimeGrid])
+def test_copy_then_extend(cls):
+    a = cls(durationBeats=4, possibleSubdivision=[2])
+    a.quantize_beat(1.2)
+    a.extend_to_beat(6)
+    b, c = copy.copy(a), copy.copy(a)
+    b.extend_to_beat(7)
+    c.extend_to_beat(9)
+    assert b.sorted()[-3:] == [6.0, 6.5, 7.0]
+    assert c.sorted()[-3:] == [8.0, 8.5, 9.0]
+    assert a.sorted()[-1] == 6.0 and max(a.grids[2]) == 6.0
+    assert b.quantize_beat(6.9) == 7.0 and c.quantize_beat(8.8) == 9.0
+
+
+# ---------------------------------------------------------------------------
+# LazyTimeGrid (non-materialised)
+# ---------------------------------------------------------------------------
+
+def test_lazy_timegrid_matches_timegrid():
+    tg = TimeGrid(durationBeats=4.0, bpm=90, possibleSubdivision=[3, 4, 6])
+    lg = LazyTimeGrid(durationBeats=4.0, bpm=90, possibleSubdivision=[3, 4, 6])
+
+    points = list(lg)
+    assert points == sorted(points)
+    assert len(lg) == len(points)
+    assert len(lg) == len({round(p * 12) for p in tg})
+    assert all(p in lg for p in tg)
+    assert 0.1 not in lg
+
+    beats = np.array([-0.4, 0.1, 0.45, 1.2, 2.71, 3.99, 7.0])
+    for b in beats:
+        assert lg.quantize_beat(b) == pytest.approx(tg.quantize_beat(b))
+        assert lg.quantize_beat(b, subdivision=4) == tg.quantize_beat(b, subdivision=4)
+    assert lg.quantize_sec(1.1) == pytest.approx(tg.quantize_sec(1.1))
+
+    q, idx, err = lg.quantize_beats_many(beats)
+    assert q == pytest.approx([lg.quantize_beat(b) for b in beats])
+    assert [points[i] for i in idx] == pytest.approx(list(q))
+    assert err == pytest.approx(q - beats)
+
+
+def test_lazy_timegrid_long_duration_and_extend():
+    # ten hours at 120 bpm — nothing is materialised
+    lg = LazyTimeGrid(durationSec=36000, bpm=120, possibleSubdivision=[3, 4, 5, 7])
+    assert lg.quantize_beat(71999.96) == pytest.approx(72000.0)
+    assert 12345 + 2 / 7 in lg
+
+    lg.extend_to_beat(80000)
+    assert lg.durationBeats == pytest.approx(80000)
+    assert lg.quantize_beat(79999.99) == pytest.approx(80000.0)
+    assert len(lg.grids[4]) == 80000 * 4 + 1
+
+
+@pytest.mark.parametrize("value", [math.inf, -math.inf, math.nan])
+def test_lazy_timegrid_rejects_non_finite_membership(value):
+    lg = LazyTimeGrid(durationBeats=4.0, bpm=120, possibleSubdivision=[3, 4])
+    tg = TimeGrid(durationBeats=4.0, bpm=120, possibleSubdivision=[3, 4])
+    assert value not in lg
+    assert value not in tg
+    assert value not in lg.grids[3]
+    with pytest.raises(ValueError):
+        lg.quantize_beat(value)
+    q, idx, _ = lg.quantize_beats_many([value, 1.3])
+    assert np.isnan(q[0]) and q[1] == pytest.approx(4 / 3)
+    assert list(idx) == [-1, 8]
+
+
+# ---------------------------------------------------------------------------
+# Incremental extension
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("cls", [TimeGrid, ArrayTimeGrid, LazyTimeGrid])
+def test_incremental_extend_matches_fresh_grid(cls):
+    tg = cls(durationBeats=1.0, bpm=120, possibleSubdivision=[3, 4, 5])
+    assert tg.quantize_beat(0.97) == pytest.approx(1.0)  # builds the index
+
+    beat = 1.0
+    for _ in range(40):
+        beat += 0.37
+        tg.extend_to_beat(beat)
+        assert tg.quantize_beat(beat + 0.2) <= beat + 1e-9
+
+    fresh = cls(durationBeats=beat, bpm=120, possibleSubdivision=[3, 4, 5])
+    assert tg.durationBeats == pytest.approx(beat)
+    assert tg.sorted() == fresh.sorted()
+    for subdiv in (3, 4, 5):
+        assert tg.grids[subdiv].sorted() == fresh.grids[subdiv].sorted()
+    assert tg.quantize_beat(7.41) == fresh.quantize_beat(7.41)
+
+
+# ---------------------------------------------------------------------------
+# Integer tick timebase
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("cls", [TimeGrid, ArrayTimeGrid, LazyTimeGrid])
+def test_ticks_dedupe_shared_points_exactly(cls):
+    tg = cls(durationBeats=10.0, bpm=120, possibleSubdivision=[3, 6, 7])
+    assert tg.ppq == 42
+    # 3 and 6 share every third of a beat → only 6ths and 7ths remain
+    assert len(tg) == len(tg.ticks) == 10 * 6 + 10 * 7 - 10 + 1
+    assert list(tg.ticks[:4]) == [0, 6, 7, 12]
+    assert tg.sorted() == [t / 42 for t in tg.ticks]
+    for subdiv in (3, 6, 7):
+        assert all(p in tg for p in tg.grids[subdiv])
+
+
+def test_tick_conversions():
+    tg = TimeGrid(durationBeats=4.0, bpm=120, possibleSubdivision=[4, 5])
+    assert tg.ppq == 20
+    assert tg.beat_to_tick(1.25) == 25
+    assert tg.tick_to_beat(25) == 1.25
+    assert tg.sec_to_tick(0.5) == 20
+    assert tg.tick_to_sec(10) == pytest.approx(0.25)
+    assert list(tg.beats_to_ticks([0.2, 0.25, 3.0])) == [4, 5, 60]
+    assert tg.beat_to_tick(tg.quantize_beat(1.41)) == 28
+    assert tg.beatDurationSec == pytest.approx(0.5)
+    assert tg.fastestDivisionTime == pytest.approx(0.1)
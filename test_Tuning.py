@@ -0,0 +1,56 @@
+import math
+import numpy as np
+import pytest
+
+from .Tuning import Tuning
+from .PitchGrid import PitchGrid, ModularPitchGrid, ExactPitchGrid
+
+
+def test_scalar_conversions():
+    t = Tuning(refFreq=440.0, refMidi=69)
+    assert t.freq_to_midi(440.0) == 69.0
+    assert t.freq_to_midi(880.0) == 81.0
+    assert t.midi_to_freq(57) == 220.0
+    assert math.isclose(t.midi_to_freq(60), 261.6255653005986)
+    assert math.isclose(t.freq_to_midi(t.midi_to_freq(61.37)), 61.37)
+    with pytest.raises(ValueError):
+        t.freq_to_midi(0.0)
+
+
+def test_reference_pitch_is_honoured():
+    t = Tuning(refFreq=443.0, refMidi=69)
+    assert t.freq_to_midi(443.0) == 69.0
+    assert math.isclose(t.freq_to_midi(440.0), 69 + 12 * math.log2(440 / 443))
+
+
+def test_vectorized_matches_scalar():
+    t = Tuning(refFreq=443.0)
+    freqs = np.geomspace(20.0, 20000.0, 1000)
+    midis = t.freqs_to_midis(freqs)
+    assert np.allclose(midis, [t.freq_to_midi(f) for f in freqs])
+    assert np.allclose(t.midis_to_freqs(midis), freqs)
+    assert np.isnan(t.freqs_to_midis([0.0, -1.0])).all()
+
+
+def test_pitch_grid_uses_steps_per_octave():
+    t = Tuning(refFreq=443.0, refMidi=69, stepsPerOctave=24)
+    grid = t.pitch_grid(60, 72)
+    assert isinstance(grid, ModularPitchGrid)
+    assert grid.name == "edo24"
+    assert len(grid) == 25
+    assert 60.5 in grid and 69.0 in grid
+    assert t.step == 0.5
+
+
+@pytest.mark.parametrize("grid", [
+    PitchGrid.from_range(50, 70),
+    ModularPitchGrid(range(12), 0, 50, 70),
+    ExactPitchGrid.from_range(50, 70),
+])
+def test_quantise_freqs(grid):
+    t = Tuning()
+    midis, freqs, errors = t.quantise_freqs([262.0, 270.0, 5000.0, 0.0], grid)
+    assert midis[:3].tolist() == [60.0, 61.0, 70.0]
+    assert np.allclose(freqs[:3], t.midis_to_freqs([60, 61, 70]))
+    assert np.allclose(errors[:2], midis[:2] - t.freqs_to_midis([262.0, 270.0]))
+    assert np.isnan(midis[3]) and np.isnan(freqs[3])
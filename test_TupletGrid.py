@@ -0,0 +1,119 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from .TimeGrid import TimeGrid
+from .TupletGrid import RhythmTree, TupletGrid
+
+
+# ---------------------------------------------------------------------------
+# RhythmTree
+# ---------------------------------------------------------------------------
+
+def test_flat_tree():
+    t = RhythmTree(4)
+    assert t.points == tuple(Fraction(i, 4) for i in range(5))
+    assert t.ppq == 4
+
+
+def test_nested_triplet_in_quintuplet():
+    # 3 in the time of 2 fifths, then three plain fifths
+    t = RhythmTree([(2, 3), 1, 1, 1])
+    expected = {Fraction(0), Fraction(2, 15), Fraction(4, 15), Fraction(2, 5),
+                Fraction(3, 5), Fraction(4, 5), Fraction(1)}
+    assert set(t.points) == expected
+    assert t.ppq == 15
+
+    assert t.nearest(0.14) == pytest.approx(2 / 15)
+    assert t.nearest(0.34) == pytest.approx(2 / 5)
+    assert t.nearest(0.95) == pytest.approx(1.0)
+
+
+def test_deep_nesting():
+    t = RhythmTree([1, (1, [1, (1, 3)])])
+    assert Fraction(5, 6) in t.points
+    assert t.nearest(0.8) == pytest.approx(5 / 6)
+
+
+def test_invalid_trees_raise():
+    with pytest.raises(ValueError):
+        RhythmTree(0)
+    with pytest.raises(ValueError):
+        RhythmTree([1, (0, 2)])
+    with pytest.raises(ValueError):
+        RhythmTree("abc")
+
+
+# ---------------------------------------------------------------------------
+# TupletGrid
+# ---------------------------------------------------------------------------
+
+def make_grid():
+    tg = TimeGrid(durationBeats=4, bpm=60, possibleSubdivision=[1])
+    return TupletGrid(tg, trees={1: [(2, 3), 1, 1, 1], 2: 4}, default=2)
+
+
+def test_points_and_membership():
+    g = make_grid()
+    points = list(g)
+    assert points == sorted(points)
+    assert points[:3] == [0.0, 0.5, 1.0]
+    assert 1 + 2 / 15 in g
+    assert 2.75 in g
+    assert 0.25 not in g
+    assert len(g._trees) == 3  # default + two specific trees
+    assert g.ppq == 60
+
+
+def test_every_yielded_point_is_a_member():
+    g = TupletGrid(TimeGrid(durationBeats=4, possibleSubdivision=[1]),
+                   trees={1: [(2, 3), 1, 1, 1], 2: [(1, [1, 1, 1]), (2, 5)]})
+    assert 1.6 in g
+    assert all(p in g for p in g)
+    assert 1.5 not in g and -0.0 in g and 4.5 not in g
+
+
+def test_non_finite_values_are_not_members():
+    g = make_grid()
+    assert float("inf") not in g
+    assert float("-inf") not in g
+    assert float("nan") not in g
+
+
+def test_quantize_ties_resolve_to_lower_in_both_paths():
+    g = TupletGrid(TimeGrid(durationBeats=4, possibleSubdivision=[1]),
+                   trees={1: [(2, 3), 1, 1, 1], 3: 2})
+    # 1.2 lies halfway between 1 + 2/15 and 1 + 4/15, 1.7 between 1.6 and 1.8
+    beats = np.array([1.2, 1.7, 3.25, 3.75, 0.5])
+    q, _, _ = g.quantize_beats_many(beats)
+    assert q.tolist() == [g.quantize_beat(b) for b in beats]
+    assert q == pytest.approx([1 + 2 / 15, 1.6, 3.0, 3.5, 0.0])
+
+
+def test_quantize_scalar_and_vectorized_agree():
+    g = make_grid()
+    beats = np.array([-1.0, 0.2, 0.3, 1.14, 1.34, 2.1, 2.9, 3.74, 9.0])
+    q, idx, err = g.quantize_beats_many(beats)
+
+    assert q == pytest.approx([g.quantize_beat(b) for b in beats])
+    assert q == pytest.approx([0.0, 0.0, 0.5, 1 + 2 / 15, 1.4, 2.0, 3.0, 3.5, 4.0])
+    assert err == pytest.approx(q - beats)
+    for b, i, qq in zip(beats, idx, q):
+        beat = min(int(max(b, 0)), 3)
+        assert beat + g.tree_at(beat).offsets[i] == pytest.approx(qq)
+
+    assert list(g.quantize_ticks_many([1.14, 3.74])) == [68, 210]
+
+
+def test_quantize_sec_uses_time_grid():
+    tg = TimeGrid(durationBeats=4, bpm=120, possibleSubdivision=[1])
+    g = TupletGrid(tg, trees=[None, 3])
+    # 0.7 s = beat 1.4 → 1 + 1/3 beat → 0.6667 s
+    assert g.quantize_sec(0.7) == pytest.approx((1 + 1 / 3) / 2)
+
+
+def test_tree_outside_grid_raises():
+    tg = TimeGrid(durationBeats=2, possibleSubdivision=[1])
+    with pytest.raises(KeyError):
+        TupletGrid(tg, trees={5: 3})
@@ -1,8 +1,10 @@
+import copy
 import math
 import numbers
+import numpy as np
 import pytest
 
-from .QuantisationGrid import Grid
+from .QuantisationGrid import Grid, ArrayGrid, SeriesGrid
 
 
 # ------------------------------------------------------------
@@ -133,4 +135,247 @@ def test_fib():
     g = Grid.fib(size=7)
     # Fibonacci: 0, 1, 1, 2, 3, 5, 8 → set removes the duplicate 1
     assert set(g) == {0, 1, 2, 3, 5, 8}
-    assert max(g) == 8
\ No newline at end of file
+    assert max(g) == 8
+
+# ------------------------------------------------------------
+# Sorted index
+# ------------------------------------------------------------
+
+def test_closest_keeps_element_type():
+    g = Grid([0, 5, 10])
+    q = g.quantise(4.2)
+    assert q == 5
+    assert isinstance(q, int)
+
+
+def test_closest_outside_bounds():
+    g = Grid([1.0, 2.0, 3.0])
+    assert g.quantise(-100) == 1.0
+    assert g.quantise(100) == 3.0
+
+
+def test_closest_tie_resolves_to_lower():
+    g = Grid([1.0, 2.0])
+    assert g.quantise(1.5) == 1.0
+
+
+def test_closest_exact_for_values_beyond_float64():
+    # 2**60 + 1 rounds to 2**60 in float64: use the exact scan
+    g = Grid([2**60, 2**60 + 1])
+    assert g.quantise(2**60 + 1) == 2**60 + 1
+    assert Grid([0, 2]).quantise(2**60 + 1) == 2
+    with pytest.raises(TypeError):
+        g.quantise_many([1.0])
+
+
+def test_index_invalidated_on_mutation():
+    g = Grid([0, 10])
+    assert g.quantise(7) == 10
+    g.add(6)
+    assert g.quantise(7) == 6
+    g.discard(6)
+    assert g.quantise(7) == 10
+    g |= {8}
+    assert g.quantise(7) == 8
+    g -= {8}
+    assert g.quantise(7) == 10
+    g.update([7.5])
+    assert g.sorted() == [0, 7.5, 10]
+    g.clear()
+    with pytest.raises(ValueError):
+        g.quantise(7)
+
+
+def test_closest_fallback_objects():
+    class A:
+        def __init__(self, x): self.x = x
+        def __lt__(self, other): return self.x < other.x
+        def __sub__(self, other): return self.x - other.x
+
+    a1, a2 = A(1), A(5)
+    g = Grid([a1, a2])
+    assert g.quantise(A(2)) is a1
+
+
+# ------------------------------------------------------------
+# Batch quantisation
+# ------------------------------------------------------------
+
+def test_quantise_many_matches_quantise():
+    g = Grid([0, 0.25, 1, 2.5, 4])
+    values = np.array([-1.0, 0.1, 0.2, 0.625, 1.7, 3.3, 10.0])
+    q, idx, err = g.quantise_many(values)
+
+    assert list(q) == [g.quantise(v) for v in values]
+    assert list(np.asarray(g.sorted())[idx]) == list(q)
+    assert np.allclose(err, q - values)
+
+
+def test_quantise_many_single_point_and_shape():
+    g = Grid([3.0])
+    q, idx, err = g.quantise_many([[1.0, 5.0], [3.0, 2.0]])
+    assert q.shape == (2, 2)
+    assert (q == 3.0).all()
+    assert (idx == 0).all()
+    assert err[0, 0] == 2.0
+
+
+def test_quantise_many_scalar_input():
+    for g in (Grid([1.0, 2.0]), ArrayGrid([1.0, 2.0]), SeriesGrid(1.0, 1.0, 2)):
+        q, idx, err = g.quantise_many(1.4)
+        assert q.shape == idx.shape == err.shape == ()
+        assert (float(q), int(idx)) == (1.0, 0)
+        assert float(err) == pytest.approx(-0.4)
+        assert float(g.quantise_many(1.6)[0]) == 2.0
+
+
+def test_quantise_many_errors():
+    with pytest.raises(ValueError):
+        Grid().quantise_many([1.0])
+    with pytest.raises(TypeError):
+        Grid([1, 2]).quantise_many(["hello"])
+
+
+# ------------------------------------------------------------
+# ArrayGrid (compact storage mode)
+# ------------------------------------------------------------
+
+def test_arraygrid_set_like_behaviour():
+    g = ArrayGrid([5, 1, 3, 3])
+    assert len(g) == 3
+    assert 3 in g
+    assert 3.0 in g
+    assert 2 not in g
+    assert "hello" not in g
+    assert list(g) == [1.0, 3.0, 5.0]
+    assert g.sorted() == [1.0, 3.0, 5.0]
+    assert g == {1, 3, 5}
+    assert g == Grid([1, 3, 5])
+    assert set(g | {7}) == {1, 3, 5, 7}
+
+
+def test_arraygrid_constructors_match_grid():
+    assert ArrayGrid.series(0, 0.25, 9) == Grid.series(0, 0.25, 9)
+    assert ArrayGrid.interpolation(0, 10, 6) == Grid.interpolation(0, 10, 6)
+    assert ArrayGrid.geom(1, 2, 4) == Grid.geom(1, 2, 4)
+    assert ArrayGrid.fill(5, lambda i: i * 2) == Grid.fill(5, lambda i: i * 2)
+    assert ArrayGrid.fill(4, 7).sorted() == [7.0]
+    assert ArrayGrid.fib(7) == Grid.fib(7)
+    r = ArrayGrid.rand(20, 0, 3, integer=True)
+    assert set(r) <= {0, 1, 2, 3}
+    assert all(type(v) is float for v in r)
+
+
+def test_arraygrid_quantise_and_update():
+    g = ArrayGrid([0, 5, 10])
+    assert g.quantise(6) == 5.0
+    assert g.quantise(7.5) == 5.0  # tie → lower
+    q, idx, err = g.quantise_many([6, 9.9, -3])
+    assert list(q) == [5.0, 10.0, 0.0]
+    assert list(idx) == [1, 2, 0]
+
+    g.update([6, 7])
+    assert g.quantise(6.4) == 6.0
+    g.add(100)
+    assert 100 in g
+
+    with pytest.raises(TypeError):
+        g.quantise("hello")
+    with pytest.raises(ValueError):
+        ArrayGrid().quantise(1)
+
+
+# ------------------------------------------------------------
+# SeriesGrid (lazy arithmetic series)
+# ------------------------------------------------------------
+
+def test_seriesgrid_matches_series():
+    sg = SeriesGrid(0.0, 1.0 / 3.0, 10)
+    g = Grid.series(0.0, 1.0 / 3.0, 10)
+    assert len(sg) == 10
+    assert sg == g
+    assert all(p in sg for p in g)
+    assert 0.5 not in sg
+    assert 10 / 3.0 + 1 not in sg
+    for v in (-1.0, 0.1, 0.17, 1.5, 2.9, 100.0):
+        assert sg.quantise(v) == g.quantise(v)
+
+    q, idx, err = sg.quantise_many([0.1, 1.5, 100.0])
+    assert list(q) == [g.quantise(v) for v in (0.1, 1.5, 100.0)]
+    assert list(idx) == [0, 5, 9]
+
+
+def test_seriesgrid_non_finite_quantise():
+    sg = SeriesGrid(0, 3, 10, divisor=12)
+    for v in (math.nan, math.inf, -math.inf):
+        with pytest.raises(ValueError):
+            sg.quantise(v)
+    q, idx, err = sg.quantise_many([math.nan, 0.3, math.inf])
+    assert np.isnan(q[0]) and np.isnan(q[2]) and q[1] == 0.25
+    assert list(idx) == [-1, 1, -1]
+    # the scalar path agrees with the vectorised one
+    for v in (-1.0, 0.125, 0.126, 1.1, 5.0):
+        assert sg.quantise(v) == sg.quantise_many(v)[0]
+
+
+def test_seriesgrid_rejects_bad_step():
+    with pytest.raises(ValueError):
+        SeriesGrid(0.0, 0.0, 3)
+
+
+def test_append_sorted_keeps_index():
+    g = Grid([0.0, 1.0])
+    g.quantise(0.2)
+    g._append_sorted([2.0, 3.0])
+    assert g._index is not None
+    assert g.quantise(2.9) == 3.0
+    assert g.sorted() == [0.0, 1.0, 2.0, 3.0]
+    g._append_sorted([0.5])  # out of order → falls back to update
+    assert g.sorted() == [0.0, 0.5, 1.0, 2.0, 3.0]
+
+    a = ArrayGrid([0.0, 1.0])
+    for i in range(2, 100):
+        a._append_sorted([float(i)])
+    assert a.sorted() == [float(i) for i in range(100)]
+    assert len(a._buffer) >= 100
+    a._append_sorted([0.5])
+    assert 0.5 in a and len(a) == 101
+
+
+def test_append_sorted_handles_unsorted_and_repeated_values():
+    g = Grid([1.0, 2.0, 3.0])
+    g.quantise(0.0)
+    g._append_sorted([5.0, 4.0])
+    assert g.sorted() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert g.quantise(4.2) == 4.0
+
+    h = Grid([1.0, 2.0, 3.0])
+    h.quantise(0.0)
+    h._append_sorted([4.0, 4.0, 5.0])
+    assert h.sorted() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert len(h) == 5
+
+    a = ArrayGrid([1.0, 2.0, 3.0])
+    a._append_sorted([5.0, 4.0, 4.0])
+    assert a.sorted() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_copies_do_not_share_appended_index():
+    g = Grid([0.0, 1.0])
+    g._append_sorted([2.0])           # index and buffer now over-allocated
+    h, k = copy.copy(g), copy.copy(g)
+    h._append_sorted([3.0])
+    k._append_sorted([5.0, 6.0])
+    g._append_sorted([4.0])
+    assert h.sorted() == [0.0, 1.0, 2.0, 3.0] and h.quantise(2.9) == 3.0
+    assert k.sorted() == [0.0, 1.0, 2.0, 5.0, 6.0] and k.quantise(5.9) == 6.0
+    assert g.sorted() == [0.0, 1.0, 2.0, 4.0] and g.quantise(3.9) == 4.0
+
+    a = ArrayGrid([0.0, 1.0])
+    a._append_sorted([2.0])
+    b, c = copy.copy(a), copy.copy(a)
+    b._append_sorted([3.0])
+    c._append_sorted([5.0])
+    assert b.sorted() == [0.0, 1.0, 2.0, 3.0]
+    assert c.sorted() == [0.0, 1.0, 2.0, 5.0]
+    assert a.sorted() == [0.0, 1.0, 2.0]
@@ -1,4 +1,6 @@
+import math
 import sys
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -210,4 +212,202 @@ def test_transposition_affects_sounding_range():
     # but as sounding pitch it’s too high (above 78):
     ok_s, hi_lo = ins.in_range(80, sounding=True)
     assert ok_s is False
-    assert hi_lo == 1
\ No newline at end of file
+    assert hi_lo == 1
+
+# ---------------------------------------------------------------------------
+# vectorized range logic
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("kwargs", [
+    {}, {"sounding": True}, {"allow_microtones": True}, {"allow_missing_notes": True},
+])
+def test_many_variants_match_scalar(kwargs):
+    ins = Instrument(rangeMidi=(40, 80), microTones=False,
+                     transposition_semitones=-2, missing_notes={41, 53, 65})
+    rng = np.random.default_rng(0)
+    midis = np.concatenate([
+        rng.uniform(-300, 400, 500),
+        np.round(rng.uniform(0, 127, 500)),
+        [39.0, 51.0, 63.0, 27.0, 89.0],
+    ])
+
+    ok, direction = ins.in_range_many(midis, **kwargs)
+    expected = [ins.in_range(m, **kwargs) for m in midis]
+    assert ok.tolist() == [e[0] for e in expected]
+    assert direction.tolist() == [-1 if e[1] is None else e[1] for e in expected]
+
+    forced = ins.force_in_range_many(midis, **kwargs)
+    assert forced.tolist() == [ins.force_in_range(m, **kwargs) for m in midis]
+
+
+@pytest.mark.parametrize("sounding", [False, True])
+def test_force_in_range_many_special_rows_below_range(sounding):
+    # 63 is a missing sounding note: it is stepped up by octaves, through
+    # 75 (still below the range) to 87
+    ins = Instrument(rangeMidi=(80, 100), transposition_semitones=-12, missing_notes={75})
+    midis = [63.0, 51.0, 39.0, 70.0]
+    forced = ins.force_in_range_many(midis, sounding=sounding)
+    assert forced.tolist() == [ins.force_in_range(m, sounding=sounding) for m in midis]
+    assert ins.force_in_range(63) == 87.0
+
+
+def test_force_in_range_many_closed_form(testInstrument):
+    forced = testInstrument.force_in_range_many([0, 20, 60, 109, 130])
+    assert forced.tolist() == [24.0, 32.0, 60.0, 97.0, 106.0]
+    ok, direction = testInstrument.in_range_many([20, 60, 109, 60.5])
+    assert ok.tolist() == [False, True, False, False]
+    assert direction.tolist() == [0, -1, 1, -1]
+
+
+def test_force_in_range_scalar_and_many_agree_to_the_bit():
+    # 0.21360346728167587 + 12 + 12 + 12 differs from + 3 * 12 in the last bit
+    ins = Instrument(rangeMidi=(36, 80))
+    m = 0.21360346728167587
+    assert ins.force_in_range(m) == ins.force_in_range_many([m])[0] == m + 3 * 12.0
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_range_checks_reject_non_finite_pitches(testInstrument, value):
+    with pytest.raises(ValueError):
+        testInstrument.in_range(value)
+    with pytest.raises(ValueError):
+        testInstrument.force_in_range(value)
+    with pytest.raises(ValueError):
+        testInstrument.in_range_many([60.0, value])
+    with pytest.raises(ValueError):
+        testInstrument.force_in_range_many([60.0, value])
+
+
+# ---------------------------------------------------------------------------
+# playability table
+# ---------------------------------------------------------------------------
+
+def test_playability_matches_in_range_on_the_lattice():
+    ins = Instrument(rangeMidi=(40, 80), microTones=False,
+                     transposition_semitones=-2, missing_notes={41})
+    midis = np.arange(0, 128 * 4) / 4
+    expected = [ins.in_range(m, sounding=True)[0] for m in midis]
+    assert ins.playable_many(midis).tolist() == expected
+    assert [ins.is_playable(m) for m in midis] == expected
+    assert not ins.is_playable(39)          # written 41 is missing
+    assert ins.is_playable(38) and not ins.is_playable(79)
+
+
+def test_playability_resolution_rounds_pitches():
+    ins = Instrument(rangeMidi=(60, 72), microTones=True, pitchResolution=2)
+    assert ins.is_playable(60.5)
+    assert ins.is_playable(60.3)            # rounded to the quarter tone 60.5
+    ins = Instrument(rangeMidi=(60, 72), microTones=False, pitchResolution=2)
+    assert not ins.is_playable(60.3)
+    assert ins.is_playable(60.2)            # rounded to 60
+
+
+def test_playability_table_is_rebuilt_after_changes():
+    ins = Instrument(rangeMidi=(60, 72), microTones=False)
+    assert not ins.is_playable(60.5)
+    assert ins._playable is not None
+    ins.microTones = True
+    assert ins._playable is None
+    assert ins.is_playable(60.5)
+
+    ins.missing_notes_sounding.add(61)
+    ins.invalidate_playability()
+    assert not ins.is_playable(61)
+
+
+def test_parameter_changes_after_a_query_update_derived_fields():
+    ins = Instrument(rangeMidi=(40, 80))
+    assert not ins.is_playable(85)
+    ins.rangeMidi = (40, 90)
+    assert ins.highest_written_midi == 90 and ins.highest_sounding_midi == 90
+    assert ins.is_playable(85) and ins.playable_many([85]).tolist() == [True]
+
+    assert ins.is_playable(60)
+    ins.missing_notes_written = {60}
+    assert ins.missing_notes_sounding == {60}
+    assert not ins.is_playable(60) and not ins.in_range(60, sounding=True)[0]
+
+    ins.transposition_semitones = 5
+    assert (ins.lowest_sounding_midi, ins.highest_sounding_midi) == (45.0, 95.0)
+    assert ins.missing_notes_sounding == {65}
+    assert not ins.is_playable(44) and ins.is_playable(60) and not ins.is_playable(65)
+
+
+def test_playability_checks_range_bounds_exactly():
+    ins = Instrument(rangeMidi=(40, 80), tuningCents=-15)
+    assert ins.lowest_sounding_midi == pytest.approx(39.85)
+    assert not ins.in_range(39.75, sounding=True)[0]
+    assert not ins.is_playable(39.75)
+    assert ins.playable_many([39.75, 39.85, 79.85, 79.9]).tolist() == [False, True, True, False]
+
+
+# ---------------------------------------------------------------------------
+# variants
+# ---------------------------------------------------------------------------
+
+def test_variant_matches_constructed_instrument():
+    params = dict(rangeMidi=(40, 80), microTones=False, chordsPossible=False,
+                  transposition_semitones=-2, missing_notes={41, 53})
+    base = Instrument(name="base", **params)
+    var = base.variant(rangeMidi=(36, 84), transposition_semitones=3,
+                       missing_notes={50}, name="var")
+    ref = Instrument(name="var", **{**params, "rangeMidi": (36, 84),
+                                    "transposition_semitones": 3, "missing_notes": {50}})
+    for name in Instrument.__slots__:
+        if not name.startswith("_"):
+            assert getattr(var, name) == getattr(ref, name), name
+    midis = np.arange(0, 128 * 4) / 4
+    assert var.playable_many(midis).tolist() == ref.playable_many(midis).tolist()
+
+    # the base is untouched
+    assert base.rangeMidi == (40, 80) and base.missing_notes_written == {41, 53}
+
+    detuned = base.variant(tuningCents=-15)
+    ref = Instrument(name="base", tuningCents=-15, **params)
+    assert (detuned.lowest_sounding_midi, detuned.tuningOffset) == \
+        (ref.lowest_sounding_midi, ref.tuningOffset)
+    assert detuned.playable_many(midis - 0.15).tolist() == ref.playable_many(midis - 0.15).tolist()
+    assert ref.playable_many(midis - 0.15).any() and not ref.is_playable(53 - 2 - 0.15)
+
+
+def test_variant_is_copy_on_write():
+    base = Instrument(rangeMidi=(40, 80))
+    var = base.variant(midi_program=5)
+    assert var.initClefs == base.initClefs == ["treble"]
+    var.initClefs.append("bass")
+    assert base.initClefs == ["treble"]
+    var.rangeMidi = (30, 90)
+    assert var.lowest_sounding_midi == 30 and var.is_playable(85)
+    assert base.rangeMidi == (40, 80) and base.lowest_sounding_midi == 40
+    with pytest.raises(TypeError):
+        base.variant(colour="red")
+
+
+def test_variant_does_not_duplicate_base_data():
+    base = Instrument(rangeMidi=(40, 80), transposition_semitones=-2,
+                      missing_notes={41, 53})
+    base.is_playable(60)
+    var = base.variant(name="var", midi_program=5)
+    assert var._base is base
+    assert var._overrides == {"name": "var", "midi_program": 5}
+    for name in ("rangeMidi", "missing_notes_written", "missing_notes_sounding"):
+        assert getattr(var, name) is getattr(base, name)
+    assert var._playable_table() is base._playable_table()
+
+    # a variant of a variant keeps the same base, detuning adds only
+    # the offset and the moved sounding range
+    detuned = var.variant(tuningCents=-15)
+    assert detuned._base is base
+    assert set(detuned._overrides) == {
+        "name", "midi_program", "tuningOffset", "lowest_sounding_midi", "highest_sounding_midi"}
+    assert detuned.missing_notes_sounding is base.missing_notes_sounding
+
+
+def test_instrument_has_slots_and_extras(testInstrument):
+    assert not hasattr(testInstrument, "__dict__")
+    testInstrument.colour = "red"
+    assert testInstrument.colour == "red"
+    assert testInstrument.extras == {"colour": "red"}
+    assert testInstrument.variant(name="other").colour == "red"
+    with pytest.raises(AttributeError):
+        testInstrument.weight
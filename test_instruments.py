@@ -3,6 +3,8 @@ import pytest
 from .Instrument import Instrument
 from .Instruments import (
     STANDARD_INSTRUMENTS,
+    _PALETTE_SPECS,
+    _LazyPalette,
     get_standard_instrument,
 )
 from GreasyPidgin.Pitch import note2midi as nm
@@ -25,6 +27,76 @@ def test_get_standard_instrument_returns_same_instance():
     assert fl1.name == "flute"
 
 
+def test_palette_is_built_lazily():
+    palette = _LazyPalette(_PALETTE_SPECS)
+    assert len(palette) == len(_PALETTE_SPECS)
+    assert "viola" in palette and "kazoo" not in palette
+    assert not palette.is_loaded("viola")
+
+    vla = palette["viola"]
+    assert palette.is_loaded("viola")
+    assert not palette.is_loaded("violin")
+    assert palette["viola"] is vla
+    assert vla.rangeMidi == (nm("c3"), nm("f6"))
+
+
+def test_palette_registers_eager_instruments():
+    palette = _LazyPalette(_PALETTE_SPECS)
+    kazoo = Instrument(name="kazoo", rangeMidi=(nm("c4"), nm("c6")))
+    palette["kazoo"] = kazoo
+    assert palette["kazoo"] is kazoo and palette.is_loaded("kazoo")
+    assert "kazoo" in palette and list(palette)[-1] == "kazoo"
+    assert len(palette) == len(_PALETTE_SPECS) + 1
+
+    # a spec key is replaced without touching the spec table
+    palette["flute"] = kazoo
+    assert palette["flute"] is kazoo
+    assert len(palette) == len(_PALETTE_SPECS) + 1
+    assert _PALETTE_SPECS["flute"]["name"] == "flute"
+
+    with pytest.raises(TypeError):
+        palette["oboe"] = "oboe"
+
+
+def test_palette_instruments_hold_immutable_data():
+    fl = _LazyPalette(_PALETTE_SPECS)["flute"]
+    fl.possibleClefs.append("bass")
+    assert _PALETTE_SPECS["flute"]["possibleClefs"] == ("treble",)
+    assert _LazyPalette(_PALETTE_SPECS)["flute"].possibleClefs == ["treble"]
+    assert isinstance(fl.missing_notes_written, frozenset)
+    assert isinstance(fl.missing_notes_sounding, frozenset)
+
+
+def test_variants_share_palette_data():
+    cl = get_standard_instrument("b-flat-clarinet")
+    cl.is_playable(60)
+    renamed = cl.variant(name="clarinet 2", midi_program=1)
+    assert renamed.name == "clarinet 2" and cl.name == "B-flat clarinet"
+    assert renamed.possibleClefs == cl.possibleClefs
+    assert renamed.missing_notes_sounding is cl.missing_notes_sounding
+    assert renamed._playable_table() is cl._playable_table()
+
+    detuned = cl.variant(tuningCents=-50)
+    assert detuned.missing_notes_written is cl.missing_notes_written
+    assert detuned.missing_notes_sounding is cl.missing_notes_sounding
+    assert detuned.transposition_semitones == -2 and detuned.tuningOffset == -0.5
+    assert detuned.lowest_sounding_midi == cl.lowest_sounding_midi - 0.5
+    assert detuned._playable_table() is not cl._playable_table()
+
+
+def test_detuned_variant_keeps_missing_notes():
+    cl = get_standard_instrument("b-flat-clarinet")
+    for cents in (0, -15):
+        var = cl.variant(missing_notes={53}, tuningCents=cents)
+        missing = 51 + cents / 100          # written 53 sounds a tone lower, detuned
+        assert var.in_range(missing, sounding=True) == (False, None)
+        assert not var.is_playable(missing)
+        assert not var.playable_many([missing])[0]
+        assert var.is_playable(missing + 1) and var.in_range(missing + 1, sounding=True)[0]
+        assert var.force_in_range_many([missing], sounding=True)[0] == \
+            var.force_in_range(missing, sounding=True) == missing + 12
+
+
 def test_get_standard_instrument_unknown_raises():
     with pytest.raises(KeyError):
         get_standard_instrument("this-does-not-exist")
@@ -1,5 +1,7 @@
 import pytest
-from .Pitch import note2midi
+from fractions import Fraction
+import numpy as np
+from .Pitch import note2midi, notes2midi, midi2note, midis2notes, _NOTE_TABLE
 
 
 # -------------------------------
@@ -77,4 +79,70 @@ def test_invalid_format():
 # -------------------------------
 def test_spacing_and_case():
     assert note2midi("  C4  ") == 60.0
-    assert note2midi("bf3") == note2midi("BF3")
\ No newline at end of file
+    assert note2midi("bf3") == note2midi("BF3")
+
+
+# -------------------------------
+# Exact (Fraction) results
+# -------------------------------
+def test_exact_results():
+    assert note2midi("css4", exact=True) == Fraction(181, 3)
+    assert note2midi("ctf4", exact=True) == Fraction(359, 6)
+    assert note2midi("bf3", exact=True) == 58
+    assert float(note2midi("cqs4", exact=True)) == note2midi("cqs4")
+
+
+# -------------------------------
+# Lookup table and bulk parsing
+# -------------------------------
+def test_note_table_matches_parser():
+    assert len(_NOTE_TABLE) == 7 * 9 * 11
+    assert _NOTE_TABLE["bf3"] == 58.0
+    assert _NOTE_TABLE["css9"] == 12.0 * 10 + 1 / 3
+    # outside the table the regex parser takes over
+    assert note2midi("c-2") == -12.0
+    assert note2midi("g10") == 139.0
+
+
+def test_notes2midi():
+    result = notes2midi(["c4", " BF3 ", 61, "cqs4"])
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float64
+    assert result.tolist() == [60.0, 58.0, 61.0, 60.5]
+    assert notes2midi(["css4", "c4"], exact=True) == [Fraction(181, 3), 60]
+    assert notes2midi([]).shape == (0,)
+    with pytest.raises(ValueError):
+        notes2midi(["c4", "h4"])
+
+
+# -------------------------------
+# Reverse conversion
+# -------------------------------
+def test_midi2note_basic_and_microtones():
+    assert midi2note(60) == "c4"
+    assert midi2note(0) == "c-1"
+    assert midi2note(61) == "cs4"
+    assert midi2note(60.5) == "cqs4"
+    assert midi2note(60 + 1 / 3) == "css4"
+    assert midi2note(60 + 1 / 6) == "cts4"
+    assert midi2note(62 - 1 / 3) == "dsf4"
+    assert midi2note(72 - 1 / 6) == "ctf5"       # spelled in the octave above
+    assert midi2note(60.04) == "c4"              # rounded to 1/6 semitone
+
+
+def test_midi2note_nearest_spelling_fallback():
+    # c + 2/3 has no single-accidental spelling → nearest is c + 1/2
+    assert midi2note(60 + 2 / 3) == "cqs4"
+    assert midi2note(60 + 4 / 3) == "dqf4"
+
+
+def test_midis2notes_roundtrip():
+    midis = np.arange(0, 128 * 6) / 6
+    names = midis2notes(midis)
+    assert names.shape == midis.shape
+    assert names.tolist() == [midi2note(m) for m in midis]
+    errors = np.abs(notes2midi(names.tolist()) - midis)
+    assert errors.max() <= 1 / 6 + 1e-9
+    # every pitch with a spelling round-trips exactly
+    spelled = [note2midi(n) for n in _NOTE_TABLE]
+    assert notes2midi(midis2notes(spelled).tolist()) == pytest.approx(spelled)